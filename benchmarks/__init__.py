@@ -0,0 +1 @@
+"""앱 핵심 경로의 성능을 측정하는 벤치마크 모음(`python -m benchmarks.<모듈>`로 실행)."""
@@ -0,0 +1,58 @@
+"""음성 전사 업로드: 원본 WAV 그대로 vs 전처리(모노/16kHz/무음 제거/압축) 후 업로드 비교.
+
+로컬 대체 서버가 업로드 대역폭을 흉내 내므로(본문 크기만큼 대기) 느린 Wi-Fi에서의 전체 지연 차이를 볼 수 있다.
+실행: python -m benchmarks.audio_upload [녹음 길이(초)] [--mbps 2,5,20] [--latency-ms 100] [--repeat 3]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import config
+from benchmarks import stand_ins
+from benchmarks.synthetic import make_voice_wav
+from utils import audio_prep, openai_helper
+
+def _median_sec(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("seconds", nargs="?", type=float, default=20.0)
+    parser.add_argument("--mbps", default="2,5,20", help="업로드 대역폭(Mbps, 쉼표 구분)")
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # 느린 대역폭에서 원본 업로드가 기본 타임아웃을 넘지 않도록 늘리고, 재시도는 하지 않는다
+    config.OPENAI_TIMEOUT_SEC, config.OPENAI_MAX_RETRIES = 300, 0
+    raw = make_voice_wav(args.seconds)
+    prepared, filename, report = audio_prep.prepare_audio(raw)
+    prep_sec = _median_sec(lambda: audio_prep.prepare_audio(raw), args.repeat)
+    print(f"recording {args.seconds:.0f}s 48kHz stereo: {len(raw) / 1024:,.0f} KB")
+    print(
+        f"prepared ({filename}): {len(prepared) / 1024:,.0f} KB (-{(1 - len(prepared) / len(raw)) * 100:.0f}%), "
+        f"{report['original_sec']:.1f}s -> {report['upload_sec']:.1f}s, prep {prep_sec * 1000:.1f} ms"
+    )
+
+    print(f"{'upload':>8} {'raw wav':>10} {'prepared':>10} {'saved':>10}")
+    for mbps in [float(m) for m in args.mbps.split(",") if m]:
+        base_url, shutdown = stand_ins.start_server(args.latency_ms / 1000, upload_bps=mbps * 1_000_000)
+        os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+        openai_helper.close_clients()
+        try:
+            raw_sec = _median_sec(lambda: openai_helper.transcribe_audio(raw, "bench-key", "whisper-1"), args.repeat)
+            prepared_sec = _median_sec(lambda: openai_helper.transcribe_recording(raw, "bench-key", "whisper-1"), args.repeat)
+        finally:
+            shutdown()
+            openai_helper.close_clients()
+        print(f"{mbps:>5.0f} Mb {raw_sec * 1000:8.0f} ms {prepared_sec * 1000:8.0f} ms {(raw_sec - prepared_sec) * 1000:8.0f} ms")
+
+if __name__ == "__main__":
+    main()
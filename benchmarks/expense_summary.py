@@ -0,0 +1,48 @@
+"""지출 집계: 처음부터 다시 계산 vs 바뀐 행만 반영하는 증분 갱신 비교.
+
+실행: python -m benchmarks.expense_summary [행 수]
+"""
+
+import sys
+import time
+
+from benchmarks.synthetic import make_expenses
+from utils import expense_analytics
+
+def _reset() -> None:
+    """증분 상태를 비워 다음 호출이 처음부터 계산하도록 한다."""
+    expense_analytics._state.update(source=None, typed=None, groups=None, invalid=0)
+
+def _timed(func, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+def main(rows: int = 50_000) -> None:
+    df = make_expenses(rows)
+    edited = df.copy()
+    edited.iloc[rows // 2, edited.columns.get_loc("금액")] = "12,345"
+    edited.iloc[rows // 3, edited.columns.get_loc("결제자")] = "서연"
+
+    _reset()
+    full_sec, _ = _timed(expense_analytics.summarize, df)
+    same_sec, _ = _timed(expense_analytics.summarize, df)
+    incremental_sec, incremental = _timed(expense_analytics.summarize, edited)
+
+    # 증분 결과가 처음부터 계산한 결과와 같은지 확인
+    _reset()
+    expected = expense_analytics.summarize(edited)
+    for key in ["daily", "category", "payer"]:
+        diff = (incremental[key]["합계"] - expected[key]["합계"].reindex(incremental[key].index)).abs().max()
+        if diff > 1e-6 or not incremental[key]["건수"].equals(expected[key]["건수"].reindex(incremental[key].index)):
+            raise SystemExit(f"결과 불일치: {key}")
+
+    plan_sec, (_, transfers) = _timed(expense_analytics.settlement_plan, expected["payer"]["합계"])
+    print(f"rows={rows:,}")
+    print(f"full summarize        : {full_sec * 1000:9.1f} ms")
+    print(f"unchanged (cached)    : {same_sec * 1000:9.1f} ms")
+    print(f"2 rows edited (delta) : {incremental_sec * 1000:9.1f} ms")
+    print(f"settlement plan       : {plan_sec * 1000:9.1f} ms  ({len(transfers)} transfers)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,74 @@
+"""사진 번역 경로 비교: 1회 호출(combined) vs OCR 후 번역(two_step)의 지연 시간/토큰 사용량.
+
+실제 OpenAI API를 호출하므로 OPENAI_API_KEY가 필요하다(캐시는 사용하지 않음).
+실행: python -m benchmarks.photo_translate 이미지1.jpg [이미지2.png ...] [--repeat N]
+"""
+
+import argparse
+import mimetypes
+import statistics
+import time
+from pathlib import Path
+
+import config
+from utils import openai_helper
+
+def _track_usage(client) -> list:
+    """클라이언트의 채팅 완성 호출마다 토큰 사용량을 기록하도록 감싼다."""
+    usages = []
+    create = client.chat.completions.create
+
+    def create_with_usage(**kwargs):
+        response = create(**kwargs)
+        usages.append(response.usage)
+        return response
+
+    client.chat.completions.create = create_with_usage
+    return usages
+
+def run_path(mode: str, images: list[tuple[bytes, str]], repeat: int, usages: list) -> dict:
+    """한 경로를 이미지별로 repeat번 실행해 지연 시간/호출 수/토큰 합계를 집계한다."""
+    latencies = []
+    usages.clear()
+    for _ in range(repeat):
+        for image_bytes, mime_type in images:
+            started = time.perf_counter()
+            openai_helper.extract_and_translate_image(
+                image_bytes, mime_type, config.OPENAI_API_KEY,
+                config.OPENAI_OCR_MODEL, config.OPENAI_TRANSLATE_MODEL,
+                mode=mode, use_cache=False,
+            )
+            latencies.append(time.perf_counter() - started)
+    runs = len(latencies)
+    return {
+        "mode": mode,
+        "runs": runs,
+        "latency_p50_sec": statistics.median(latencies),
+        "latency_max_sec": max(latencies),
+        "calls_per_image": len(usages) / runs,
+        "prompt_tokens_per_image": sum(u.prompt_tokens for u in usages if u) / runs,
+        "completion_tokens_per_image": sum(u.completion_tokens for u in usages if u) / runs,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", type=Path)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not config.OPENAI_API_KEY:
+        raise SystemExit("OPENAI_API_KEY가 설정되지 않아 벤치마크를 실행할 수 없습니다.")
+
+    images = [(p.read_bytes(), mimetypes.guess_type(p.name)[0] or "image/jpeg") for p in args.images]
+    usages = _track_usage(openai_helper.get_client(config.OPENAI_API_KEY))
+    for mode in ("two_step", "combined"):
+        result = run_path(mode, images, args.repeat, usages)
+        print(
+            f"{result['mode']:>9}: p50 {result['latency_p50_sec'] * 1000:7.0f} ms | "
+            f"max {result['latency_max_sec'] * 1000:7.0f} ms | "
+            f"calls/img {result['calls_per_image']:.1f} | "
+            f"tokens/img in {result['prompt_tokens_per_image']:.0f} out {result['completion_tokens_per_image']:.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
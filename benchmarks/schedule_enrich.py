@@ -0,0 +1,59 @@
+"""일정 파생 컬럼 계산: 행 단위 apply vs enrich_schedule 비교.
+
+실제 일정 크기(수십 행)에서는 행 단위 경로, 큰 일정에서는 벡터 경로가 쓰이므로 두 크기를 함께 잰다.
+실행: python -m benchmarks.schedule_enrich [행 수(쉼표 구분), 기본 24,1000,100000]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+import config
+from benchmarks.synthetic import make_schedule
+from utils import data_manager
+
+def legacy_enrich(view: pd.DataFrame) -> pd.DataFrame:
+    """기존 render_schedule의 행 단위 apply 파생 컬럼 계산을 그대로 재현한다."""
+    view = view.copy()
+    view["_date"] = view["날짜"].apply(data_manager.parse_date)
+    view["_time"] = view["시간"].apply(data_manager.parse_time)
+    view["시간대"] = view["_time"].apply(data_manager.time_bucket)
+
+    def make_link(row):
+        query = data_manager.choose_map_query(row.get("내용", ""), row.get("장소", ""), row.get("지도검색어", ""))
+        return data_manager.make_maps_search_link(query) if query else ""
+
+    view["지도"] = view.apply(make_link, axis=1)
+    return view
+
+def best_of(func, *args, repeat: int = 3) -> float:
+    """여러 번 실행한 중 가장 빠른 소요 시간(초)을 반환한다."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def main(sizes: list[int]) -> None:
+    print(f"{'rows':>8} {'legacy apply':>14} {'enrich_schedule':>16}  path (ENRICH_VECTOR_MIN_ROWS={config.ENRICH_VECTOR_MIN_ROWS})")
+    for rows in sizes:
+        df = make_schedule(rows)
+
+        # 두 경로의 결과가 완전히 같은지 먼저 확인
+        expected = legacy_enrich(df)
+        actual = data_manager.enrich_schedule(df)
+        for col in ["_date", "_time", "시간대", "지도"]:
+            if expected[col].tolist() != actual[col].tolist():
+                raise SystemExit(f"결과 불일치: {col} (rows={rows})")
+
+        # 작은 표는 측정 잡음이 커서 더 여러 번 돌린다
+        repeat = 3 if rows >= 10_000 else 30
+        legacy_sec = best_of(legacy_enrich, df, repeat=repeat)
+        enrich_sec = best_of(data_manager.enrich_schedule, df, repeat=repeat)
+        path = "rows" if rows < config.ENRICH_VECTOR_MIN_ROWS else "vector"
+        print(f"{rows:>8,} {legacy_sec * 1000:11.1f} ms {enrich_sec * 1000:13.1f} ms  {path} (x{legacy_sec / enrich_sec:.1f})")
+
+if __name__ == "__main__":
+    main([int(n) for n in (sys.argv[1] if len(sys.argv) > 1 else "24,1000,100000").split(",") if n])
@@ -0,0 +1,137 @@
+"""벤치마크용 로컬 대체 서버: OpenAI/Open-Meteo/Frankfurter API를 흉내 내고 지연 시간을 주입한다.
+
+실제 클라이언트 코드(OpenAI SDK, requests 세션)를 그대로 쓰면서 네트워크만 로컬로 바꾸므로,
+측정값에서 주입한 지연 시간을 빼면 앱 쪽 처리 비용(직렬화, 연결 재사용, 캐시 등)만 남는다.
+"""
+
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+# 스트리밍 번역 응답을 나눠 보내는 조각 수
+STREAM_CHUNKS = 8
+
+# 대체 응답 내용
+TRANSLATION = "안녕하세요. 후쿠오카 공항에서 하카타역까지 지하철로 가는 방법을 알려주세요."
+TRANSCRIPT = "하카타역까지 어떻게 가나요?"
+SPEECH_BYTES = b"ID3" + bytes(16_000)
+
+def _forecast() -> dict:
+    """Open-Meteo 일별 예보 응답과 같은 형태의 7일치 예보."""
+    days = [(date.today() + timedelta(days=i)).isoformat() for i in range(7)]
+    return {
+        "daily": {
+            "time": days,
+            "weather_code": [0, 1, 3, 61, 80, 2, 0],
+            "temperature_2m_max": [18.2, 19.0, 17.5, 15.1, 16.4, 18.8, 20.3],
+            "temperature_2m_min": [9.1, 10.2, 11.0, 10.5, 9.8, 10.1, 11.7],
+            "precipitation_probability_max": [0, 10, 20, 80, 60, 10, 0],
+        }
+    }
+
+def _rate_history(span: str) -> dict:
+    """Frankfurter 기간 환율 응답과 같은 형태(영업일별 1원당 엔화)."""
+    start, end = (date.fromisoformat(part) for part in span.split(".."))
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    rates = {day.isoformat(): {"JPY": round(0.108 + day.day * 0.0001, 5)} for day in days if day.weekday() < 5}
+    return {"base": "KRW", "start_date": start.isoformat(), "end_date": end.isoformat(), "rates": rates}
+
+def _handler(latency_sec: float, upload_bps: float) -> type:
+    """요청마다 latency_sec만큼 기다린 뒤 응답하는 요청 처리 클래스를 만든다.
+
+    upload_bps가 있으면 요청 본문 크기만큼 업로드 시간(느린 호텔 Wi-Fi 등)을 추가로 기다린다.
+    """
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        # keep-alive 연결 재사용을 측정할 수 있도록 HTTP/1.1로 응답
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 보낼 때 Nagle/지연 ACK로 생기는 약 40ms 대기를 없앤다
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, payload: dict) -> None:
+            self._send(200, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json")
+
+        def _stream_chat(self, model: str) -> None:
+            """첫 조각까지 주입한 지연 시간, 이후 조각 사이에는 짧은 간격을 두는 SSE 스트림."""
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            step = max(1, len(TRANSLATION) // STREAM_CHUNKS)
+            pieces = [TRANSLATION[i : i + step] for i in range(0, len(TRANSLATION), step)]
+            for i, piece in enumerate(pieces):
+                if i:
+                    time.sleep(latency_sec / STREAM_CHUNKS)
+                chunk = {
+                    "id": "bench", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                self._write_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+        def do_GET(self):
+            time.sleep(latency_sec)
+            if self.path.startswith("/v1/forecast"):
+                self._send_json(_forecast())
+            elif self.path.startswith("/latest"):
+                self._send_json({"base": "KRW", "date": date.today().isoformat(), "rates": {"JPY": 0.108}})
+            elif ".." in self.path:
+                self._send_json(_rate_history(self.path.split("?")[0].strip("/")))
+            else:
+                self._send(404, b"{}", "application/json")
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(latency_sec + (len(body) * 8 / upload_bps if upload_bps else 0))
+            if self.path.endswith("/chat/completions"):
+                request = json.loads(body or b"{}")
+                model = request.get("model", "")
+                if request.get("stream"):
+                    self._stream_chat(model)
+                    return
+                json_mode = (request.get("response_format") or {}).get("type") == "json_object"
+                content = json.dumps({"original": TRANSCRIPT, "translation": TRANSLATION}, ensure_ascii=False) if json_mode else TRANSLATION
+                self._send_json({
+                    "id": "bench", "object": "chat.completion", "created": int(time.time()), "model": model,
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": len(body) // 4, "completion_tokens": len(content), "total_tokens": len(body) // 4 + len(content)},
+                })
+            elif self.path.endswith("/audio/transcriptions"):
+                self._send_json({"text": TRANSCRIPT})
+            elif self.path.endswith("/audio/speech"):
+                self._send(200, SPEECH_BYTES, "audio/mpeg")
+            else:
+                self._send(404, b"{}", "application/json")
+
+    return StandInHandler
+
+def start_server(latency_sec: float, upload_bps: float = 0) -> tuple[str, Callable[[], None]]:
+    """대체 서버를 백그라운드 스레드에서 띄우고 (기본 URL, 종료 함수)를 반환한다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(latency_sec, upload_bps))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="bench-stand-in", daemon=True)
+    thread.start()
+
+    def shutdown():
+        server.shutdown()
+        server.server_close()
+
+    return f"http://127.0.0.1:{server.server_address[1]}", shutdown
@@ -0,0 +1,72 @@
+"""앱 시작 비용 측정: 뷰별 import 시간과 첫 화면 렌더링(first paint) 시간.
+
+각 측정은 새 파이썬 프로세스에서 실행해 import 캐시가 없는 콜드 스타트 기준으로 잰다.
+- eager: 예전 main.py처럼 모든 뷰를 한 번에 import하는 비용
+- lazy: main.py + 선택한 뷰 하나만 import하는 비용(현재 방식)
+- first paint: AppTest로 해당 뷰 render()를 처음 실행하는 데 걸린 시간(import 포함)
+
+실행: python -m benchmarks.startup [반복 횟수]
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+VIEW_MODULES = ["schedule", "map", "translate", "weather", "expenses", "gallery"]
+
+# 새 프로세스에서 실행할 측정 코드. 결과는 마지막 줄에 JSON으로 출력한다.
+_IMPORT_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - started
+heavy = [m for m in ("openai", "PIL", "requests", "streamlit_mic_recorder") if m in sys.modules]
+print(json.dumps({{"sec": elapsed, "heavy": heavy}}))
+"""
+
+_PAINT_SNIPPET = """
+import json, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_string(
+    "import sys; sys.path.insert(0, {root!r})\\nfrom views import {view}\\n{view}.render()",
+    default_timeout=120,
+)
+started = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - started
+print(json.dumps({{"sec": elapsed, "error": bool(at.exception)}}))
+"""
+
+def _run(code: str) -> dict:
+    """코드를 새 파이썬 프로세스에서 실행하고 마지막 줄의 JSON 결과를 반환한다."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def measure_import(modules: list[str], repeat: int) -> dict:
+    """주어진 모듈을 import하는 콜드 스타트 시간(최솟값)과 로드된 무거운 의존성을 잰다."""
+    code = _IMPORT_SNIPPET.format(imports="\n".join(f"import {m}" for m in modules))
+    results = [_run(code) for _ in range(repeat)]
+    return {"sec": min(r["sec"] for r in results), "heavy": results[0]["heavy"]}
+
+def measure_first_paint(view: str, repeat: int) -> dict:
+    """뷰를 새 프로세스에서 처음 렌더링하는 시간(최솟값)을 잰다."""
+    results = [_run(_PAINT_SNIPPET.format(root=str(ROOT), view=view)) for _ in range(repeat)]
+    return {"sec": min(r["sec"] for r in results), "error": any(r["error"] for r in results)}
+
+def main(repeat: int = 3) -> None:
+    eager = measure_import(["main"] + [f"views.{v}" for v in VIEW_MODULES], repeat)
+    print(f"eager (main + all views) : {eager['sec'] * 1000:8.1f} ms  loads {eager['heavy']}")
+    print(f"{'view':<10} {'lazy import':>12} {'first paint':>12}  heavy deps")
+    for view in VIEW_MODULES:
+        lazy = measure_import(["main", f"views.{view}"], repeat)
+        paint = measure_first_paint(view, repeat)
+        flag = "  (render error)" if paint["error"] else ""
+        print(f"{view:<10} {lazy['sec'] * 1000:9.1f} ms {paint['sec'] * 1000:9.1f} ms  {lazy['heavy']}{flag}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,315 @@
+"""벤치마크 모음: 데이터 처리, 화면 렌더링, 외부 API 호출 경로의 지연 시간을 재고 JSON으로 저장한다.
+
+- data : load_schedule/load_expenses/load_candidates(콜드·캐시), choose_map_query, parse_date/parse_time,
+         enrich_schedule, 지출 집계/환산을 합성 데이터 크기별로 측정
+- views: 각 뷰의 render()를 AppTest로 실행해 첫 렌더링과 재실행(rerun) 시간을 측정
+- api  : openai_helper/weather/exchange_rates를 로컬 대체 서버(지연 시간 주입)에 연결해 측정
+
+실제 data/ 폴더는 건드리지 않도록 모든 데이터/캐시 경로를 임시 폴더로 옮겨서 실행한다.
+결과는 커밋별로 benchmarks/results/<커밋>.json에 저장되며, --compare로 이전 결과와 비교할 수 있다.
+
+실행: python -m benchmarks.suite [--sizes 100,1000,10000] [--view-sizes 100,1000] [--latency-ms 50]
+                                 [--repeat 5] [--only data,views,api] [--output 경로] [--compare 이전결과.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import streamlit
+from streamlit import logger as streamlit_logger
+from streamlit.testing.v1 import AppTest
+
+import config
+from benchmarks import stand_ins
+from benchmarks.synthetic import (
+    make_candidates, make_expenses, make_photo_bytes, make_photos, make_schedule, make_voice_wav,
+)
+from utils import (
+    data_manager, exchange_rates, expense_analytics, geocode, openai_helper, photo_index, swr_cache, translation_cache,
+    weather,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+VIEW_MODULES = ["schedule", "map", "translate", "weather", "expenses", "gallery"]
+
+# 비교 시 이 비율 이상 느려지면 표시
+_REGRESSION_RATIO = 1.2
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def _isolate_data_dirs(base: Path) -> None:
+    """config의 data/ 아래 경로를 모두 임시 폴더 아래로 옮긴다(실제 데이터 보호)."""
+    data_dir = config.DATA_DIR
+    for name, value in list(vars(config).items()):
+        if name.isupper() and isinstance(value, Path) and value.is_relative_to(data_dir):
+            setattr(config, name, base / value.relative_to(data_dir))
+    for directory in (config.DATA_DIR, config.PHOTOS_DIR, config.CACHE_DIR, config.THUMBNAIL_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+    # 벤치마크는 항상 CSV 백엔드 기준으로 측정
+    config.STORAGE_BACKEND = "csv"
+    translation_cache._schema_ready = False
+
+def _stats(timings: list[float]) -> dict:
+    """초 단위 측정값을 ms 단위 통계로 요약한다."""
+    ms = sorted(t * 1000 for t in timings)
+    return {
+        "runs": len(ms),
+        "min_ms": round(ms[0], 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+        "max_ms": round(ms[-1], 3),
+    }
+
+def measure(func, repeat: int, setup=None) -> dict:
+    """setup(있으면) 후 func를 실행하는 것을 repeat번 반복해 func 소요 시간만 잰다."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return _stats(timings)
+
+def _write_tables(size: int) -> None:
+    """합성 일정/지출/후보를 size행씩 CSV로 저장하고 데이터 캐시를 비운다."""
+    for path in (config.SCHEDULE_PATH, config.EXPENSES_PATH, config.CANDIDATES_PATH):
+        for stale in path.parent.glob(f"{path.stem}*"):
+            stale.unlink()
+    make_schedule(size).to_csv(config.SCHEDULE_PATH, index=False)
+    make_expenses(size).to_csv(config.EXPENSES_PATH, index=False)
+    make_candidates(size).to_csv(config.CANDIDATES_PATH, index=False)
+    data_manager.invalidate_cache()
+
+def _reset_schedule_index() -> None:
+    data_manager._schedule_index = None
+
+def _reset_expense_state() -> None:
+    expense_analytics._state.update(source=None, typed=None, groups=None, invalid=0)
+
+def bench_data(sizes: list[int], repeat: int) -> list[dict]:
+    """데이터 처리 함수들을 합성 데이터 크기별로 측정한다."""
+    rate_table = {"2026-03-03": {"JPY": 9.2}, "2026-03-06": {"JPY": 9.3}}
+    results = []
+    for size in sizes:
+        _write_tables(size)
+        schedule = data_manager.load_schedule()
+        expenses = data_manager.load_expenses()
+        cases = {
+            "load_schedule.cold": (data_manager.load_schedule, data_manager.invalidate_cache),
+            "load_schedule.cached": (data_manager.load_schedule, None),
+            "load_expenses.cold": (data_manager.load_expenses, data_manager.invalidate_cache),
+            "load_candidates.cold": (data_manager.load_candidates, data_manager.invalidate_cache),
+            # 행 단위 호출 비용(이전 apply 경로와 같은 조건)
+            "choose_map_query.rows": (
+                lambda: [data_manager.choose_map_query(c, p, o) for c, p, o in zip(schedule["내용"], schedule["장소"], schedule["지도검색어"])],
+                None,
+            ),
+            "parse_date.rows": (lambda: [data_manager.parse_date(v) for v in schedule["날짜"]], None),
+            "parse_time.rows": (lambda: [data_manager.parse_time(v) for v in schedule["시간"]], None),
+            "map_queries": (lambda: data_manager.map_queries(schedule), None),
+            "enrich_schedule": (lambda: data_manager.enrich_schedule(schedule), None),
+            "query_schedule.cold": (lambda: data_manager.query_schedule([], "캐널"), _reset_schedule_index),
+            "query_schedule.indexed": (lambda: data_manager.query_schedule([], "캐널"), None),
+            "expense_summarize.full": (lambda: expense_analytics.summarize(expenses), _reset_expense_state),
+            "convert_ledger": (lambda: exchange_rates.convert_ledger(expenses, rate_table), None),
+        }
+        for name, (func, setup) in cases.items():
+            results.append({"group": "data", "name": name, "size": size, **measure(func, repeat, setup)})
+    return results
+
+def _run_view(view: str, repeat: int) -> dict:
+    """뷰 하나를 AppTest로 처음 실행한 시간과, 같은 세션에서 다시 실행(rerun)한 시간을 잰다."""
+    at = AppTest.from_string(f"from views import {view}\n{view}.render()", default_timeout=300)
+    started = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - started
+    reruns = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        at.run()
+        reruns.append(time.perf_counter() - started)
+    return {"first_ms": round(first * 1000, 3), **_stats(reruns), "error": bool(at.exception)}
+
+def bench_views(sizes: list[int], repeat: int) -> list[dict]:
+    """각 뷰의 render()를 합성 데이터 크기별로 AppTest로 측정한다(사진은 같은 수만큼 생성)."""
+    results = []
+    for size in sizes:
+        _write_tables(size)
+        shutil.rmtree(config.PHOTOS_DIR, ignore_errors=True)
+        shutil.rmtree(config.THUMBNAIL_DIR, ignore_errors=True)
+        config.THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
+        config.PHOTO_INDEX_PATH.unlink(missing_ok=True)
+        make_photos(config.PHOTOS_DIR, size)
+        for view in VIEW_MODULES:
+            results.append({"group": "views", "name": f"{view}.render", "size": size, **_run_view(view, repeat)})
+    return results
+
+def _point_apis_at(base_url: str, latency_sec: float) -> None:
+    """외부 API 호출이 로컬 대체 서버(또는 지연 시간을 주입한 대체 함수)로 가도록 바꾼다."""
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    openai_helper.close_clients()
+    weather.FORECAST_URL = f"{base_url}/v1/forecast"
+    exchange_rates.RATES_URL = base_url
+
+    def geocode_stand_in(query: str):
+        time.sleep(latency_sec)
+        return (33.59, 130.40)
+
+    geocode.set_resolver(geocode_stand_in)
+
+def _reset_weather() -> None:
+    swr_cache.reset(weather._cache)
+
+def _reset_rates() -> None:
+    swr_cache.reset(exchange_rates._cache)
+
+def bench_api(repeat: int, latency_sec: float) -> list[dict]:
+    """API 호출 경로를 로컬 대체 서버로 측정한다. overhead_ms는 중앙값에서 주입한 네트워크 지연을 뺀 값."""
+    api_key, model = config.OPENAI_API_KEY, config.OPENAI_TRANSLATE_MODEL
+    text = "博多駅までどうやって行けばいいですか？"
+    image = make_photo_bytes()
+    audio = b"RIFF" + bytes(64_000)
+    recording = make_voice_wav(10)
+    long_recording = make_voice_wav(90)
+    state = {"ttft": []}
+
+    def stream_once():
+        started = time.perf_counter()
+        first = None
+        for _ in openai_helper.stream_translate_text(text, "Japanese", "Korean", api_key, model, use_cache=False):
+            if first is None:
+                first = time.perf_counter() - started
+        state["ttft"].append(first)
+
+    # (함수, 준비 함수, 요청 1회당 예상 네트워크 왕복 수)
+    cases = {
+        "translate_text": (lambda: openai_helper.translate_text(text, "Japanese", "Korean", api_key, model, use_cache=False), None, 1),
+        "translate_text.cached": (lambda: openai_helper.translate_text(text, "Japanese", "Korean", api_key, model), None, 0),
+        "stream_translate_text": (stream_once, None, 2),
+        "transcribe_audio": (lambda: openai_helper.transcribe_audio(audio, api_key, config.OPENAI_STT_MODEL), None, 1),
+        "transcribe_recording": (lambda: openai_helper.transcribe_recording(recording, api_key, config.OPENAI_STT_MODEL), None, 1),
+        # 긴 녹음은 조각으로 나눠 동시에 전사(왕복 1회 시간 안에 끝나야 함)
+        "transcribe_recording.long": (lambda: openai_helper.transcribe_recording(long_recording, api_key, config.OPENAI_STT_MODEL), None, 1),
+        "text_to_speech": (lambda: openai_helper.text_to_speech(text, api_key, config.OPENAI_TTS_MODEL, config.OPENAI_TTS_VOICE, use_cache=False), None, 1),
+        "image.combined": (lambda: openai_helper.extract_and_translate_image(image, "image/jpeg", api_key, config.OPENAI_OCR_MODEL, model, mode="combined", use_cache=False), None, 1),
+        "image.two_step": (lambda: openai_helper.extract_and_translate_image(image, "image/jpeg", api_key, config.OPENAI_OCR_MODEL, model, mode="two_step", use_cache=False), None, 2),
+        "weather.cold": (weather.get_weather_forecast, _reset_weather, 1),
+        "weather.cached": (weather.get_weather_forecast, None, 0),
+        "exchange_rates.cold": (exchange_rates.rate_table, _reset_rates, 1),
+        "exchange_rates.cached": (exchange_rates.rate_table, None, 0),
+    }
+    # 캐시 적중 측정을 위해 한 번 미리 채워 둔다
+    openai_helper.translate_text(text, "Japanese", "Korean", api_key, model)
+
+    results = []
+    for name, (func, setup, round_trips) in cases.items():
+        stats = measure(func, repeat, setup)
+        # 스트리밍은 첫 조각 + 나머지 조각 간격의 합이 주입 지연의 약 2배
+        network_ms = round_trips * latency_sec * 1000
+        entry = {"group": "api", "name": name, "size": None, **stats, "overhead_ms": round(stats["median_ms"] - network_ms, 3)}
+        if name == "stream_translate_text":
+            entry["ttft_median_ms"] = round(statistics.median(state["ttft"]) * 1000, 3)
+        results.append(entry)
+    return results
+
+def compare(current: dict, baseline: dict) -> None:
+    """같은 (그룹, 이름, 크기) 항목의 중앙값을 이전 결과와 비교해 출력한다."""
+    base = {(r["group"], r["name"], r["size"]): r for r in baseline["results"]}
+    print(f"\ncompare with {baseline['meta'].get('commit') or '?'} (median)")
+    for r in current["results"]:
+        old = base.get((r["group"], r["name"], r["size"]))
+        if not old or not old["median_ms"]:
+            continue
+        ratio = r["median_ms"] / old["median_ms"]
+        flag = "  <-- slower" if ratio >= _REGRESSION_RATIO else ""
+        print(f"{r['group']:<5} {r['name']:<26} {str(r['size'] or ''):>7} {old['median_ms']:10.1f} -> {r['median_ms']:10.1f} ms  x{ratio:.2f}{flag}")
+
+def _print(results: list[dict]) -> None:
+    for r in results:
+        extra = ""
+        if "first_ms" in r:
+            extra = f"  first {r['first_ms']:9.1f} ms" + ("  (render error)" if r["error"] else "")
+        elif "overhead_ms" in r:
+            extra = f"  overhead {r['overhead_ms']:7.1f} ms"
+        print(f"{r['group']:<5} {r['name']:<26} {str(r['size'] or ''):>7} median {r['median_ms']:10.2f} ms  p95 {r['p95_ms']:10.2f} ms{extra}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="데이터 벤치마크 행 수(쉼표 구분)")
+    parser.add_argument("--view-sizes", default="100,1000", help="뷰 렌더링 벤치마크 행/사진 수(쉼표 구분)")
+    parser.add_argument("--latency-ms", type=float, default=50, help="대체 서버가 요청마다 주입할 지연 시간")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="data,views,api", help="실행할 그룹(쉼표 구분)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로(기본값: benchmarks/results/<커밋>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    groups = {g.strip() for g in args.only.split(",") if g.strip()}
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    view_sizes = [int(s) for s in args.view_sizes.split(",") if s]
+    latency_sec = args.latency_ms / 1000
+
+    commit = _git("rev-parse", "--short", "HEAD")
+    meta = {
+        "commit": commit,
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "streamlit": streamlit.__version__,
+        "sizes": sizes,
+        "view_sizes": view_sizes,
+        "latency_ms": args.latency_ms,
+        "repeat": args.repeat,
+    }
+
+    # AppTest 실행 중 쏟아지는 사용 중단 경고 등은 숨긴다
+    streamlit_logger.set_log_level("error")
+    with tempfile.TemporaryDirectory(prefix="travel-bench-") as tmp:
+        _isolate_data_dirs(Path(tmp))
+        config.OPENAI_API_KEY = config.OPENAI_API_KEY or "bench-key"
+        base_url, shutdown = stand_ins.start_server(latency_sec)
+        try:
+            _point_apis_at(base_url, latency_sec)
+            results = []
+            if "data" in groups:
+                results += bench_data(sizes, args.repeat)
+            if "views" in groups:
+                results += bench_views(view_sizes, args.repeat)
+            if "api" in groups:
+                results += bench_api(args.repeat, latency_sec)
+        finally:
+            shutdown()
+            openai_helper.close_clients()
+            photo_index._index = None
+
+    report = {"meta": meta, "results": results}
+    _print(results)
+    output = args.output or RESULTS_DIR / f"{commit or 'unknown'}{'-dirty' if meta['dirty'] else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=1), encoding="utf-8")
+    print(f"\nsaved {output}")
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+if __name__ == "__main__":
+    sys.exit(main())
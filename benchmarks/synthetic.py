@@ -0,0 +1,132 @@
+"""벤치마크용 합성 여행 데이터 생성기."""
+
+import io
+import random
+import wave
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+import config
+from utils import data_manager
+
+# 실제 일정 CSV에서 볼 수 있는 형태를 흉내 낸 값 풀
+_WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+_CATEGORIES = ["도착", "이동", "중식", "석식", "관광", "쇼핑", "휴식", "출국"]
+_PLACES = [
+    "캐널시티", "하카타역", "텐진 지하상가", "오호리 공원", "후쿠오카 타워", "다자이후 텐만구",
+    "나카스 야타이", "APA 호텔 하카타 에키 치쿠시구치", "분수쇼 관람", "요시즈카 우나기야 (대기 시 캐널시티 구경)",
+    "모모치 해변 (산책)", "라라포트 후쿠오카", "", "",
+]
+_CONTENTS = [
+    "후쿠오카 공항 도착", "호텔로 이동 및 짐 보관", "장어덮밥 (몸보신)", "쇼핑 및 자유 시간",
+    "야타이 체험", "체크아웃", "기념품 구매", "라멘 식사",
+]
+_TRANSPORTS = ["", "도보", "택시 (약 15분)", "지하철", "버스/도보"]
+_EXPENSE_ITEMS = ["식비", "교통", "쇼핑", "숙박", "입장료", "간식"]
+_PAYERS = ["지민", "수아", "하준", "서연", "도윤"]
+
+def make_schedule(rows: int, seed: int = 0) -> pd.DataFrame:
+    """일정 CSV와 같은 스키마의 합성 일정을 생성한다(잘못된 날짜/시간도 일부 섞는다)."""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(rows):
+        month, day = rng.randint(1, 12), rng.randint(1, 31)
+        raw_date = f"{month}/{day} ({rng.choice(_WEEKDAYS)})" if rng.random() > 0.02 else rng.choice(["", "미정"])
+        raw_time = f"{rng.randint(0, 25):02d}:{rng.randint(0, 61):02d}" if rng.random() > 0.05 else rng.choice(["", "오후"])
+        records.append(
+            {
+                "날짜": raw_date,
+                "시간": raw_time,
+                "구분": rng.choice(_CATEGORIES),
+                "내용": rng.choice(_CONTENTS),
+                "장소": rng.choice(_PLACES),
+                "지도검색어": rng.choice(_PLACES) if rng.random() < 0.2 else "",
+                "이동수단": rng.choice(_TRANSPORTS),
+            }
+        )
+    return pd.DataFrame(records, columns=config.EXPECTED_COLS)
+
+def make_expenses(rows: int, seed: int = 0) -> pd.DataFrame:
+    """지출 CSV와 같은 스키마의 합성 지출 내역을 생성한다(읽을 수 없는 금액도 일부 섞는다)."""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(rows):
+        amount = rng.randint(1, 500) * 100
+        records.append(
+            {
+                "날짜": f"3/{rng.randint(4, 7)} ({rng.choice(_WEEKDAYS)})",
+                "항목": rng.choice(_EXPENSE_ITEMS),
+                "금액": f"{amount:,}" if rng.random() > 0.01 else rng.choice(["", "미정"]),
+                "결제자": rng.choice(_PAYERS),
+                "메모": "",
+                # 통화는 대부분 엔화, 일부는 원화이거나 비워 둔다(금액 표기로 추정)
+                "통화": rng.choice(["JPY", "JPY", "JPY", "KRW", ""]),
+            }
+        )
+    return pd.DataFrame(records, columns=data_manager.EXPENSE_COLS)
+
+def make_candidates(rows: int, seed: int = 0) -> pd.DataFrame:
+    """후보 CSV와 같은 스키마의 합성 후보 장소 목록을 생성한다."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(rows):
+        place = rng.choice([p for p in _PLACES if p])
+        records.append(
+            {
+                "id": f"{i:012x}",
+                "장소명": f"{place} {i}",
+                "지도링크": data_manager.make_maps_search_link(place) if rng.random() < 0.5 else "",
+            }
+        )
+    return pd.DataFrame(records, columns=data_manager.CANDIDATE_COLS)
+
+def make_photo_bytes(width: int = 1600, height: int = 1200, seed: int = 0) -> bytes:
+    """휴대폰 사진 크기의 합성 JPEG 바이트를 생성한다(단색 배경 + 무작위 사각형)."""
+    rng = random.Random(seed)
+    image = Image.new("RGB", (width, height), tuple(rng.randint(0, 255) for _ in range(3)))
+    for _ in range(20):
+        x, y = rng.randint(0, width - 1), rng.randint(0, height - 1)
+        box = (x, y, min(width, x + rng.randint(50, 400)), min(height, y + rng.randint(50, 400)))
+        image.paste(tuple(rng.randint(0, 255) for _ in range(3)), box)
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+def make_photos(directory: Path, count: int, seed: int = 0) -> list[Path]:
+    """사진 폴더에 합성 사진 count장을 저장하고 경로 목록을 반환한다."""
+    directory.mkdir(parents=True, exist_ok=True)
+    # 사진마다 인코딩하면 느리므로 몇 장만 만들어 돌려 쓴다
+    variants = [make_photo_bytes(seed=seed + i) for i in range(min(count, 8))]
+    paths = []
+    for i in range(count):
+        path = directory / f"photo_{i:05d}.jpg"
+        path.write_bytes(variants[i % len(variants)])
+        paths.append(path)
+    return paths
+
+def make_voice_wav(seconds: float = 20.0, rate: int = 48_000, channels: int = 2, silence_sec: float = 2.0, seed: int = 0) -> bytes:
+    """휴대폰 마이크 녹음과 비슷한 16비트 PCM WAV를 생성한다.
+
+    앞뒤 silence_sec초는 약한 배경 소음만 있고, 가운데는 음절처럼 끊기는 배음 + 소음 구간이다.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    # 음절(약 0.25초)마다 기본 주파수가 바뀌고 사이사이 짧은 쉼이 있는 음성 흉내
+    syllable = (t * 4).astype(int)
+    pitch = rng.uniform(110, 240, syllable.max() + 1)[syllable]
+    envelope = np.clip(np.sin(np.pi * (t * 4 % 1)), 0, None) ** 0.5 * (rng.random(syllable.max() + 1) > 0.15)[syllable]
+    phase = 2 * np.pi * np.cumsum(pitch) / rate
+    voice = sum(np.sin(phase * k) / k for k in range(1, 6)) * envelope * 0.3
+    speaking = (t >= silence_sec) & (t < seconds - silence_sec)
+    samples = voice * speaking + rng.normal(0, 0.002, len(t))
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2")
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.repeat(pcm, channels).tobytes())
+    return output.getvalue()
@@ -1,6 +1,7 @@
 """앱 전역 설정(경로/환경변수/상수)을 모아두는 설정 모듈."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 import streamlit as st
 from dotenv import load_dotenv
@@ -16,7 +17,17 @@ BACKUP_PATH = DATA_DIR / "schedule.backup.csv"
 EXPENSES_PATH = DATA_DIR / "expenses.csv"
 CANDIDATES_PATH = DATA_DIR / "candidates.csv"
 CANDIDATES_BACKUP_PATH = DATA_DIR / "candidates.backup.csv"
+SQLITE_DB_PATH = DATA_DIR / "travel.sqlite3"
+# 지도 검색어 → 좌표 변환 결과(직접 추가/수정 가능한 오프라인 좌표표)
+GEOCODE_PATH = DATA_DIR / "geocode.json"
 PHOTOS_DIR = DATA_DIR / "photos"
+# 재계산/재호출 비용을 줄이기 위한 로컬 캐시 저장 위치
+CACHE_DIR = DATA_DIR / "cache"
+TRANSLATION_CACHE_PATH = CACHE_DIR / "translations.sqlite3"
+WEATHER_CACHE_PATH = CACHE_DIR / "weather_forecast.json"
+THUMBNAIL_DIR = CACHE_DIR / "thumbnails"
+PHOTO_INDEX_PATH = CACHE_DIR / "photo_index.json"
+EXCHANGE_RATES_PATH = CACHE_DIR / "exchange_rates.json"
 
 # 앱 표기/여행 정보 등 UI에 표시될 기본 정보
 APP_TITLE = "지민쓰와 떠나는 후쿠오카 찐친 패밀리 투어"
@@ -29,11 +40,67 @@ HOTEL_NAME = "APA Hotel Hakata Eki Chikushiguchi"
 AUTO_TRANSLATE_COOLDOWN_SEC = 1.2
 EXPECTED_COLS = ["날짜", "시간", "구분", "내용", "장소", "지도검색어", "이동수단"]
 
+# 환율/통화: 지출 통화 목록, 통화가 비어 있는 지출의 기본 통화, 환율을 받아올 수 없을 때 쓰는 1엔당 원화
+CURRENCIES = ["JPY", "KRW"]
+DEFAULT_EXPENSE_CURRENCY = "JPY"
+FALLBACK_KRW_PER_JPY = 9.0
+
+# 캐시/성능 관련 상수(용량 제한, 만료 시간, 페이지 크기 등)
+TRANSLATION_CACHE_MAX_ENTRIES = 5000
+WEATHER_CACHE_TTL_SEC = 30 * 60
+WEATHER_TIMEOUT_SEC = 5
+# 날씨 API 호출이 실패한 뒤 다시 시도하기까지 대기 시간
+WEATHER_RETRY_SEC = 5 * 60
+THUMBNAIL_MAX_PX = 480
+GALLERY_PAGE_SIZE = 24
+CANDIDATE_PAGE_SIZE = 10
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# OCR 업로드 전 이미지 축소 기준(총 픽셀 수)과 재인코딩 품질
+OCR_MAX_PIXELS = 2_000_000
+OCR_JPEG_QUALITY = 85
+OCR_CACHE_MAX_BYTES = 5 * 1024 * 1024
+# 저널에 쌓인 변경 연산이 이 개수를 넘으면 CSV로 압축
+JOURNAL_COMPACT_THRESHOLD = 50
+# 일정 파생 컬럼 계산: 이 행 수 이상이면 벡터 연산, 미만이면 행 단위 계산(작은 표는 벡터 연산의 고정 비용이 더 큼)
+ENRICH_VECTOR_MIN_ROWS = 500
+# 비슷한 일정 찾기: 검색어 n-그램 중 이 비율 이상이 겹쳐야 후보로 표시
+SEARCH_SIMILAR_MIN_OVERLAP = 0.5
+# 좌표 변환 API 호출 제한 시간, 실패 후 재시도까지 대기 시간, 동시에 조회할 장소 수
+GEOCODE_TIMEOUT_SEC = 5
+GEOCODE_RETRY_SEC = 10 * 60
+GEOCODE_MAX_WORKERS = 4
+# 환율표 갱신 주기, 환율 API 호출 제한 시간, 실패 후 재시도까지 대기 시간
+EXCHANGE_RATE_TTL_SEC = 6 * 60 * 60
+EXCHANGE_RATE_TIMEOUT_SEC = 5
+EXCHANGE_RATE_RETRY_SEC = 5 * 60
+# 음성 인식 업로드 전처리: 리샘플링 목표(Hz), 이보다 작은 프레임은 무음(dBFS), 앞뒤 무음을 자를 때 남길 여유(초)
+AUDIO_SAMPLE_RATE = 16_000
+AUDIO_SILENCE_DBFS = -45
+AUDIO_TRIM_PAD_SEC = 0.25
+# 긴 녹음 분할 전사: 조각 목표 길이, 자를 무음 지점을 찾을 범위(목표 앞뒤), 조각끼리 겹치는 길이(초)
+STT_CHUNK_SEC = 30
+STT_CHUNK_SEARCH_SEC = 5
+STT_CHUNK_OVERLAP_SEC = 0.5
+# 응답 시간 계측: 이름별로 p50/p95를 계산할 최근 측정값 개수
+METRICS_WINDOW = 500
+# 일정 지도에서 날짜별 마커 색상(날짜 순서대로 순환)
+MAP_DAY_COLORS = ["#E4572E", "#2E86AB", "#3BB273", "#F3A712", "#8E44AD", "#17BEBB", "#D7263D"]
+
+@lru_cache(maxsize=1)
+def _load_secrets() -> dict:
+    """Streamlit Secrets를 한 번만 읽어 dict로 보관한다. secrets.toml이 없으면 빈 dict."""
+    try:
+        return {key: st.secrets[key] for key in st.secrets}
+    except FileNotFoundError:
+        # StreamlitSecretNotFoundError(FileNotFoundError 하위 클래스) 포함: 로컬 실행 시 secrets 파일 없음
+        return {}
+
 def get_secret(name: str, default: str = "") -> str:
     """Streamlit Secrets 또는 환경 변수에서 키 값을 안전하게 가져온다."""
     # Streamlit Cloud 배포 환경에서는 st.secrets를 우선 사용
-    if name in st.secrets:
-        return str(st.secrets[name]).strip()
+    secrets = _load_secrets()
+    if name in secrets:
+        return str(secrets[name]).strip()
     # 로컬 실행 환경에서는 .env 또는 OS 환경 변수를 사용
     return os.getenv(name, default).strip()
 
@@ -48,6 +115,24 @@ OPENAI_OCR_MODEL = get_secret("OPENAI_OCR_MODEL", "gpt-4o-mini")
 OPENAI_TTS_MODEL = get_secret("OPENAI_TTS_MODEL", "gpt-4o-mini-tts")
 OPENAI_TTS_VOICE = get_secret("OPENAI_TTS_VOICE", "alloy")
 
+# OpenAI 요청 타임아웃(초)과 자동 재시도 횟수(공유 클라이언트에 적용)
+OPENAI_TIMEOUT_SEC = float(get_secret("OPENAI_TIMEOUT_SEC", "30"))
+OPENAI_MAX_RETRIES = int(get_secret("OPENAI_MAX_RETRIES", "2"))
+# 여러 장의 사진을 동시에 OCR/번역할 때 최대 동시 요청 수
+OCR_MAX_CONCURRENCY = int(get_secret("OCR_MAX_CONCURRENCY", "4"))
+# 긴 녹음을 나눠 전사할 때 최대 동시 요청 수
+STT_MAX_CONCURRENCY = int(get_secret("STT_MAX_CONCURRENCY", "4"))
+# 사진 번역 방식: combined(비전 모델 1회 호출로 추출+번역) / two_step(OCR 후 번역)
+OCR_TRANSLATE_MODE = get_secret("OCR_TRANSLATE_MODE", "combined")
+# 데이터 저장소: csv(기본, data/*.csv) / sqlite(data/travel.sqlite3, 최초 사용 시 CSV에서 자동 이전)
+STORAGE_BACKEND = get_secret("STORAGE_BACKEND", "csv").lower()
+# 음성 업로드 형식: flac(soundfile 설치 시 무손실 압축, 없으면 wav) / wav
+AUDIO_UPLOAD_FORMAT = get_secret("AUDIO_UPLOAD_FORMAT", "flac").lower()
+# 응답 시간 계측과 사이드바 진단 패널(기본 꺼짐, 꺼져 있으면 계측 비용 없음)
+METRICS_ENABLED = get_secret("METRICS_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+
 # 앱 실행 시 필요한 디렉터리가 없으면 생성
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 PHOTOS_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
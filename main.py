@@ -1,11 +1,89 @@
 """앱 엔트리 포인트: 사이드바 메뉴와 각 뷰 렌더링을 연결한다."""
 
+import importlib
+import sys
+
 import streamlit as st
 from streamlit_option_menu import option_menu
 
 import config
-from utils import style
-from views import schedule, map, translate, weather, expenses, gallery
+from utils import metrics, style
+
+# 메뉴 이름 → (아이콘, 뷰 모듈 경로)
+# 뷰 모듈은 메뉴를 처음 선택했을 때 import되므로, 열지 않은 화면의 무거운 의존성(openai, PIL 등)은 로드하지 않는다.
+VIEWS = {
+    "일정 View": ("calendar-check", "views.schedule"),
+    "지도 View": ("map", "views.map"),
+    "AI 통역사": ("translate", "views.translate"),
+    "날씨 예보": ("cloud-sun", "views.weather"),
+    "지출 기록": ("receipt", "views.expenses"),
+    "추억 앨범": ("images", "views.gallery"),
+}
+
+def load_view(label: str):
+    """메뉴 이름에 해당하는 뷰 모듈을 import해 반환한다(이미 로드된 모듈은 재사용)."""
+    return importlib.import_module(VIEWS[label][1])
+
+def render_diagnostics():
+    """사이드바 진단 패널: 뷰/데이터/API 호출별 응답 시간(p50/p95)과 내보내기 버튼, 번역 지연 기록."""
+    with st.expander("🩺 진단 (응답 시간)"):
+        rows = metrics.snapshot()
+        if rows:
+            st.dataframe(
+                [{"이름": r["name"], "호출": r["count"], "오류": r["errors"], "p50 (ms)": r["p50_ms"], "p95 (ms)": r["p95_ms"]} for r in rows],
+                use_container_width=True,
+                hide_index=True,
+            )
+            st.caption(f"최근 {config.METRICS_WINDOW}회 기준 분위수 · 모든 세션 합산")
+            col_json, col_prom = st.columns(2)
+            col_json.download_button("JSON", metrics.to_json(), file_name="metrics.json", mime="application/json")
+            col_prom.download_button("Prometheus", metrics.to_prometheus(), file_name="metrics.prom", mime="text/plain")
+            if st.button("초기화", key="metrics_reset"):
+                metrics.reset()
+                st.rerun()
+        else:
+            st.caption("아직 측정된 호출이 없어요.")
+        render_translation_latency()
+        render_translation_cache_stats()
+
+def render_translation_latency():
+    """최근 번역 요청의 첫 토큰까지/전체 지연 시간(통역 화면을 연 적이 있을 때만)."""
+    # 진단 패널 때문에 openai 의존성을 미리 로드하지 않도록, 이미 import된 경우에만 읽는다
+    openai_helper = sys.modules.get("utils.openai_helper")
+    log = openai_helper.get_latency_log() if openai_helper else []
+    if not log:
+        return
+    st.markdown("###### 번역 지연")
+    st.dataframe(
+        [
+            {
+                "방식": ("캐시" if entry["cached"] else "스트리밍" if entry["streamed"] else "일괄"),
+                "첫 토큰 (ms)": round(entry["ttft_sec"] * 1000) if entry["ttft_sec"] is not None else None,
+                "전체 (ms)": round(entry["total_sec"] * 1000),
+                "글자": entry["chars"],
+            }
+            for entry in reversed(log[-10:])
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+    ttfts = sorted(entry["ttft_sec"] for entry in log if entry["streamed"] and not entry["cached"] and entry["ttft_sec"] is not None)
+    if ttfts:
+        st.caption(f"API 스트리밍 {len(ttfts)}건 · 첫 토큰 중앙값 {ttfts[(len(ttfts) - 1) // 2] * 1000:,.0f}ms · 최근 10건 표시")
+
+def render_translation_cache_stats():
+    """번역 캐시의 적중/미스/축출 횟수와 저장된 항목 수(번역을 한 번이라도 요청했을 때만)."""
+    # 카운터는 프로세스 전역이므로 캐시 모듈이 로드되지 않았으면 보여줄 값이 없다
+    translation_cache = sys.modules.get("utils.translation_cache")
+    if translation_cache is None:
+        return
+    stats = translation_cache.get_stats()
+    if not stats["hits"] + stats["misses"]:
+        return
+    st.caption(
+        f"번역 캐시 적중 {stats['hits']:,} · 미스 {stats['misses']:,} (적중률 {stats['hit_rate'] * 100:.0f}%) · "
+        f"저장 {stats['entries']:,}건 · 축출 {stats['evictions']:,}"
+    )
 
 def main():
     """Streamlit 페이지 기본 설정과 탭 렌더링을 수행한다."""
@@ -26,8 +104,8 @@ def main():
         # 메뉴 선택에 따라 메인 뷰를 전환
         selected = option_menu(
             "메뉴",
-            ["일정 View", "지도 View", "AI 통역사", "날씨 예보", "지출 기록", "추억 앨범"],
-            icons=["calendar-check", "map", "translate", "cloud-sun", "receipt", "images"],
+            list(VIEWS),
+            icons=[icon for icon, _ in VIEWS.values()],
             menu_icon="cast",
             default_index=0,
             styles={
@@ -50,19 +128,14 @@ def main():
     # 메인 콘텐츠(상단 타이틀)
     st.title(config.APP_TITLE)
     
-    # 메뉴 선택 결과에 따라 각 화면 렌더링
-    if selected == "일정 View":
-        schedule.render()
-    elif selected == "지도 View":
-        map.render()
-    elif selected == "AI 통역사":
-        translate.render()
-    elif selected == "날씨 예보":
-        weather.render()
-    elif selected == "지출 기록":
-        expenses.render()
-    elif selected == "추억 앨범":
-        gallery.render()
+    # 메뉴 선택 결과에 해당하는 화면만 로드해 렌더링(계측이 켜져 있으면 import + 렌더링 시간 기록)
+    with metrics.timer(f"view.{VIEWS[selected][1].rsplit('.', 1)[-1]}"):
+        load_view(selected).render()
+
+    # 진단 패널은 이번 렌더링 시간까지 반영되도록 화면을 그린 뒤 사이드바에 추가
+    if metrics.enabled():
+        with st.sidebar:
+            render_diagnostics()
 
 if __name__ == "__main__":
     # 직접 실행 시 main() 호출
@@ -0,0 +1,31 @@
+"""테스트 공용 픽스처: data/ 아래 경로를 임시 폴더로 옮기고 프로세스 전역 캐시를 비운다."""
+
+from pathlib import Path
+
+import pytest
+
+import config
+from utils import data_manager, exchange_rates, sqlite_store, swr_cache
+
+@pytest.fixture
+def isolated_data(tmp_path, monkeypatch):
+    """config의 data/ 아래 경로를 모두 tmp_path 아래로 옮긴다(실제 데이터 보호). CSV 백엔드로 시작한다."""
+    data_dir = config.DATA_DIR
+    for name, value in list(vars(config).items()):
+        if name.isupper() and isinstance(value, Path) and value.is_relative_to(data_dir):
+            monkeypatch.setattr(config, name, tmp_path / value.relative_to(data_dir))
+    for directory in (config.DATA_DIR, config.PHOTOS_DIR, config.CACHE_DIR, config.THUMBNAIL_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(config, "STORAGE_BACKEND", "csv")
+
+    def reset_caches():
+        data_manager.invalidate_cache()
+        data_manager._migrated_tables.clear()
+        data_manager._schedule_index = None
+        sqlite_store._schema_ready = False
+        swr_cache.reset(exchange_rates._cache)
+        exchange_rates.set_provider(None)
+
+    reset_caches()
+    yield tmp_path
+    reset_caches()
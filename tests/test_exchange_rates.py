@@ -0,0 +1,68 @@
+"""지출 날짜 기간 환율 받기(history_table)와 실패 후 재시도 대기를 확인한다."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from utils import exchange_rates, swr_cache
+
+LEDGER = pd.DataFrame({"날짜": ["3/2 (월)", "3/7 (토)"], "금액": ["1,000", "¥1000"], "통화": ["JPY", ""]})
+
+def _wait_for_background(timeout_sec: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_sec
+    while swr_cache.running_jobs(exchange_rates._cache):
+        assert time.monotonic() < deadline, "백그라운드 환율 작업이 끝나지 않음"
+        time.sleep(0.01)
+
+@pytest.fixture
+def calls(isolated_data):
+    return {"latest": 0, "history": 0}
+
+def _latest(calls: dict):
+    def provider():
+        calls["latest"] += 1
+        return "2026-10-16", {"JPY": 9.5}
+    return provider
+
+def test_history_failure_falls_back_without_refetching(calls):
+    def failing_history(start, end):
+        calls["history"] += 1
+        raise ConnectionError("offline")
+
+    exchange_rates.set_provider(_latest(calls), failing_history)
+    for _ in range(3):
+        converted = exchange_rates.convert_ledger(LEDGER)
+        _wait_for_background()
+        # 기간 환율이 없으면 최신 환율로 환산한다
+        assert converted["KRW"].tolist() == [9500.0, 9500.0]
+
+    assert calls == {"latest": 1, "history": 1}
+    assert not exchange_rates.fetching_history()
+
+def test_history_is_fetched_in_background_once(calls):
+    def history(start, end):
+        calls["history"] += 1
+        assert (start, end) == ("2026-03-02", "2026-03-07")
+        return {"2026-03-02": {"JPY": 9.1}, "2026-03-06": {"JPY": 9.2}}
+
+    exchange_rates.set_provider(_latest(calls), history)
+    # 처음에는 기다리지 않고 최신 환율로 환산
+    assert exchange_rates.convert_ledger(LEDGER)["KRW"].tolist() == [9500.0, 9500.0]
+    _wait_for_background()
+
+    for _ in range(2):
+        # 토요일(3/7)은 가장 가까운 영업일(3/6) 환율
+        assert exchange_rates.convert_ledger(LEDGER)["KRW"].tolist() == [9100.0, 9200.0]
+    assert calls == {"latest": 1, "history": 1}
+
+def test_offline_latest_rate_backs_off(calls):
+    def offline():
+        calls["latest"] += 1
+        raise ConnectionError("offline")
+
+    exchange_rates.set_provider(offline)
+    for _ in range(3):
+        assert exchange_rates.rate_table() == {}
+        assert exchange_rates.latest_rate("JPY")[1] is None
+    assert calls["latest"] == 1
@@ -0,0 +1,76 @@
+"""CSV 백엔드와 SQLite 백엔드가 같은 데이터에 대해 같은 행을 돌려주는지 확인한다."""
+
+import pandas as pd
+import pytest
+
+import config
+from benchmarks.synthetic import make_candidates, make_expenses, make_schedule
+from utils import data_manager
+
+ROWS = 300
+
+@pytest.fixture
+def ledger(isolated_data):
+    """합성 일정/지출/후보 CSV를 쓴다(날짜·시각·금액이 비었거나 잘못된 행 포함)."""
+    make_schedule(ROWS).to_csv(config.SCHEDULE_PATH, index=False)
+    make_expenses(ROWS).to_csv(config.EXPENSES_PATH, index=False)
+    make_candidates(ROWS).to_csv(config.CANDIDATES_PATH, index=False)
+    data_manager.invalidate_cache()
+    return isolated_data
+
+def _snapshot(keywords: list[str], date_sets: list[list[str]]) -> dict:
+    """현재 백엔드에서 읽은 테이블과 조회 결과(인덱스는 비교에서 제외)."""
+    def rows(df: pd.DataFrame) -> pd.DataFrame:
+        return df.reset_index(drop=True).fillna("").astype(str)
+
+    snapshot = {
+        "schedule": rows(data_manager.load_schedule()),
+        "expenses": rows(data_manager.load_expenses()),
+        "candidates": rows(data_manager.load_candidates()),
+        "dates": data_manager.schedule_dates(),
+    }
+    for dates in date_sets:
+        snapshot[("dates", tuple(dates))] = rows(data_manager.query_schedule(dates=dates))
+    for keyword in keywords:
+        snapshot[("keyword", keyword)] = rows(data_manager.query_schedule(keyword=keyword))
+    return snapshot
+
+def _assert_same(csv: dict, sqlite: dict) -> None:
+    assert csv.keys() == sqlite.keys()
+    for key, expected in csv.items():
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(sqlite[key], expected, obj=str(key))
+        else:
+            assert sqlite[key] == expected, key
+
+def test_sqlite_returns_same_rows_as_csv(ledger, monkeypatch):
+    schedule = data_manager.load_schedule()
+    dates = data_manager.schedule_dates()
+    assert len(dates) > 2
+    # 한글/일본어 키워드는 대소문자·전각 정규화와 무관해 두 백엔드 결과가 같아야 한다
+    keywords = [schedule["내용"].iloc[0][:2], schedule["장소"].iloc[1][:3], "%", "없는키워드"]
+    date_sets = [[dates[0]], dates[1:3]]
+
+    csv = _snapshot(keywords, date_sets)
+    assert len(csv["schedule"]) == ROWS
+
+    monkeypatch.setattr(config, "STORAGE_BACKEND", "sqlite")
+    # 처음 읽을 때 CSV에서 가져오기(마이그레이션)가 일어난다
+    _assert_same(csv, _snapshot(keywords, date_sets))
+
+def test_edits_saved_through_sqlite_match_csv(ledger, monkeypatch):
+    expenses = data_manager.load_expenses()
+    edited = expenses.drop(index=[3, 7]).reset_index(drop=True)
+    edited.loc[0, "금액"] = "12,345"
+    edited.loc[1, "항목"] = "수정된 항목"
+    edited = pd.concat([edited, edited.iloc[[2]]], ignore_index=True)
+
+    data_manager.save_expenses(edited)
+    csv = data_manager.load_expenses().reset_index(drop=True)
+
+    monkeypatch.setattr(config, "STORAGE_BACKEND", "sqlite")
+    data_manager.save_expenses(expenses)
+    data_manager.save_expenses(edited)
+    sqlite = data_manager.load_expenses().reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(sqlite.fillna("").astype(str), csv.fillna("").astype(str))
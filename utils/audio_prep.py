@@ -0,0 +1,242 @@
+"""음성 인식(STT) 업로드 전에 녹음을 줄이는 전처리 유틸리티.
+
+WAV(PCM)를 모노로 합치고 앞뒤 무음을 자른 뒤 16kHz로 리샘플링해 16비트 WAV로 다시 쓴다.
+soundfile이 설치되어 있고 AUDIO_UPLOAD_FORMAT이 flac이면 FLAC(무손실 압축)으로 인코딩한다.
+WAV가 아니거나 읽을 수 없는 녹음(webm 등)은 원본 그대로 보내되 형식에 맞는 파일 이름을 붙인다.
+"""
+
+import io
+import time
+import wave
+from typing import Iterator, Optional
+
+import numpy as np
+
+import config
+
+try:
+    # 선택적 의존성: 설치되어 있으면 FLAC으로 압축해 업로드
+    import soundfile
+except ImportError:
+    soundfile = None
+
+# 무음 판정용 프레임 길이(초)
+FRAME_SEC = 0.02
+# 가장 큰 프레임보다 이만큼(dB) 작으면 무음으로 본다(배경 소음이 큰 곳에서도 앞뒤를 자르기 위함)
+RELATIVE_SILENCE_DB = 35
+
+# 파일 앞부분 시그니처 → 업로드 파일 이름(확장자로 형식을 알린다)
+_SIGNATURES = [
+    (b"\x1a\x45\xdf\xa3", "voice.webm"),
+    (b"OggS", "voice.ogg"),
+    (b"fLaC", "voice.flac"),
+    (b"ID3", "voice.mp3"),
+    (b"\xff\xfb", "voice.mp3"),
+    (b"RIFF", "voice.wav"),
+]
+
+def guess_filename(audio_bytes: bytes) -> str:
+    """녹음 바이트의 시그니처로 업로드 파일 이름을 정한다(모르면 voice.wav)."""
+    for signature, filename in _SIGNATURES:
+        if audio_bytes.startswith(signature):
+            return filename
+    if audio_bytes[4:8] == b"ftyp":
+        return "voice.m4a"
+    return "voice.wav"
+
+def decode_wav(audio_bytes: bytes) -> tuple[np.ndarray, int]:
+    """PCM WAV를 [-1, 1] 범위의 모노 float32 배열과 샘플레이트로 읽는다. PCM WAV가 아니면 wave.Error 등."""
+    with wave.open(io.BytesIO(audio_bytes)) as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+    if width == 1:
+        # 8비트는 부호 없는 정수(128이 0)
+        ints, offset, full_scale = np.frombuffer(raw, dtype=np.uint8), 128, 128
+    elif width == 2:
+        ints, offset, full_scale = np.frombuffer(raw, dtype="<i2"), 0, 2**15
+    elif width == 3:
+        # 24비트는 하위에 0바이트를 붙여 32비트 정수로 읽는다
+        padded = np.zeros((len(raw) // 3, 4), dtype=np.uint8)
+        padded[:, 1:] = np.frombuffer(raw, dtype=np.uint8)[: len(padded) * 3].reshape(-1, 3)
+        ints, offset, full_scale = padded.view("<i4").ravel(), 0, 2**31
+    elif width == 4:
+        ints, offset, full_scale = np.frombuffer(raw, dtype="<i4"), 0, 2**31
+    else:
+        raise ValueError(f"지원하지 않는 샘플 크기: {width}")
+    frames = ints[: len(ints) // channels * channels].reshape(-1, channels)
+    # 채널을 열 단위로 더한다(행 단위 sum/mean보다 긴 녹음에서 훨씬 빠르다)
+    total = frames[:, 0].astype(np.float32)
+    for channel in range(1, channels):
+        total += frames[:, channel]
+    if offset:
+        total -= offset * channels
+    total *= np.float32(1 / (channels * full_scale))
+    return total, rate
+
+def _fft_length(n: int, step: int) -> int:
+    """n 이상이면서 step의 배수이고 소인수가 7 이하인 길이(FFT가 빠른 길이)를 찾는다."""
+    length = -(-n // step) * step
+    while True:
+        rest = length
+        for prime in (2, 3, 5, 7):
+            while rest % prime == 0:
+                rest //= prime
+        if rest == 1:
+            return length
+        length += step
+
+def resample(samples: np.ndarray, rate: int, target_rate: int) -> np.ndarray:
+    """FFT로 대역을 자르며 리샘플링한다(목표 나이퀴스트 이상 성분은 제거되어 에일리어싱이 없다).
+
+    길이의 소인수가 크면 FFT가 수십 배 느려지므로, 뒤에 0을 붙여 빠른 길이로 맞춘 뒤 결과를 잘라낸다.
+    """
+    if rate == target_rate or len(samples) == 0:
+        return samples
+    target_len = max(1, int(round(len(samples) * target_rate / rate)))
+    # 원래 길이와 목표 길이가 모두 정수가 되도록 rate/gcd의 배수로 늘린다
+    step = rate // np.gcd(rate, target_rate)
+    padded_len = _fft_length(len(samples), step)
+    padded_target = padded_len * target_rate // rate
+    spectrum = np.fft.rfft(samples, padded_len)
+    bins = padded_target // 2 + 1
+    if bins <= len(spectrum):
+        spectrum = spectrum[:bins]
+    else:
+        spectrum = np.concatenate([spectrum, np.zeros(bins - len(spectrum), dtype=spectrum.dtype)])
+    resampled = np.fft.irfft(spectrum, padded_target) * (padded_target / padded_len)
+    return resampled[:target_len].astype(np.float32)
+
+def frame_levels(samples: np.ndarray, rate: int) -> np.ndarray:
+    """FRAME_SEC 단위 프레임별 음량(dBFS)을 반환한다."""
+    frame = max(1, int(rate * FRAME_SEC))
+    count = len(samples) // frame
+    if count == 0:
+        return np.empty(0, dtype=np.float32)
+    frames = samples[: count * frame].reshape(count, frame)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-10))
+
+def voiced_frames(levels: np.ndarray) -> np.ndarray:
+    """프레임별 음성 여부(절대 기준 AUDIO_SILENCE_DBFS와 최대 음량 대비 상대 기준 중 높은 쪽보다 크면 음성)."""
+    if len(levels) == 0:
+        return np.zeros(0, dtype=bool)
+    threshold = max(config.AUDIO_SILENCE_DBFS, float(levels.max()) - RELATIVE_SILENCE_DB)
+    return levels > threshold
+
+def trim_silence(samples: np.ndarray, rate: int) -> np.ndarray:
+    """앞뒤 무음을 AUDIO_TRIM_PAD_SEC만큼 여유를 두고 잘라낸다. 전부 무음이면 그대로 둔다."""
+    voiced = np.flatnonzero(voiced_frames(frame_levels(samples, rate)))
+    if len(voiced) == 0:
+        return samples
+    frame = max(1, int(rate * FRAME_SEC))
+    pad = int(rate * config.AUDIO_TRIM_PAD_SEC)
+    start = max(0, voiced[0] * frame - pad)
+    end = min(len(samples), (voiced[-1] + 1) * frame + pad)
+    return samples[start:end]
+
+def encode(samples: np.ndarray, rate: int, audio_format: str = None) -> tuple[bytes, str]:
+    """모노 float 샘플을 업로드용 바이트와 파일 이름으로 인코딩한다(flac은 soundfile이 있을 때만)."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    audio_format = (audio_format or config.AUDIO_UPLOAD_FORMAT).lower()
+    output = io.BytesIO()
+    if audio_format == "flac" and soundfile is not None:
+        soundfile.write(output, pcm, rate, format="FLAC", subtype="PCM_16")
+        return output.getvalue(), "voice.flac"
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+    return output.getvalue(), "voice.wav"
+
+def _load_samples(audio_bytes: bytes, report: dict) -> Optional[tuple[np.ndarray, int]]:
+    """WAV를 모노로 읽고 앞뒤 무음을 잘라 원래 샘플레이트 그대로 반환한다. WAV가 아니면 None."""
+    try:
+        samples, rate = decode_wav(audio_bytes)
+    except (wave.Error, EOFError, ValueError):
+        return None
+    report["original_sec"] = len(samples) / rate if rate else 0.0
+    samples = trim_silence(samples, rate)
+    report["upload_sec"] = len(samples) / rate if rate else 0.0
+    return samples, rate
+
+def prepare_audio(audio_bytes: bytes) -> tuple[bytes, str, dict]:
+    """녹음을 STT 업로드용으로 줄여 (바이트, 파일 이름, 보고서)를 반환한다.
+
+    보고서: original_bytes/upload_bytes(크기), original_sec/upload_sec(길이, WAV일 때만), prep_ms, format.
+    읽을 수 없는 형식이거나 전처리 결과가 원본보다 크면 원본을 그대로 반환한다.
+    """
+    chunks, report = prepare_chunks(audio_bytes, max_chunk_sec=None)
+    return chunks[0][0], chunks[0][1], report
+
+def split_points(samples: np.ndarray, rate: int, max_chunk_sec: float) -> list[tuple[int, int]]:
+    """긴 녹음을 max_chunk_sec 근처의 가장 조용한 프레임에서 나눠 겹치는 (시작, 끝) 샘플 구간 목록을 만든다.
+
+    자르는 위치는 목표 지점 앞뒤 STT_CHUNK_SEARCH_SEC 안에서 고르고, 각 구간은 앞뒤로
+    STT_CHUNK_OVERLAP_SEC만큼 겹친다(단어가 잘려도 어느 한쪽에는 온전히 남도록).
+    """
+    total = len(samples)
+    chunk = int(max_chunk_sec * rate)
+    frame = max(1, int(rate * FRAME_SEC))
+    # 마지막 조각이 너무 짧아지지 않도록 목표 길이의 1.25배까지는 나누지 않는다
+    if chunk <= 0 or total <= chunk * 1.25:
+        return [(0, total)]
+
+    levels = frame_levels(samples, rate)
+    search = int(min(config.STT_CHUNK_SEARCH_SEC, max_chunk_sec / 2) * rate)
+    cuts = [0]
+    while total - cuts[-1] > chunk * 1.25:
+        target = cuts[-1] + chunk
+        lo, hi = (target - search) // frame, min(len(levels), (target + search) // frame)
+        quietest = lo + int(np.argmin(levels[lo:hi])) if hi > lo else target // frame
+        cuts.append(quietest * frame + frame // 2)
+    cuts.append(total)
+
+    overlap = int(config.STT_CHUNK_OVERLAP_SEC * rate)
+    return [(max(0, start - overlap), min(total, end + overlap)) for start, end in zip(cuts, cuts[1:])]
+
+def iter_chunks(audio_bytes: bytes, max_chunk_sec: Optional[float], report: dict) -> Iterator[tuple[bytes, str]]:
+    """녹음을 전처리하며 (바이트, 파일 이름) 조각을 하나씩 내보낸다(받는 쪽은 다음 조각을 기다리지 않고 바로 업로드).
+
+    나눌 위치는 원래 샘플레이트에서 먼저 정하고 리샘플링과 인코딩은 조각마다 따로 하므로,
+    첫 조각은 녹음 전체를 처리하기 전에 나온다. max_chunk_sec가 None이면 나누지 않고,
+    WAV가 아니면 원본 한 조각을 내보낸다. report는 진행하면서 채워진다(chunks는 첫 조각보다 먼저 정해짐).
+    """
+    started = time.perf_counter()
+    report.update(original_bytes=len(audio_bytes), original_sec=None, upload_sec=None, upload_bytes=0, prep_ms=0.0)
+    loaded = _load_samples(audio_bytes, report)
+    if loaded is None:
+        filename = guess_filename(audio_bytes)
+        report.update(
+            chunks=1, upload_bytes=len(audio_bytes), format=filename.rsplit(".", 1)[-1],
+            prep_ms=(time.perf_counter() - started) * 1000,
+        )
+        yield audio_bytes, filename
+        return
+
+    samples, rate = loaded
+    spans = split_points(samples, rate, max_chunk_sec) if max_chunk_sec else [(0, len(samples))]
+    report["chunks"] = len(spans)
+    # 원본보다 높은 샘플레이트로 올리지는 않는다
+    target_rate = min(rate, config.AUDIO_SAMPLE_RATE)
+    for start, end in spans:
+        data, filename = encode(resample(samples[start:end], rate, target_rate), target_rate)
+        if len(spans) == 1 and len(data) >= len(audio_bytes):
+            # 전처리 결과가 더 크면 원본을 그대로 보낸다
+            data, filename = audio_bytes, "voice.wav"
+            report["upload_sec"] = report["original_sec"]
+        report["upload_bytes"] += len(data)
+        report["format"] = filename.rsplit(".", 1)[-1]
+        # 받는 쪽이 조각을 업로드하는 동안은 전처리 시간에 넣지 않는다
+        report["prep_ms"] += (time.perf_counter() - started) * 1000
+        yield data, filename
+        started = time.perf_counter()
+
+def prepare_chunks(audio_bytes: bytes, max_chunk_sec: Optional[float] = None) -> tuple[list[tuple[bytes, str]], dict]:
+    """녹음을 전처리하고, 길면 무음 지점에서 겹치게 나눠 [(바이트, 파일 이름), ...]과 보고서를 반환한다.
+
+    보고서에는 prepare_audio의 항목에 chunks(조각 수)가 더해진다. 조각을 만드는 대로 쓰려면 iter_chunks.
+    """
+    report: dict = {}
+    chunks = list(iter_chunks(audio_bytes, max_chunk_sec, report))
+    return chunks, report
@@ -1,11 +1,16 @@
-"""CSV 기반 데이터 로딩/저장과 일정 가공 로직을 담당하는 유틸리티."""
+"""일정/지출/후보 데이터 로딩·저장(CSV 또는 SQLite 백엔드)과 일정 가공 로직을 담당하는 유틸리티."""
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, date, time as dt_time
 import re
+from pathlib import Path
 from typing import Optional
-import shutil
+from urllib.parse import quote_plus
+import threading
+import uuid
 import config
+from utils import journal, metrics, search_index, sqlite_store
 
 # 지도 검색어에서 제외할 메모성 키워드(괄호 안 텍스트 제거에 사용)
 NOTE_KEYWORDS = {
@@ -13,8 +18,74 @@ NOTE_KEYWORDS = {
     "정리", "짐", "이용", "체크인", "체크아웃", "자유", "환승", "셔틀", "시간", "구매"
 }
 
-# 후보 리스트 CSV의 표준 컬럼 정의
-CANDIDATE_COLS = ["장소명", "지도링크"]
+# 후보 리스트 CSV의 표준 컬럼 정의(id는 추가/삭제에 쓰는 고정 ID)
+CANDIDATE_COLS = ["id", "장소명", "지도링크"]
+
+# 지출 CSV의 표준 컬럼 정의(통화: JPY/KRW, 비어 있으면 기본 통화)
+EXPENSE_COLS = ["날짜", "항목", "금액", "결제자", "메모", "통화"]
+
+# 프로세스 전역 테이블 캐시: (종류, 경로) → (파일 서명, DataFrame)
+# Streamlit 세션은 같은 프로세스의 스레드로 실행되므로 모든 세션이 캐시를 공유한다.
+_frame_cache: dict[tuple[str, Path], tuple[tuple, pd.DataFrame]] = {}
+_frame_cache_lock = threading.Lock()
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """파일의 (수정 시각, 크기) 서명을 반환한다. 파일이 없으면 None."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _cached_frame(key: tuple[str, Path], signature: Optional[tuple], loader) -> pd.DataFrame:
+    """서명이 같으면 캐시된 DataFrame의 복사본을, 다르면 loader()로 새로 읽어 반환한다."""
+    with _frame_cache_lock:
+        entry = _frame_cache.get(key)
+    if entry is not None and signature is not None and entry[0] == signature:
+        # 호출자가 수정해도 다른 세션의 데이터가 바뀌지 않도록 복사본을 넘긴다
+        return entry[1].copy()
+
+    df = loader()
+    if signature is not None:
+        with _frame_cache_lock:
+            _frame_cache[key] = (signature, df)
+    return df.copy()
+
+def read_csv_cached(path: Path) -> pd.DataFrame:
+    """CSV를 문자열 스키마로 읽되, 파일이 바뀌지 않았으면 캐시된 결과의 복사본을 반환한다."""
+    path = Path(path)
+    return _cached_frame(
+        ("csv", path), _file_signature(path), lambda: pd.read_csv(path, dtype=str).fillna("")
+    )
+
+def read_table_cached(path: Path, cols: list[str]) -> pd.DataFrame:
+    """기준 CSV에 저널 변경분을 적용한 테이블을 읽는다(CSV/저널이 그대로면 캐시 사용)."""
+    path = Path(path)
+    # 저널 압축과 겹치지 않도록 CSV와 저널을 같은 잠금 안에서 읽는다
+    with journal.lock_for(path):
+        signature = _table_signature(path)
+
+        def _load() -> pd.DataFrame:
+            base = journal.normalize_frame(pd.read_csv(path, dtype=str).fillna(""), cols)
+            return journal.apply_ops(base, journal.read_ops(path), cols)
+
+        return _cached_frame(("table", path), signature, _load)
+
+def _table_signature(path: Path) -> Optional[tuple]:
+    """기준 CSV와 저널 파일의 서명을 합친 테이블 서명. CSV가 없으면 None."""
+    base_signature = _file_signature(path)
+    if base_signature is None:
+        return None
+    return (base_signature, _file_signature(journal.journal_path(path)))
+
+def invalidate_cache(path: Optional[Path] = None) -> None:
+    """테이블 캐시를 비운다. 경로를 주면 해당 파일만 무효화한다."""
+    with _frame_cache_lock:
+        if path is None:
+            _frame_cache.clear()
+            return
+        for key in [key for key in _frame_cache if key[1] == Path(path)]:
+            del _frame_cache[key]
 
 def looks_like_note(text: str) -> bool:
     """메모성 키워드 포함 여부를 검사하여 '장소명'인지 판단한다."""
@@ -54,6 +125,12 @@ def choose_map_query(content: str, place: str, override: str) -> str:
     # 둘 다 애매하면 남아있는 값 반환
     return place_clean or content_clean
 
+def make_maps_search_link(place: str) -> str:
+    """장소명을 Google Maps 검색 링크로 변환한다."""
+    if not place:
+        return ""
+    return f"https://www.google.com/maps/search/?api=1&query={quote_plus(place)}"
+
 def ensure_data_file() -> None:
     """일정 CSV가 없으면 기본 샘플 데이터로 생성한다."""
     if config.SCHEDULE_PATH.exists():
@@ -67,40 +144,73 @@ def ensure_data_file() -> None:
     )
     seed.to_csv(config.SCHEDULE_PATH, index=False)
 
+def _use_sqlite() -> bool:
+    """설정상 SQLite 저장소 백엔드를 사용하는지 여부."""
+    return config.STORAGE_BACKEND == "sqlite"
+
+@metrics.timed()
 def load_schedule() -> pd.DataFrame:
-    """일정 CSV를 로드하고 누락 컬럼을 보정한다."""
+    """일정 데이터를 로드하고 누락 컬럼을 보정한다."""
+    if _use_sqlite():
+        return _load_sqlite("schedule")
+    return _load_schedule_csv()
+
+def _load_schedule_csv() -> pd.DataFrame:
+    """일정 CSV(+ 저널 변경분)를 로드한다."""
     # 파일이 없으면 기본 파일부터 생성
     ensure_data_file()
     try:
-        df = pd.read_csv(config.SCHEDULE_PATH, dtype=str).fillna("")
+        # 컬럼이 빠져있어도 앱이 정상 동작하도록 표준 컬럼으로 보정
+        return read_table_cached(config.SCHEDULE_PATH, config.EXPECTED_COLS)
     except Exception:
         # 읽기 실패 시 빈 데이터프레임 반환
         return pd.DataFrame(columns=config.EXPECTED_COLS)
-        
-    # 컬럼이 빠져있어도 앱이 정상 동작하도록 보정
-    for col in config.EXPECTED_COLS:
-        if col not in df.columns:
-            df[col] = ""
-    return df[config.EXPECTED_COLS]
 
+@metrics.timed()
 def save_schedule(df: pd.DataFrame) -> None:
-    """일정 CSV를 저장하고 이전 버전은 백업한다."""
-    # 기존 파일을 백업으로 이동
-    if config.SCHEDULE_PATH.exists():
-        config.SCHEDULE_PATH.replace(config.BACKUP_PATH)
-    # 최신 데이터를 저장
-    df.to_csv(config.SCHEDULE_PATH, index=False)
+    """일정 변경 행만 저장한다(CSV는 저널에 기록하고, 압축 시 이전 CSV는 백업)."""
+    if _use_sqlite():
+        _save_sqlite("schedule", df)
+        return
+    _save_table(config.SCHEDULE_PATH, config.EXPECTED_COLS, df, config.BACKUP_PATH)
 
+@metrics.timed()
 def load_expenses() -> pd.DataFrame:
-    """지출 CSV를 로드한다. 파일이 없으면 빈 스키마로 반환."""
+    """지출 데이터를 로드한다. 데이터가 없으면 빈 스키마로 반환."""
+    if _use_sqlite():
+        return _load_sqlite("expenses")
+    return _load_expenses_csv()
+
+def _load_expenses_csv() -> pd.DataFrame:
+    """지출 CSV(+ 저널 변경분)를 로드한다."""
     if not config.EXPENSES_PATH.exists():
-        return pd.DataFrame(columns=["날짜", "항목", "금액", "결제자", "메모"])
+        return pd.DataFrame(columns=EXPENSE_COLS)
     
-    return pd.read_csv(config.EXPENSES_PATH, dtype=str).fillna("")
+    return read_table_cached(config.EXPENSES_PATH, EXPENSE_COLS)
 
+@metrics.timed()
 def save_expenses(df: pd.DataFrame) -> None:
-    """지출 CSV를 저장한다."""
-    df.to_csv(config.EXPENSES_PATH, index=False)
+    """지출 변경 행만 저장한다."""
+    if _use_sqlite():
+        _save_sqlite("expenses", df)
+        return
+    _save_table(config.EXPENSES_PATH, EXPENSE_COLS, df)
+
+def _save_table(path: Path, cols: list[str], df: pd.DataFrame, backup_path: Optional[Path] = None) -> None:
+    """저장 직전 테이블과 비교해 바뀐 행만 저널에 추가하고, 저널이 길면 백그라운드에서 CSV로 압축한다.
+
+    모든 CSV 쓰기는 임시 파일 + rename으로 이루어지므로 중간에 중단되어도 파일이 사라지지 않는다.
+    """
+    new = journal.normalize_frame(df, cols)
+    with journal.lock_for(path):
+        current = read_table_cached(path, cols) if path.exists() else pd.DataFrame(columns=cols)
+        journal.save(
+            path, cols, current, new,
+            backup_path=backup_path,
+            on_compacted=lambda: invalidate_cache(path),
+            load_current=lambda: read_table_cached(path, cols),
+        )
+        invalidate_cache(path)
 
 def ensure_candidates_file() -> None:
     """후보 리스트 CSV가 없으면 표준 헤더로 생성한다."""
@@ -115,6 +225,10 @@ def normalize_candidates(df: pd.DataFrame) -> pd.DataFrame:
             df[col] = ""
     return df[CANDIDATE_COLS]
 
+def new_candidate_id() -> str:
+    """후보 장소의 고정 ID를 새로 만든다."""
+    return uuid.uuid4().hex[:12]
+
 # 날짜/시간 파싱 헬퍼
 def parse_date(raw: str) -> Optional[date]:
     """문자열에서 월/일 정보를 추출하여 date 객체로 변환한다."""
@@ -153,33 +267,324 @@ def time_bucket(t: Optional[dt_time]) -> str:
         return "오후"
     return "저녁"
 
+# 분 단위 시각 → time 객체 조회 테이블(하루 1440분)
+_MINUTE_TIMES = np.array([dt_time(m // 60, m % 60) for m in range(24 * 60)], dtype=object)
+
+def text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """컬럼을 결측 없는 문자열 Series로 반환한다(없으면 빈 문자열)."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str)
+
+def _extract_numbers(values: pd.Series, pattern: str) -> pd.DataFrame:
+    """정규식 그룹을 숫자로 추출한다. 반복되는 값은 고유값 단위로 한 번만 파싱한다."""
+    codes, uniques = pd.factorize(values)
+    parsed = pd.Series(uniques, dtype=object).str.extract(pattern).astype("float64").to_numpy()
+    if len(parsed) == 0:
+        parsed = np.empty((0, re.compile(pattern).groups))
+    return pd.DataFrame(parsed[codes], index=values.index)
+
+def parse_trip_dates(values: pd.Series) -> pd.Series:
+    """날짜 문자열들을 여행 연도의 datetime64 Series로 변환한다(parse_date와 동일 규칙, 실패 시 NaT)."""
+    day_parts = _extract_numbers(values, r"(\d{1,2})\s*/\s*(\d{1,2})")
+    return pd.to_datetime(
+        pd.DataFrame({"year": config.TRIP_YEAR, "month": day_parts[0], "day": day_parts[1]}, index=values.index),
+        errors="coerce",
+    )
+
+def _parse_minutes(values: pd.Series) -> pd.Series:
+    """시각 문자열들을 자정 기준 분(float)으로 변환한다(parse_time과 동일 규칙, 실패 시 NaN)."""
+    time_parts = _extract_numbers(values, r"(\d{1,2}):(\d{2})")
+    hours, minutes = time_parts[0], time_parts[1]
+    return (hours * 60 + minutes).where((hours < 24) & (minutes < 60))
+
+def parse_amounts(values: pd.Series) -> pd.Series:
+    """금액 문자열들을 숫자(float)로 변환한다. 천 단위 쉼표와 통화 기호/단위(원, ¥ 등)는 무시하고, 실패 시 NaN."""
+    cleaned = values.fillna("").astype(str).str.replace(",", "", regex=False)
+    return _extract_numbers(cleaned, r"(-?\d+(?:\.\d+)?)")[0]
+
+def _text_values(df: pd.DataFrame, col: str) -> list[str]:
+    """컬럼을 결측 없는 문자열 리스트로 반환한다(text_column의 작은 표용, pandas 변환 비용 없이)."""
+    if col not in df.columns:
+        return [""] * len(df)
+    return ["" if value is None or value != value else str(value) for value in df[col].tolist()]
+
+def _enrich_rows(view: pd.DataFrame) -> pd.DataFrame:
+    """작은 일정용: 파생 컬럼을 행마다 파이썬 함수로 계산한다(벡터 연산의 고정 비용이 더 큰 경우)."""
+    times = [parse_time(raw) for raw in _text_values(view, "시간")]
+    columns = {
+        "_date": [parse_date(raw) for raw in _text_values(view, "날짜")],
+        "_time": times,
+        "시간대": [time_bucket(t) for t in times],
+        "지도": [make_maps_search_link(query) for query in map_queries(view)],
+    }
+    # 컬럼을 하나씩 넣지 않고 한 번에 붙인다
+    derived = pd.DataFrame({col: pd.Series(values, index=view.index, dtype=object) for col, values in columns.items()})
+    return pd.concat([view.drop(columns=[col for col in columns if col in view.columns]), derived], axis=1)
+
+def enrich_schedule(df: pd.DataFrame) -> pd.DataFrame:
+    """일정에 _date/_time/시간대/지도 파생 컬럼을 추가한다.
+
+    parse_date, parse_time, time_bucket, choose_map_query를 행마다 적용한 결과와 동일하다.
+    ENRICH_VECTOR_MIN_ROWS행 미만이면 행 단위로, 그 이상이면 한 번의 벡터 연산으로 계산한다.
+    """
+    view = df.copy()
+    if len(view) < config.ENRICH_VECTOR_MIN_ROWS:
+        return _enrich_rows(view)
+
+    # 날짜: "3/4 (수)"에서 월/일을 추출해 여행 연도의 date로 변환(잘못된 날짜는 None)
+    dates = parse_trip_dates(text_column(view, "날짜"))
+    view["_date"] = dates.dt.date.astype(object).where(dates.notna(), None)
+
+    # 시간: HH:MM을 자정 기준 분으로 바꾼 뒤 범위를 벗어난 값은 결측 처리
+    minute_of_day = _parse_minutes(text_column(view, "시간"))
+    has_time = minute_of_day.notna().to_numpy()
+    times = np.full(len(view), None, dtype=object)
+    times[has_time] = _MINUTE_TIMES[minute_of_day.to_numpy()[has_time].astype(int)]
+    view["_time"] = pd.Series(times, index=view.index, dtype=object)
+
+    # 시간대: 12시/18시 경계로 구간화, 시각이 없으면 기타
+    buckets = pd.cut(minute_of_day, bins=[0, 12 * 60, 18 * 60, 24 * 60], right=False, labels=["오전", "오후", "저녁"])
+    view["시간대"] = buckets.astype(object).where(buckets.notna(), "기타")
+
+    # 지도 링크: 검색어가 같은 행은 링크도 한 번만 만든다
+    codes, uniques = pd.factorize(map_queries(view))
+    links = np.array([make_maps_search_link(query) for query in uniques], dtype=object)
+    view["지도"] = links[codes] if len(view) else pd.Series(dtype=object)
+    return view
+
+def map_queries(df: pd.DataFrame) -> pd.Series:
+    """행마다 choose_map_query를 적용한 지도 검색어 Series. 중복되는 (내용, 장소, 지도검색어) 조합은 한 번만 계산한다."""
+    if len(df) < config.ENRICH_VECTOR_MIN_ROWS:
+        # 작은 표는 조합을 묶는 비용이 더 크므로 행마다 바로 계산
+        triples = zip(_text_values(df, "내용"), _text_values(df, "장소"), _text_values(df, "지도검색어"))
+        return pd.Series([choose_map_query(*triple) for triple in triples], index=df.index, dtype=object)
+    keys = pd.MultiIndex.from_arrays(
+        [text_column(df, "내용"), text_column(df, "장소"), text_column(df, "지도검색어")]
+    )
+    codes, uniques = pd.factorize(keys)
+    queries = np.array([choose_map_query(*triple) for triple in uniques], dtype=object)
+    return pd.Series(queries[codes] if len(df) else [], index=df.index, dtype=object)
+
+@metrics.timed()
 def load_candidates() -> pd.DataFrame:
-    """후보 리스트 CSV를 로드하고 복구 로직을 적용한다."""
+    """후보 리스트를 로드한다. ID가 없는 예전 형식의 행이 있을 때만 ID 부여(_backfill_candidate_ids)를 거친다."""
+    df = _read_candidates()
+    if (df["id"] == "").any():
+        df = _backfill_candidate_ids()
+    return df
+
+def _read_candidates() -> pd.DataFrame:
+    """현재 백엔드에서 후보 리스트를 읽기만 한다."""
+    return _load_sqlite("candidates") if _use_sqlite() else _load_candidates_csv()
+
+def _backfill_candidate_ids() -> pd.DataFrame:
+    """ID가 없는 예전 형식의 행에 ID를 한 번 부여해 저장하고 최신 목록을 반환한다.
+
+    여러 세션이 동시에 처음 읽어도 한 세션만 쓰도록 후보 리스트 잠금 안에서 다시 읽어 확인한다.
+    """
+    with journal.lock_for(config.CANDIDATES_PATH):
+        df = _read_candidates()
+        missing = df["id"] == ""
+        if missing.any():
+            df.loc[missing, "id"] = [new_candidate_id() for _ in range(int(missing.sum()))]
+            save_candidates(df)
+            df = _read_candidates()
+    return df
+
+def _load_candidates_csv() -> pd.DataFrame:
+    """후보 리스트 CSV(+ 저널 변경분)를 로드하고 복구 로직을 적용한다."""
     # 파일이 없으면 빈 헤더로 생성
     ensure_candidates_file()
     try:
-        df = pd.read_csv(config.CANDIDATES_PATH, dtype=str).fillna("")
-        return normalize_candidates(df)
+        return read_table_cached(config.CANDIDATES_PATH, CANDIDATE_COLS)
     except Exception:
         # 원본이 깨졌을 경우 백업 파일로 복구 시도
         if config.CANDIDATES_BACKUP_PATH.exists():
             try:
-                df = pd.read_csv(config.CANDIDATES_BACKUP_PATH, dtype=str).fillna("")
-                df = normalize_candidates(df)
-                df.to_csv(config.CANDIDATES_PATH, index=False)
-                return df
+                df = journal.normalize_frame(read_csv_cached(config.CANDIDATES_BACKUP_PATH), CANDIDATE_COLS)
+                journal.write_csv_atomic(df, config.CANDIDATES_PATH)
+                invalidate_cache(config.CANDIDATES_PATH)
+                return read_table_cached(config.CANDIDATES_PATH, CANDIDATE_COLS)
             except Exception:
                 return pd.DataFrame(columns=CANDIDATE_COLS)
         return pd.DataFrame(columns=CANDIDATE_COLS)
 
+@metrics.timed()
 def save_candidates(df: pd.DataFrame) -> None:
-    """후보 리스트 CSV를 안전하게 저장한다."""
-    # 표준 스키마로 보정하여 저장 순서를 유지
+    """후보 리스트 전체를 저장한다(바뀐 행만 기록). 한 곳 추가/삭제는 add_candidate/delete_candidate를 쓴다."""
     df = normalize_candidates(df.copy())
-    # 기존 파일은 백업하여 복구 가능성을 확보
-    if config.CANDIDATES_PATH.exists():
-        shutil.copy2(config.CANDIDATES_PATH, config.CANDIDATES_BACKUP_PATH)
-    # 임시 파일에 먼저 저장 후 원자적으로 교체(손상 방지)
-    tmp_path = config.CANDIDATES_PATH.with_suffix(".tmp")
-    df.to_csv(tmp_path, index=False)
-    tmp_path.replace(config.CANDIDATES_PATH)
+    if _use_sqlite():
+        _save_sqlite("candidates", df)
+        return
+    _save_table(config.CANDIDATES_PATH, CANDIDATE_COLS, df, config.CANDIDATES_BACKUP_PATH)
+
+@metrics.timed()
+def add_candidate(name: str, link: str = "") -> str:
+    """후보 장소 하나를 추가하고 새 ID를 반환한다(기존 행은 다시 쓰지 않음)."""
+    values = {"id": new_candidate_id(), "장소명": name, "지도링크": link}
+    if _use_sqlite():
+        _ensure_migrated("candidates")
+        sqlite_store.insert_candidate(values)
+        invalidate_cache(config.SQLITE_DB_PATH)
+    else:
+        _record_candidate_op({"op": "add", "values": values})
+    return values["id"]
+
+@metrics.timed()
+def delete_candidate(candidate_id: str) -> None:
+    """ID로 후보 장소 하나를 삭제한다(다른 사람이 그 사이 목록을 바꿔도 해당 장소만 삭제)."""
+    if _use_sqlite():
+        _ensure_migrated("candidates")
+        sqlite_store.delete_candidate(candidate_id)
+        invalidate_cache(config.SQLITE_DB_PATH)
+    else:
+        _record_candidate_op({"op": "delete", "id": candidate_id})
+
+def _record_candidate_op(op: dict) -> None:
+    """후보 리스트 저널에 연산 하나를 추가한다. 저널이 길어지면 백그라운드에서 CSV로 압축한다."""
+    path = config.CANDIDATES_PATH
+    ensure_candidates_file()
+    with journal.lock_for(path):
+        journal.record(
+            path, CANDIDATE_COLS, [op],
+            backup_path=config.CANDIDATES_BACKUP_PATH,
+            on_compacted=lambda: invalidate_cache(path),
+            load_current=lambda: read_table_cached(path, CANDIDATE_COLS),
+        )
+        invalidate_cache(path)
+
+# --- 일정 조회(날짜/키워드 필터) ---
+def schedule_dates() -> list[str]:
+    """일정의 날짜 라벨을 날짜 순으로(파싱할 수 없는 라벨은 뒤로) 반환한다."""
+    if _use_sqlite():
+        _ensure_migrated("schedule")
+        return sqlite_store.schedule_dates()
+    df = load_schedule()
+    order = pd.DataFrame(
+        {"label": text_column(df, "날짜"), "date": parse_trip_dates(text_column(df, "날짜")), "minutes": _parse_minutes(text_column(df, "시간"))}
+    ).sort_values(["date", "minutes"], na_position="last", kind="stable")
+    return [label for label in order["label"].drop_duplicates() if label]
+
+@metrics.timed()
+def query_schedule(dates: Optional[list[str]] = None, keyword: str = "") -> pd.DataFrame:
+    """선택한 날짜와 키워드(내용/장소/구분/지도검색어 부분 일치, 대소문자 무시)로 일정을 거른다.
+
+    SQLite 백엔드에서는 필터가 SQL로, CSV 백엔드에서는 n-그램 검색 색인으로 처리된다.
+    키워드는 정규식이 아닌 문자 그대로 검색한다. CSV 백엔드는 전각/반각과 대소문자를 통일(NFKC + casefold)해 비교하고,
+    SQLite 백엔드의 LIKE는 ASCII 대소문자만 무시한다.
+    """
+    if _use_sqlite():
+        _ensure_migrated("schedule")
+        return sqlite_store.query_schedule(dates, keyword)
+    df, index = _schedule_with_index()
+    if keyword:
+        df = df.iloc[search_index.search(index, keyword)]
+    if dates:
+        df = df[df["날짜"].isin(dates)]
+    return df
+
+def similar_schedule(keyword: str, dates: Optional[list[str]] = None, limit: int = 5) -> pd.DataFrame:
+    """오타 등으로 정확히 일치하는 일정이 없을 때, 키워드와 비슷한 일정을 비슷한 순으로 반환한다."""
+    df, index = _schedule_with_index()
+    df = df.iloc[search_index.similar(index, keyword, limit=len(df))]
+    if dates:
+        df = df[df["날짜"].isin(dates)]
+    return df.head(limit)
+
+# 일정 검색 색인: (테이블 서명, 색인). 일정 파일(CSV/저널/DB)이 바뀔 때만 다시 만든다.
+_schedule_index: Optional[tuple[tuple, dict]] = None
+_schedule_index_lock = threading.Lock()
+
+def _schedule_with_index() -> tuple[pd.DataFrame, dict]:
+    """일정 테이블과, 같은 시점의 테이블로 만든 검색 색인을 함께 반환한다."""
+    global _schedule_index
+    if _use_sqlite():
+        _ensure_migrated("schedule")
+        db_signature = _file_signature(config.SQLITE_DB_PATH)
+        signature = None if db_signature is None else ("sqlite", db_signature)
+        df = load_schedule()
+    else:
+        ensure_data_file()
+        # 서명 확인과 로드가 같은 잠금 안에서 이루어져야 색인과 테이블이 어긋나지 않는다
+        with journal.lock_for(config.SCHEDULE_PATH):
+            signature = _table_signature(config.SCHEDULE_PATH)
+            df = load_schedule()
+    with _schedule_index_lock:
+        entry = _schedule_index
+    if entry is not None and signature is not None and entry[0] == signature:
+        return df, entry[1]
+    index = search_index.build_index(df)
+    if signature is not None:
+        with _schedule_index_lock:
+            _schedule_index = (signature, index)
+    return df, index
+
+# --- SQLite 백엔드 ---
+# 테이블 이름 → (CSV 경로, 표준 컬럼, CSV 로더)
+def _csv_tables() -> dict:
+    return {
+        "schedule": (config.SCHEDULE_PATH, config.EXPECTED_COLS, _load_schedule_csv),
+        "expenses": (config.EXPENSES_PATH, EXPENSE_COLS, _load_expenses_csv),
+        "candidates": (config.CANDIDATES_PATH, CANDIDATE_COLS, _load_candidates_csv),
+    }
+
+# 이번 프로세스에서 마이그레이션 여부를 이미 확인한 테이블
+_migrated_tables: set[str] = set()
+
+def _typed_columns(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """SQLite 타입 컬럼(날짜 키/분 단위 시각/금액) 값을 계산한다."""
+    typed = pd.DataFrame(index=df.index)
+    if table in ("schedule", "expenses"):
+        dates = parse_trip_dates(text_column(df, "날짜"))
+        typed["date_key"] = dates.dt.strftime("%Y-%m-%d").where(dates.notna(), None)
+    if table == "schedule":
+        typed["time_minutes"] = _parse_minutes(text_column(df, "시간"))
+    if table == "expenses":
+        typed["amount"] = parse_amounts(text_column(df, "금액"))
+    return typed
+
+def _ensure_migrated(table: str) -> None:
+    """SQLite 테이블이 아직 비어 있으면 기존 CSV에서 한 번 가져온다."""
+    if table in _migrated_tables:
+        return
+    if not sqlite_store.is_migrated(table):
+        import_csv_to_sqlite([table])
+    _migrated_tables.add(table)
+
+def _load_sqlite(table: str) -> pd.DataFrame:
+    """SQLite 테이블을 읽는다(DB 파일이 그대로면 캐시 사용)."""
+    _ensure_migrated(table)
+    return _cached_frame(
+        (f"sqlite:{table}", config.SQLITE_DB_PATH),
+        _file_signature(config.SQLITE_DB_PATH),
+        lambda: sqlite_store.load(table),
+    )
+
+def _save_sqlite(table: str, df: pd.DataFrame) -> None:
+    """바뀐 행만 SQLite에 반영한다."""
+    cols = sqlite_store.df_columns(table)
+    new = journal.normalize_frame(df, cols)
+    current = _load_sqlite(table)
+    sqlite_store.save(table, current, new, _typed_columns(table, new))
+    invalidate_cache(config.SQLITE_DB_PATH)
+
+def import_csv_to_sqlite(tables: Optional[list[str]] = None) -> None:
+    """CSV 데이터를 SQLite로 가져온다(대상 테이블의 기존 행은 CSV 내용으로 교체)."""
+    for table, (_, cols, load_csv) in _csv_tables().items():
+        if tables is not None and table not in tables:
+            continue
+        new = journal.normalize_frame(load_csv(), cols)
+        current = journal.normalize_frame(sqlite_store.load(table), cols)
+        sqlite_store.save(table, current, new, _typed_columns(table, new))
+        sqlite_store.mark_migrated(table)
+    invalidate_cache(config.SQLITE_DB_PATH)
+
+def export_sqlite_to_csv(tables: Optional[list[str]] = None) -> None:
+    """SQLite 데이터를 CSV 파일로 내보낸다(임시 파일 + rename, 남은 저널은 정리)."""
+    for table, (path, cols, _) in _csv_tables().items():
+        if tables is not None and table not in tables:
+            continue
+        with journal.lock_for(path):
+            journal.compact(path, cols, journal.normalize_frame(sqlite_store.load(table), cols))
+        invalidate_cache(path)
@@ -0,0 +1,197 @@
+"""날짜별 환율표를 관리하고 지출 내역을 원화/엔화로 한 번에 환산하는 유틸리티.
+
+환율표는 {날짜: {통화: 1단위당 원화}} 형태로 data/cache/exchange_rates.json에 저장된다(swr_cache).
+최신 환율은 TTL이 지나면 백그라운드에서 갱신하고, 지출 내역에 있는 과거 날짜의 환율은 그 기간을 백그라운드에서 한 번 받아 보관한다.
+네트워크가 없으면 마지막으로 받은 환율(없으면 고정 환율)을 쓰고, 실패 후 잠시 동안은 다시 호출하지 않는다.
+환율 제공 함수(provider)는 set_provider로 교체할 수 있다(테스트용 로컬 대체 함수 등).
+"""
+
+from datetime import date
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+import requests
+
+import config
+from utils import data_manager, swr_cache
+
+RATES_URL = "https://api.frankfurter.app"
+
+# 환율 제공 함수: (기준 날짜 "YYYY-MM-DD", {통화: 1단위당 원화})를 반환하고, 실패하면 예외를 던진다.
+Provider = Callable[[], tuple[str, dict[str, float]]]
+# 기간 환율 제공 함수: (시작일, 종료일) → {날짜: {통화: 1단위당 원화}}, 실패하면 예외를 던진다.
+HistoryProvider = Callable[[str, str], dict[str, dict[str, float]]]
+
+# 통화 표기 → 통화 코드
+CURRENCY_ALIASES = {"¥": "JPY", "￥": "JPY", "円": "JPY", "엔": "JPY", "₩": "KRW", "원": "KRW"}
+
+# 연결을 재사용하는 공유 HTTP 세션
+_session = requests.Session()
+
+_provider: Optional[Provider] = None
+_history_provider: Optional[HistoryProvider] = None
+
+def _request_rates(path: str) -> dict:
+    """Frankfurter(ECB 기준환율) API에서 원화 기준 환율 응답을 받는다(값은 1원당 외화)."""
+    targets = [c for c in config.CURRENCIES if c != "KRW"]
+    response = _session.get(
+        f"{RATES_URL}/{path}", params={"from": "KRW", "to": ",".join(targets)}, timeout=config.EXCHANGE_RATE_TIMEOUT_SEC
+    )
+    response.raise_for_status()
+    return response.json()
+
+def _krw_per_unit(rates: dict) -> dict[str, float]:
+    """1원당 외화 값을 역수로 바꿔 통화 1단위당 원화로 만든다."""
+    return {currency: 1 / float(value) for currency, value in rates.items() if float(value) > 0}
+
+def frankfurter_provider() -> tuple[str, dict[str, float]]:
+    """Frankfurter API로 최신 환율을 받아 1단위당 원화로 변환한다."""
+    payload = _request_rates("latest")
+    rates = _krw_per_unit(payload["rates"])
+    if not rates:
+        raise ValueError("응답에 환율 데이터가 없습니다.")
+    return payload["date"], rates
+
+def frankfurter_history_provider(start: str, end: str) -> dict[str, dict[str, float]]:
+    """Frankfurter API로 기간(영업일별) 환율을 받아 날짜별 1단위당 원화로 변환한다."""
+    payload = _request_rates(f"{start}..{end}")
+    history = {rate_date: _krw_per_unit(rates) for rate_date, rates in payload["rates"].items()}
+    return {rate_date: rates for rate_date, rates in history.items() if rates}
+
+def set_provider(provider: Optional[Provider], history: Optional[HistoryProvider] = None) -> None:
+    """최신/기간 환율 제공 함수를 교체한다. None이면 기본값(Frankfurter API)으로 돌아간다."""
+    global _provider, _history_provider
+    _provider, _history_provider = provider, history
+
+def _fetch_latest() -> dict:
+    """최신 환율을 받아 환율표 갱신분({"rates": {날짜: 환율}, "covered": []})으로 만든다."""
+    rate_date, rates = (_provider or frankfurter_provider)()
+    return {"rates": {rate_date: rates}, "covered": []}
+
+def _merge(current: Optional[dict], fetched: dict) -> dict:
+    """받아온 환율을 날짜별 표에 합치고, 받아 둔 기간 목록을 늘린다."""
+    current = current or {"rates": {}, "covered": []}
+    table = dict(current["rates"])
+    for rate_date, rates in fetched["rates"].items():
+        table[rate_date] = {**table.get(rate_date, {}), **rates}
+    return {"rates": table, "covered": [*current["covered"], *fetched["covered"]]}
+
+# 프로세스 전역 환율표(모든 세션이 공유): {"rates": {날짜: {통화: 1단위당 원화}}, "covered": 기간 환율을 받아 둔 [시작일, 종료일] 목록}
+_cache = swr_cache.create(
+    "Exchange rate", lambda: config.EXCHANGE_RATES_PATH, "table", _fetch_latest,
+    ttl_sec=config.EXCHANGE_RATE_TTL_SEC, retry_sec=config.EXCHANGE_RATE_RETRY_SEC, merge=_merge,
+)
+
+def _cached() -> dict:
+    """환율표 캐시 값을 반환한다. 받아온 적이 없고 네트워크도 안 되면 빈 표."""
+    return swr_cache.get(_cache) or {"rates": {}, "covered": []}
+
+def rate_table() -> dict[str, dict[str, float]]:
+    """날짜별 환율표를 반환한다. 받아온 적이 없고 네트워크도 안 되면 빈 dict.
+
+    TTL이 지났으면 기존 표를 바로 반환하면서 백그라운드에서 갱신하고, 표가 전혀 없을 때만 응답을 기다린다.
+    실패하면 EXCHANGE_RATE_RETRY_SEC 동안 다시 호출하지 않는다.
+    """
+    return _cached()["rates"]
+
+def history_table(start: str, end: str) -> dict[str, dict[str, float]]:
+    """start~end(YYYY-MM-DD) 기간의 환율을 쓰는 날짜별 환율표를 반환한다(응답을 기다리지 않음).
+
+    받아 둔 적 없는 기간이면 백그라운드에서 그 기간을 받기 시작하고, 끝날 때까지는 지금 있는 표(최신 환율)를 반환한다.
+    과거 환율은 바뀌지 않으므로 한 번 받은 기간은 다시 받지 않으며, 실패한 기간은 EXCHANGE_RATE_RETRY_SEC 동안 다시 시도하지 않는다.
+    """
+    cached = _cached()
+    # 미래 날짜의 환율은 없으므로 오늘까지만 요청
+    end = min(end, date.today().isoformat())
+    if start <= end and not any(lo <= start and end <= hi for lo, hi in cached["covered"]):
+        provider = _history_provider or frankfurter_history_provider
+        swr_cache.refresh_in_background(
+            _cache, f"{start}..{end}", lambda: {"rates": provider(start, end), "covered": [[start, end]]}
+        )
+    return cached["rates"]
+
+def fetching_history() -> bool:
+    """지출 날짜의 과거 환율을 백그라운드에서 받는 중인지 여부."""
+    return any(job != swr_cache.LATEST for job in swr_cache.running_jobs(_cache))
+
+def latest_rate(currency: str = "JPY") -> tuple[float, Optional[str]]:
+    """통화 1단위당 원화와 그 환율의 기준 날짜를 반환한다. 환율이 없으면 (고정 환율, None)."""
+    table = rate_table()
+    for rate_date in sorted(table, reverse=True):
+        if currency in table[rate_date]:
+            return float(table[rate_date][currency]), rate_date
+    if currency == "KRW":
+        return 1.0, None
+    return config.FALLBACK_KRW_PER_JPY if currency == "JPY" else float("nan"), None
+
+def normalize_currencies(currencies: pd.Series, amounts: pd.Series) -> pd.Series:
+    """통화 컬럼을 통화 코드로 정리한다. 비어 있으면 금액 표기(¥, 원 등)로 추정하고, 없으면 기본 통화."""
+    codes, uniques = pd.factorize(currencies.astype(str).str.strip())
+    cleaned = np.array([CURRENCY_ALIASES.get(value, value.upper()) for value in uniques], dtype=object)
+    result = pd.Series(cleaned[codes] if len(codes) else [], index=currencies.index, dtype=object)
+
+    blank = result == ""
+    if blank.any():
+        amount_text = amounts[blank].astype(str)
+        inferred = pd.Series(config.DEFAULT_EXPENSE_CURRENCY, index=amount_text.index, dtype=object)
+        for mark, code in CURRENCY_ALIASES.items():
+            inferred = inferred.mask(amount_text.str.contains(mark, regex=False), code)
+        result[blank] = inferred
+    return result
+
+def _rate_frame(table: dict[str, dict[str, float]]) -> pd.DataFrame:
+    """환율표를 날짜 순 DataFrame(_rate_date + 통화별 1단위당 원화)으로 만든다. 표가 없으면 고정 환율 한 줄."""
+    if not table:
+        table = {"": {"JPY": config.FALLBACK_KRW_PER_JPY}}
+    frame = pd.DataFrame.from_dict(table, orient="index").astype("float64")
+    frame["KRW"] = 1.0
+    # 어떤 날짜에 빠진 통화는 가까운 날짜의 환율로 채운다
+    frame = frame.sort_index().ffill().bfill()
+    frame["_rate_date"] = pd.to_datetime(frame.index, errors="coerce")
+    frame["_rate_date"] = frame["_rate_date"].fillna(pd.Timestamp.now().normalize())
+    return frame.sort_values("_rate_date").reset_index(drop=True)
+
+def convert_ledger(df: pd.DataFrame, table: Optional[dict] = None) -> pd.DataFrame:
+    """지출 내역 전체를 한 번의 벡터 연산으로 원화(KRW)/엔화(JPY)로 환산한 컬럼을 붙여 반환한다.
+
+    각 행은 지출 날짜와 가장 가까운 날짜의 환율을 쓴다(날짜를 읽을 수 없으면 최신 환율).
+    table을 주지 않으면 지출 날짜 범위의 환율표를 쓴다(주말/공휴일은 가까운 영업일 환율).
+    그 기간을 아직 받지 못했으면 받는 동안에는 지금 있는 환율(최신 환율)로 환산한다.
+    통화는 '통화' 컬럼을 정리한 값으로 채우며, 환산할 수 없는 금액/통화는 NaN.
+    """
+    result = df.copy()
+    amount_text = data_manager.text_column(result, "금액")
+    amounts = data_manager.parse_amounts(amount_text)
+    currencies = normalize_currencies(data_manager.text_column(result, "통화"), amount_text)
+    result["통화"] = currencies
+
+    dates = data_manager.parse_trip_dates(data_manager.text_column(result, "날짜"))
+    if table is None:
+        known = dates.dropna()
+        if known.empty:
+            table = rate_table()
+        else:
+            table = history_table(known.min().date().isoformat(), known.max().date().isoformat())
+    rates = _rate_frame(table)
+    # 날짜가 없는 행은 최신 환율 날짜로 간주
+    dates = dates.fillna(rates["_rate_date"].iloc[-1]).astype("datetime64[ns]")
+    order = np.argsort(dates.to_numpy(), kind="stable")
+    matched = pd.merge_asof(
+        pd.DataFrame({"_date": dates.to_numpy()[order], "_pos": order}),
+        rates.assign(_rate_date=rates["_rate_date"].astype("datetime64[ns]")),
+        left_on="_date", right_on="_rate_date", direction="nearest",
+    ).sort_values("_pos")
+
+    # 행마다 자기 통화 컬럼의 환율을 고른다(모르는 통화는 NaN)
+    rate_columns = [c for c in rates.columns if c != "_rate_date"]
+    rate_matrix = np.column_stack([matched[rate_columns].to_numpy(dtype="float64"), np.full(len(matched), np.nan)])
+    column_idx = pd.Index(rate_columns).get_indexer(currencies.to_numpy())
+    column_idx[column_idx < 0] = len(rate_columns)
+    krw_per_unit = rate_matrix[np.arange(len(matched)), column_idx]
+    krw_per_jpy = matched["JPY"].to_numpy(dtype="float64") if "JPY" in matched else np.full(len(matched), np.nan)
+
+    krw = amounts.to_numpy(dtype="float64") * krw_per_unit
+    result["KRW"] = krw
+    result["JPY"] = krw / krw_per_jpy
+    return result
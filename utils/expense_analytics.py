@@ -0,0 +1,235 @@
+"""지출 내역 집계(일별/항목별/결제자별)와 인원별 정산 계획을 계산하는 유틸리티.
+
+금액은 한 번만 숫자로 변환해 두고, 이후 표가 바뀌면 바뀐 행의 기여분만 빼고 더해 집계를 갱신한다.
+집계 상태는 프로세스 전역으로 하나만 두며, 직전 계산과 비교한 변경 행이 많으면 처음부터 다시 계산한다.
+"""
+
+import threading
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from utils import data_manager
+
+# 집계 이름 → 묶음 기준 컬럼
+GROUP_COLUMNS = {"daily": "날짜", "category": "항목", "payer": "결제자"}
+
+# 비교/집계에 쓰는 지출 원본 컬럼
+_SOURCE_COLS = ["날짜", "항목", "금액", "결제자"]
+
+# 정확한 최소 송금 횟수를 계산하는 최대 인원(2^n 탐색). 넘으면 큰 금액부터 맞추는 방식 사용
+_EXACT_SETTLEMENT_MAX_PEOPLE = 12
+
+# 직전 계산 상태: 원본 값 프레임, 행별 타입 프레임, 집계별 {묶음: [합계, 건수]}, 금액을 읽을 수 없는 행 수
+_state: dict = {"source": None, "typed": None, "groups": None, "invalid": 0}
+_state_lock = threading.Lock()
+
+def _numeric_amounts(df: pd.DataFrame) -> bool:
+    """금액 컬럼이 이미 숫자(환산 금액 등)인지 여부."""
+    return "금액" in df.columns and pd.api.types.is_numeric_dtype(df["금액"])
+
+def _amounts(df: pd.DataFrame) -> pd.Series:
+    """금액 컬럼을 float Series로 반환한다. 이미 숫자면 그대로 쓰고, 문자열일 때만 파싱한다."""
+    if _numeric_amounts(df):
+        return df["금액"].astype("float64")
+    return data_manager.parse_amounts(data_manager.text_column(df, "금액"))
+
+def _source_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """비교용 원본 값 프레임(결측 없는 문자열, 숫자 금액은 그대로, 위치 기준 인덱스)."""
+    source = pd.DataFrame(
+        {col: df[col] if col == "금액" and _numeric_amounts(df) else data_manager.text_column(df, col) for col in _SOURCE_COLS}
+    )
+    return source.reset_index(drop=True)
+
+def typed_ledger(df: pd.DataFrame) -> pd.DataFrame:
+    """지출 표를 집계용 타입 프레임(날짜/항목/결제자 문자열 + 숫자 금액)으로 변환한다."""
+    typed = pd.DataFrame(
+        {col: data_manager.text_column(df, col).str.strip() for col in GROUP_COLUMNS.values()}
+    )
+    typed["금액"] = _amounts(df).to_numpy()
+    return typed.reset_index(drop=True)
+
+def _count_invalid(typed: pd.DataFrame) -> int:
+    """금액을 읽을 수 없지만 빈 행은 아닌 행 수."""
+    return int((typed["금액"].isna() & ((typed["항목"] != "") | (typed["결제자"] != ""))).sum())
+
+def _aggregate(typed: pd.DataFrame) -> dict[str, dict[str, list]]:
+    """집계별 {묶음: [합계, 건수]}를 벡터 groupby로 만든다. 금액을 읽을 수 없는 행은 제외한다."""
+    valid = typed[typed["금액"].notna()]
+    groups = {}
+    for name, col in GROUP_COLUMNS.items():
+        grouped = valid.groupby(col, sort=False)["금액"].agg(["sum", "size"])
+        groups[name] = {key: [total, count] for key, total, count in zip(grouped.index, grouped["sum"], grouped["size"])}
+    return groups
+
+def _apply_delta(groups: dict, removed: pd.DataFrame, added: pd.DataFrame) -> None:
+    """바뀌기 전 행의 기여분을 빼고 바뀐 뒤 행의 기여분을 더한다(바뀐 행 수에 비례)."""
+    for rows, sign in ((removed, -1), (added, 1)):
+        valid = rows[rows["금액"].notna()]
+        amounts = valid["금액"].tolist()
+        for name, col in GROUP_COLUMNS.items():
+            group = groups[name]
+            for key, amount in zip(valid[col].tolist(), amounts):
+                entry = group.setdefault(key, [0.0, 0])
+                entry[0] += sign * amount
+                entry[1] += sign
+                # 행이 모두 빠진 묶음은 제거
+                if entry[1] == 0:
+                    del group[key]
+
+def _update(df: pd.DataFrame) -> tuple[dict, int]:
+    """직전 계산과 비교해 집계 상태를 갱신하고 (집계, 금액을 읽을 수 없는 행 수)를 반환한다."""
+    source = _source_frame(df)
+    with _state_lock:
+        old_source, old_typed = _state["source"], _state["typed"]
+        if old_source is not None and old_source.equals(source):
+            return _state["groups"], _state["invalid"]
+
+        changed = None
+        if old_source is not None:
+            shared = min(len(old_source), len(source))
+            old_head, new_head = old_source.iloc[:shared], source.iloc[:shared]
+            # 숫자 금액의 NaN끼리는 같은 값으로 본다
+            differs = old_head.ne(new_head) & ~(old_head.isna() & new_head.isna())
+            changed = np.flatnonzero(differs.any(axis=1).to_numpy())
+            # 늘거나 줄어든 행도 변경으로 본다. 변경이 절반을 넘으면 처음부터 다시 계산
+            changed_count = len(changed) + abs(len(source) - len(old_source))
+            if changed_count > max(len(source), len(old_source)) // 2:
+                changed = None
+
+        if changed is None:
+            typed = typed_ledger(df)
+            groups = _aggregate(typed)
+            invalid = _count_invalid(typed)
+        else:
+            new_rows = np.concatenate([changed, np.arange(shared, len(source))]).astype(int)
+            old_rows = np.concatenate([changed, np.arange(shared, len(old_source))]).astype(int)
+            added = typed_ledger(df.iloc[new_rows])
+            removed = old_typed.iloc[old_rows]
+            # 도중에 실패해도 이전 상태가 망가지지 않도록 복사본을 갱신(묶음 수만큼의 비용)
+            groups = {name: {key: list(entry) for key, entry in group.items()} for name, group in _state["groups"].items()}
+            _apply_delta(groups, removed, added)
+            invalid = _state["invalid"] - _count_invalid(removed) + _count_invalid(added)
+            typed = old_typed.iloc[:len(source)].copy()
+            if len(source) > len(typed):
+                typed = pd.concat([typed, added.iloc[len(changed):]], ignore_index=True)
+            for col in typed.columns:
+                typed.iloc[changed, typed.columns.get_loc(col)] = added[col].iloc[:len(changed)].to_numpy()
+
+        _state.update(source=source, typed=typed, groups=groups, invalid=invalid)
+        return groups, invalid
+
+def _group_frame(group: dict[str, list]) -> pd.DataFrame:
+    """{묶음: [합계, 건수]}를 합계/건수 DataFrame으로 바꾼다."""
+    frame = pd.DataFrame.from_dict(group, orient="index", columns=["합계", "건수"])
+    return frame.astype({"합계": "float64", "건수": "int64"})
+
+def _date_sort_key(label: str) -> tuple:
+    """날짜 라벨 정렬 키(날짜 순, 읽을 수 없는 라벨은 뒤로)."""
+    parsed = data_manager.parse_date(label)
+    return (parsed is None, parsed or date.min, label)
+
+def summarize(df: Optional[pd.DataFrame] = None) -> dict:
+    """지출 합계와 일별/항목별/결제자별 집계를 반환한다(df가 없으면 저장된 지출 사용).
+
+    반환값: total, count, invalid(금액을 읽을 수 없는 행 수), daily/category/payer(합계·건수 DataFrame).
+    """
+    if df is None:
+        df = data_manager.load_expenses()
+    groups, invalid = _update(df)
+    daily = _group_frame(groups["daily"])
+    # 표시용: 일별은 날짜 순, 나머지는 금액이 큰 순
+    return {
+        "total": float(daily["합계"].sum()),
+        "count": int(daily["건수"].sum()),
+        "invalid": invalid,
+        "daily": daily.loc[sorted(daily.index, key=_date_sort_key)],
+        "category": _group_frame(groups["category"]).sort_values("합계", ascending=False),
+        "payer": _group_frame(groups["payer"]).sort_values("합계", ascending=False),
+    }
+
+def _zero_sum_chain(balances: list[int]) -> list[int]:
+    """잔액 합이 0인 부분집합으로 최대한 많이 나누는 순서를 비트마스크 DP로 구한다.
+
+    반환하는 인덱스 순서대로 앞에서부터 누적합이 0이 되는 지점마다 한 묶음이 끝난다.
+    묶음마다 (인원 - 1)번 송금하면 되므로, 묶음이 많을수록 송금 횟수가 줄어든다.
+    """
+    n = len(balances)
+    full = (1 << n) - 1
+    sums = [0] * (full + 1)
+    best = [0] * (full + 1)
+    last = [0] * (full + 1)
+    for mask in range(1, full + 1):
+        low = (mask & -mask).bit_length() - 1
+        sums[mask] = sums[mask & (mask - 1)] + balances[low]
+        for i in range(n):
+            if mask >> i & 1:
+                prev = best[mask ^ (1 << i)]
+                if last[mask] == 0 or prev > best[mask]:
+                    best[mask], last[mask] = prev, i + 1
+        if sums[mask] == 0:
+            best[mask] += 1
+    order = []
+    mask = full
+    while mask:
+        i = last[mask] - 1
+        order.append(i)
+        mask ^= 1 << i
+    return order[::-1]
+
+def _settle_group(people: list[str], balances: dict[str, int]) -> list[dict]:
+    """잔액 합이 0인 묶음 안에서 큰 금액끼리 맞춰 송금 목록을 만든다(인원 - 1번 이하)."""
+    creditors = sorted(((balances[p], p) for p in people if balances[p] > 0), reverse=True)
+    debtors = sorted(((-balances[p], p) for p in people if balances[p] < 0), reverse=True)
+    transfers = []
+    ci = di = 0
+    while ci < len(creditors) and di < len(debtors):
+        credit, creditor = creditors[ci]
+        debt, debtor = debtors[di]
+        amount = min(credit, debt)
+        transfers.append({"보내는 사람": debtor, "받는 사람": creditor, "금액": amount})
+        creditors[ci] = (credit - amount, creditor)
+        debtors[di] = (debt - amount, debtor)
+        if creditors[ci][0] == 0:
+            ci += 1
+        if debtors[di][0] == 0:
+            di += 1
+    return transfers
+
+def settlement_plan(paid: pd.Series, members: Optional[list[str]] = None) -> tuple[pd.DataFrame, list[dict]]:
+    """인원별 낸 금액으로 똑같이 나눠 낼 때의 송금 계획을 최소 송금 횟수로 만든다.
+
+    paid는 결제자별 합계 Series, members는 정산에 참여하는 인원(기본값: 결제자 전원).
+    금액은 원 단위 정수로 계산하며, 나누어떨어지지 않는 나머지는 앞사람부터 1씩 더 부담한다.
+    반환값: (인원별 낸 금액/부담액/잔액 표, [{"보내는 사람", "받는 사람", "금액"}, ...])
+    """
+    people = list(dict.fromkeys([*(members or []), *[p for p in paid.index if p]]))
+    paid_int = {p: int(round(float(paid.get(p, 0)))) for p in people}
+    total = sum(paid_int.values())
+    if not people:
+        return pd.DataFrame(columns=["낸 금액", "부담액", "잔액"]), []
+    share, remainder = divmod(total, len(people))
+    shares = {p: share + (1 if i < remainder else 0) for i, p in enumerate(people)}
+    balances = {p: paid_int[p] - shares[p] for p in people}
+    table = pd.DataFrame({"낸 금액": paid_int, "부담액": shares, "잔액": balances})
+
+    # 잔액이 0이 아닌 인원만 송금 대상
+    open_people = [p for p in people if balances[p] != 0]
+    if len(open_people) <= _EXACT_SETTLEMENT_MAX_PEOPLE:
+        order = [open_people[i] for i in _zero_sum_chain([balances[p] for p in open_people])]
+        groups, group, running = [], [], 0
+        for person in order:
+            group.append(person)
+            running += balances[person]
+            if running == 0:
+                groups.append(group)
+                group = []
+    else:
+        groups = [open_people]
+
+    transfers = []
+    for group in groups:
+        transfers.extend(_settle_group(group, balances))
+    return table, transfers
@@ -0,0 +1,65 @@
+"""용량 제한이 있는 파일 기반 바이트 캐시(API 응답 재사용용)."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import config
+
+# 같은 네임스페이스의 축출이 동시에 돌지 않도록 보호
+_evict_lock = threading.Lock()
+
+def make_key(*parts) -> str:
+    """캐시 키 구성 요소들을 SHA-256 해시 문자열로 만든다."""
+    payload = json.dumps([p if isinstance(p, str) else repr(p) for p in parts], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _namespace_dir(namespace: str) -> Path:
+    path = config.CACHE_DIR / namespace
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def get(namespace: str, key: str) -> Optional[bytes]:
+    """캐시된 바이트를 반환하고, LRU 판단을 위해 수정 시각을 현재로 갱신한다."""
+    path = _namespace_dir(namespace) / key
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+    except OSError:
+        return None
+    return data
+
+def put(namespace: str, key: str, data: bytes, max_bytes: int) -> None:
+    """바이트를 저장하고, 네임스페이스 총 용량이 max_bytes를 넘으면 오래된 파일부터 지운다."""
+    directory = _namespace_dir(namespace)
+    path = directory / key
+    try:
+        # 임시 파일에 먼저 저장 후 교체(동시 저장/중단 시 손상 방지)
+        tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    except OSError:
+        return
+    _evict(directory, max_bytes)
+
+def _evict(directory: Path, max_bytes: int) -> None:
+    """최근 사용 시각이 오래된 순으로 파일을 지워 총 용량을 max_bytes 이하로 맞춘다."""
+    with _evict_lock:
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, file_path in sorted(files):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(file_path)
+                total -= size
+            except OSError:
+                pass
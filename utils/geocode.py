@@ -0,0 +1,181 @@
+"""지도 검색어를 위경도로 바꾸고, 결과를 data/geocode.json에 저장해 재사용하는 유틸리티.
+
+한 번 변환한 검색어는 파일에서 바로 읽으므로 이후에는 네트워크 없이 지도를 그린다.
+찾을 수 없는 장소는 null로 저장해 다시 조회하지 않으며, 파일을 직접 고쳐 좌표를 넣을 수도 있다.
+변환 함수(resolver)는 set_resolver로 교체할 수 있다(테스트용 로컬 대체 함수 등).
+새 장소는 resolve_in_background로 백그라운드 스레드에서 동시에 조회하므로 화면 렌더링을 막지 않는다.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
+
+import requests
+
+import config
+from utils import swr_cache
+
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+# 검색어 → (위도, 경도) 또는 None(찾을 수 없음)을 반환하는 함수. 일시적 오류는 예외로 알린다.
+Resolver = Callable[[str], Optional[tuple[float, float]]]
+
+# 연결을 재사용하는 공유 HTTP 세션
+_session = requests.Session()
+
+# 프로세스 전역 좌표표: 파일 서명이 바뀌면 다시 읽는다
+_table: dict[str, Optional[list[float]]] = {}
+_table_signature: Optional[tuple[int, int]] = None
+_table_lock = threading.Lock()
+_resolver: Optional[Resolver] = None
+# 변환 API 실패 시각(잠시 재시도하지 않아 매 화면마다 지연되지 않도록)
+_last_failure = 0.0
+# 백그라운드에서 조회 중인 검색어(같은 장소를 여러 세션이 중복 조회하지 않도록)
+_resolving: set[str] = set()
+
+def google_resolver(query: str) -> Optional[tuple[float, float]]:
+    """Google Geocoding API로 검색어의 좌표를 찾는다."""
+    response = _session.get(
+        GEOCODE_URL,
+        params={"address": query, "key": config.GOOGLE_MAPS_API_KEY, "language": "ko", "region": "jp"},
+        timeout=config.GEOCODE_TIMEOUT_SEC,
+    )
+    response.raise_for_status()
+    payload = response.json()
+    status = payload.get("status")
+    if status == "ZERO_RESULTS":
+        return None
+    if status != "OK":
+        raise RuntimeError(f"Geocoding API status: {status} {payload.get('error_message', '')}".strip())
+    location = payload["results"][0]["geometry"]["location"]
+    return float(location["lat"]), float(location["lng"])
+
+def set_resolver(resolver: Optional[Resolver]) -> None:
+    """좌표 변환 함수를 교체한다. None이면 기본값(API 키가 있을 때 Google Geocoding)으로 돌아간다."""
+    global _resolver, _last_failure
+    _resolver = resolver
+    _last_failure = 0.0
+
+def _current_resolver() -> Optional[Resolver]:
+    if _resolver is not None:
+        return _resolver
+    return google_resolver if config.GOOGLE_MAPS_API_KEY else None
+
+def _file_signature() -> Optional[tuple[int, int]]:
+    try:
+        stat = config.GEOCODE_PATH.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _load_table() -> dict[str, Optional[list[float]]]:
+    """좌표표 파일이 바뀌었으면 다시 읽어 메모리 표를 갱신한다(호출자가 잠금 보유)."""
+    global _table, _table_signature
+    signature = _file_signature()
+    if signature != _table_signature:
+        try:
+            loaded = json.loads(config.GEOCODE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            loaded = {}
+        _table = loaded if isinstance(loaded, dict) else {}
+        _table_signature = signature
+    return _table
+
+def _save_table(table: dict) -> None:
+    """좌표표를 임시 파일에 쓴 뒤 교체하고 메모리 표도 갱신한다(호출자가 잠금 보유)."""
+    global _table, _table_signature
+    _table = table
+    try:
+        # 직접 고치기 쉽도록 한 줄에 장소 하나씩 기록
+        lines = [f"  {json.dumps(query, ensure_ascii=False)}: {json.dumps(table[query])}" for query in sorted(table)]
+        swr_cache.write_text_atomic(config.GEOCODE_PATH, "{\n" + ",\n".join(lines) + "\n}\n")
+        _table_signature = _file_signature()
+    except OSError as e:
+        print(f"Geocode table write error: {e}")
+
+def _coords(value) -> Optional[tuple[float, float]]:
+    """저장된 값을 (위도, 경도)로 바꾼다. 형식이 맞지 않으면 None."""
+    try:
+        lat, lon = value
+        return float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+
+def _resolve(queries: list[str], resolver: Resolver) -> dict[str, Optional[list[float]]]:
+    """검색어들을 GEOCODE_MAX_WORKERS개까지 동시에 조회해 좌표표에 저장하고 결과를 반환한다.
+
+    일시적 오류가 나면 아직 시작하지 않은 조회는 취소하고 GEOCODE_RETRY_SEC 동안 다시 시도하지 않는다.
+    """
+    global _last_failure
+    resolved = {}
+    workers = max(1, min(len(queries), config.GEOCODE_MAX_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geocode") as pool:
+        futures = {pool.submit(resolver, query): query for query in queries}
+        for future in as_completed(futures):
+            query = futures[future]
+            try:
+                coords = future.result()
+            except Exception as e:
+                # 일시적 오류는 저장하지 않고 나중에 다시 시도
+                print(f"Geocode error ({query}): {e}")
+                _last_failure = time.time()
+                for pending in futures:
+                    pending.cancel()
+                continue
+            resolved[query] = list(coords) if coords else None
+    if resolved:
+        with _table_lock:
+            # 다른 세션이 그 사이 저장한 내용과 합쳐서 쓴다
+            _save_table({**_load_table(), **resolved})
+    return resolved
+
+def _can_resolve() -> Optional[Resolver]:
+    """지금 새 장소를 조회할 수 있으면 변환 함수를, 함수가 없거나 실패 직후라 쉬는 중이면 None을 반환한다."""
+    resolver = _current_resolver()
+    if resolver is None or time.time() - _last_failure < config.GEOCODE_RETRY_SEC:
+        return None
+    return resolver
+
+def lookup(queries: list[str], resolve_missing: bool = True) -> dict[str, Optional[tuple[float, float]]]:
+    """검색어별 좌표를 반환한다. resolve_missing이면 표에 없는 검색어를 동시에 조회해 저장한 뒤 반환한다.
+
+    찾을 수 없는 장소와, 변환 함수가 없거나 오류로 아직 조회하지 못한 장소는 None.
+    """
+    queries = [q.strip() for q in queries if q and q.strip()]
+    with _table_lock:
+        table = dict(_load_table())
+    missing = [q for q in dict.fromkeys(queries) if q not in table]
+
+    resolver = _can_resolve()
+    if missing and resolve_missing and resolver is not None:
+        table.update(_resolve(missing, resolver))
+
+    return {q: _coords(table.get(q)) for q in queries}
+
+def resolve_in_background(queries: list[str]) -> bool:
+    """좌표표에 없는 검색어를 백그라운드 스레드에서 조회하기 시작한다.
+
+    조회 중인 검색어가 남아 있으면(이번에 시작했거나 다른 세션이 이미 조회 중) True를 반환한다.
+    """
+    queries = [q.strip() for q in queries if q and q.strip()]
+    with _table_lock:
+        table = _load_table()
+        missing = [q for q in dict.fromkeys(queries) if q not in table]
+        pending = [q for q in missing if q in _resolving]
+        resolver = _can_resolve()
+        new = [q for q in missing if q not in _resolving] if resolver is not None else []
+        _resolving.update(new)
+    if not new:
+        return bool(pending)
+
+    def _worker():
+        try:
+            _resolve(new, resolver)
+        finally:
+            with _table_lock:
+                _resolving.difference_update(new)
+
+    threading.Thread(target=_worker, name="geocode-resolve", daemon=True).start()
+    return True
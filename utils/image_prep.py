@@ -0,0 +1,44 @@
+"""비전 API 업로드 전에 이미지를 줄이고 메타데이터를 제거하는 전처리 유틸리티."""
+
+import io
+import math
+
+from PIL import Image, ImageOps
+
+import config
+
+def flatten_to_rgb(image: Image.Image) -> Image.Image:
+    """투명 영역을 흰 배경에 합성해 RGB로 바꾼다(그냥 convert하면 투명 부분이 검게 되어 어두운 글자가 묻힌다)."""
+    if image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+def prepare_image(image_bytes: bytes, mime_type: str, max_pixels: int = None) -> tuple[bytes, str]:
+    """이미지를 픽셀 예산 이하로 축소하고 EXIF 없는 JPEG로 재인코딩한다.
+
+    (바이트, MIME 타입)을 반환하며, 이미지로 읽을 수 없으면 원본을 그대로 돌려준다.
+    """
+    max_pixels = max_pixels or config.OCR_MAX_PIXELS
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            width, height = image.size
+            scale = min(1.0, math.sqrt(max_pixels / (width * height)))
+            target = (max(1, int(width * scale)), max(1, int(height * scale)))
+            # JPEG는 디코딩 단계에서 미리 축소해 메모리/시간을 줄인다
+            image.draft("RGB", target)
+            # EXIF 회전 정보를 픽셀에 반영(재인코딩 시 EXIF 자체는 버려짐)
+            image = ImageOps.exif_transpose(image)
+            if image.width * image.height > max_pixels:
+                scale = math.sqrt(max_pixels / (image.width * image.height))
+                image = image.resize(
+                    (max(1, int(image.width * scale)), max(1, int(image.height * scale))),
+                    Image.LANCZOS,
+                )
+            output = io.BytesIO()
+            flatten_to_rgb(image).save(output, format="JPEG", quality=config.OCR_JPEG_QUALITY, optimize=True)
+    except Exception:
+        return image_bytes, mime_type
+    return output.getvalue(), "image/jpeg"
@@ -0,0 +1,196 @@
+"""CSV 테이블의 행 단위 변경을 추가 전용 저널로 기록하고, 주기적으로 CSV에 압축하는 유틸리티.
+
+저널(*.journal.jsonl)의 각 줄은 하나의 연산이다.
+- {"op": "set", "row": 3, "values": {...}}: 3번째 행을 해당 값으로 설정(범위 밖이면 행 추가)
+- {"op": "truncate", "rows": 10}: 10행 이후를 삭제
+- {"op": "add", "values": {"id": "ab12", ...}}: ID 컬럼이 있는 테이블에 행 추가(같은 ID가 있으면 교체)
+- {"op": "delete", "id": "ab12"}: 해당 ID의 행을 삭제(없으면 무시)
+연산은 같은 결과를 여러 번 적용해도 동일하므로(멱등), 압축 도중 중단되어 저널이 남아도 안전하다.
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+import config
+
+# add/delete 연산이 행을 찾을 때 쓰는 ID 컬럼 이름
+ID_COLUMN = "id"
+# 저널에 기록할 수 있는 연산 종류
+OP_TYPES = ("set", "truncate", "add", "delete")
+
+# 경로별 잠금: 저널 추가/압축/읽기가 서로 끼어들지 않도록 보호
+_locks: dict[Path, threading.RLock] = {}
+_locks_guard = threading.Lock()
+# 백그라운드 압축이 진행 중인 경로
+_compacting: set[Path] = set()
+
+def lock_for(path: Path) -> threading.RLock:
+    """테이블 경로에 대응하는 프로세스 전역 잠금을 반환한다."""
+    with _locks_guard:
+        return _locks.setdefault(Path(path), threading.RLock())
+
+def journal_path(path: Path) -> Path:
+    """CSV 경로에 대응하는 저널 파일 경로(예: schedule.journal.jsonl)."""
+    return Path(path).with_suffix(".journal.jsonl")
+
+def normalize_frame(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    """컬럼을 표준 스키마로 맞추고 모든 값을 결측 없는 문자열로 바꾼다."""
+    df = df.copy()
+    for col in cols:
+        if col not in df.columns:
+            df[col] = ""
+    df = df[cols].astype(object)
+    df = df.where(df.notna(), "")
+    for col in cols:
+        df[col] = df[col].map(_to_cell)
+    return df.reset_index(drop=True)
+
+def _to_cell(value) -> str:
+    """셀 값을 CSV 문자열로 바꾼다(정수값 실수는 소수점 없이)."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def write_csv_atomic(df: pd.DataFrame, path: Path, backup_path: Optional[Path] = None) -> None:
+    """임시 파일에 쓰고 fsync한 뒤 rename으로 교체한다(중간에 죽어도 원본 유지)."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        df.to_csv(f, index=False)
+        f.flush()
+        os.fsync(f.fileno())
+    # 기존 파일은 교체 직전에 백업으로 복사(교체 전까지 원본은 그대로 남음)
+    if backup_path is not None and path.exists():
+        shutil.copy2(path, backup_path)
+    tmp_path.replace(path)
+
+def read_ops(path: Path) -> list[dict]:
+    """저널의 연산 목록을 읽는다. 기록 도중 끊긴 마지막 줄 같은 손상 줄은 건너뛴다."""
+    try:
+        with open(journal_path(path), encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+    ops = []
+    for line in lines:
+        try:
+            op = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(op, dict) and op.get("op") in OP_TYPES:
+            ops.append(op)
+    return ops
+
+def apply_ops(df: pd.DataFrame, ops: list[dict], cols: list[str]) -> pd.DataFrame:
+    """기준 테이블에 저널 연산을 순서대로 적용한 결과를 반환한다."""
+    if not ops:
+        return df
+    rows = df.to_dict("records")
+    blank = {col: "" for col in cols}
+    for op in ops:
+        if op["op"] == "set":
+            idx = int(op["row"])
+            while len(rows) <= idx:
+                rows.append(dict(blank))
+            rows[idx] = {**rows[idx], **op["values"]}
+        elif op["op"] == "truncate":
+            del rows[int(op["rows"]):]
+        elif op["op"] == "add":
+            row = {**blank, **op["values"]}
+            rows = [r for r in rows if r.get(ID_COLUMN) != row[ID_COLUMN]]
+            rows.append(row)
+        else:
+            rows = [r for r in rows if r.get(ID_COLUMN) != op["id"]]
+    return pd.DataFrame(rows, columns=cols).fillna("")
+
+def diff_ops(old: pd.DataFrame, new: pd.DataFrame, cols: list[str]) -> list[dict]:
+    """두 테이블(정규화된 문자열 프레임)의 위치 기준 차이를 저널 연산으로 만든다."""
+    shared = min(len(old), len(new))
+    old_values = old[cols].to_numpy()[:shared]
+    new_values = new[cols].to_numpy()
+    changed = (old_values != new_values[:shared]).any(axis=1).nonzero()[0].tolist()
+    changed += list(range(shared, len(new)))
+    ops = [{"op": "set", "row": idx, "values": dict(zip(cols, new_values[idx].tolist()))} for idx in changed]
+    if len(new) < len(old):
+        ops.append({"op": "truncate", "rows": len(new)})
+    return ops
+
+def append_ops(path: Path, ops: list[dict]) -> int:
+    """연산을 저널 끝에 추가하고 디스크에 확정(fsync)한다. 추가 후 저널 길이를 반환."""
+    jpath = journal_path(path)
+    with open(jpath, "ab+") as f:
+        # 이전 기록이 줄 중간에서 끊겼다면 새 연산이 그 줄에 붙지 않도록 줄바꿈부터 넣는다
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        for op in ops:
+            f.write((json.dumps(op, ensure_ascii=False) + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    return len(read_ops(path))
+
+def compact(path: Path, cols: list[str], current: pd.DataFrame, backup_path: Optional[Path] = None) -> None:
+    """현재 테이블 전체를 CSV로 원자적으로 다시 쓰고 저널을 비운다(호출자가 잠금 보유)."""
+    write_csv_atomic(current, path, backup_path)
+    # CSV 교체가 끝난 뒤에만 저널을 지운다(그 전에 죽으면 저널 재적용으로 같은 결과)
+    journal_path(path).unlink(missing_ok=True)
+
+def compact_in_background(path: Path, cols: list[str], load_current, backup_path: Optional[Path] = None, on_done=None) -> None:
+    """저널 압축을 백그라운드 스레드로 실행한다(같은 경로에 이미 실행 중이면 건너뜀)."""
+    path = Path(path)
+    with _locks_guard:
+        if path in _compacting:
+            return
+        _compacting.add(path)
+
+    def _worker():
+        try:
+            with lock_for(path):
+                compact(path, cols, load_current(), backup_path)
+            if on_done:
+                on_done()
+        except Exception as e:
+            # 압축 실패 시 저널이 그대로 남으므로 데이터는 유지된다
+            print(f"Journal compaction error ({path.name}): {e}")
+        finally:
+            with _locks_guard:
+                _compacting.discard(path)
+
+    threading.Thread(target=_worker, name=f"compact-{path.stem}", daemon=True).start()
+
+def save(path: Path, cols: list[str], current: pd.DataFrame, new: pd.DataFrame, backup_path: Optional[Path] = None, on_compacted=None, load_current=None) -> None:
+    """새 테이블을 저장한다. 변경 행만 저널에 추가하고, 저널이 길면 백그라운드에서 압축한다.
+
+    기준 CSV가 없거나, 변경 연산이 전체 행의 절반을 넘고 압축 기준 이상이면 곧바로 전체를 원자적으로 다시 쓴다.
+    current는 저장 직전의 테이블(기준 CSV + 저널), new는 저장할 테이블(둘 다 정규화된 상태).
+    """
+    path = Path(path)
+    with lock_for(path):
+        if not path.exists():
+            compact(path, cols, new, backup_path)
+            return
+        ops = diff_ops(current, new, cols)
+        if not ops:
+            return
+        if len(ops) > max(len(new) // 2, 1) and len(ops) >= config.JOURNAL_COMPACT_THRESHOLD:
+            compact(path, cols, new, backup_path)
+            return
+        record(path, cols, ops, backup_path, on_compacted, load_current)
+
+def record(path: Path, cols: list[str], ops: list[dict], backup_path: Optional[Path] = None, on_compacted=None, load_current=None) -> None:
+    """연산을 저널에 추가하고, 저널이 압축 기준에 이르면 백그라운드에서 CSV로 압축한다.
+
+    기준 CSV는 압축할 때만 다시 쓰이고 그때만 이전 CSV가 백업되므로, 압축 사이의 변경분은 저널이 증분 기록이 된다.
+    """
+    path = Path(path)
+    with lock_for(path):
+        journal_length = append_ops(path, ops)
+    if journal_length >= config.JOURNAL_COMPACT_THRESHOLD and load_current is not None:
+        compact_in_background(path, cols, load_current, backup_path, on_compacted)
@@ -0,0 +1,136 @@
+"""뷰 렌더링/데이터 입출력/외부 API 호출의 소요 시간을 재는 가벼운 계측 유틸리티.
+
+이름별로 호출 수, 오류 수, 누적 시간과 최근 METRICS_WINDOW개 측정값을 보관해 p50/p95를 계산한다.
+METRICS_ENABLED가 꺼져 있으면 timed는 원래 함수를 그대로 반환하고 timer는 빈 컨텍스트를 돌려주므로 비용이 없다.
+"""
+
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+import config
+
+# 이름 → {"count", "errors", "total_sec", "samples"(최근 측정값, 초)}. 프로세스 전역(모든 세션이 공유)
+_metrics: dict[str, dict] = {}
+_metrics_lock = threading.Lock()
+_started_at = time.time()
+
+# Prometheus 텍스트로 내보낼 때의 지표 이름
+PROMETHEUS_NAME = "travel_app_latency_seconds"
+
+def enabled() -> bool:
+    """계측이 켜져 있는지 여부."""
+    return config.METRICS_ENABLED
+
+def record(name: str, elapsed_sec: float, error: bool = False) -> None:
+    """측정값 하나를 기록한다."""
+    with _metrics_lock:
+        entry = _metrics.get(name)
+        if entry is None:
+            entry = {"count": 0, "errors": 0, "total_sec": 0.0, "samples": deque(maxlen=config.METRICS_WINDOW)}
+            _metrics[name] = entry
+        entry["count"] += 1
+        entry["errors"] += int(error)
+        entry["total_sec"] += elapsed_sec
+        entry["samples"].append(elapsed_sec)
+
+@contextmanager
+def _timing(name: str):
+    started = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        # 스트림을 중간에 닫거나(GeneratorExit) st.rerun()/st.stop()으로 흐름이 바뀐 경우는
+        # BaseException이라 오류로 세지 않고 소요 시간만 기록한다
+        error = True
+        raise
+    finally:
+        record(name, time.perf_counter() - started, error)
+
+def timer(name: str):
+    """with 블록의 소요 시간을 기록하는 컨텍스트를 반환한다(계측이 꺼져 있으면 빈 컨텍스트)."""
+    return _timing(name) if config.METRICS_ENABLED else nullcontext()
+
+def timed(name: Optional[str] = None):
+    """함수 호출 시간을 기록하는 데코레이터. 이름을 생략하면 '모듈.함수'를 쓴다.
+
+    제너레이터 함수는 마지막 값을 내보내거나 중단될 때까지를 한 번의 호출로 잰다.
+    계측이 꺼져 있으면 원래 함수를 그대로 반환한다(import 시점에 결정).
+    """
+    def decorator(func):
+        if not config.METRICS_ENABLED:
+            return func
+        metric = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                with _timing(metric):
+                    yield from func(*args, **kwargs)
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _timing(metric):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _quantile(ordered: list[float], q: float) -> float:
+    """정렬된 측정값의 q 분위수(최근접 순위 방식)."""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+def snapshot() -> list[dict]:
+    """이름순으로 호출 수/오류 수/누적 시간과 최근 측정값의 p50·p95·최댓값(ms)을 반환한다."""
+    with _metrics_lock:
+        items = [(name, dict(entry, samples=sorted(entry["samples"]))) for name, entry in _metrics.items()]
+    rows = []
+    for name, entry in sorted(items):
+        samples = entry["samples"]
+        rows.append({
+            "name": name,
+            "count": entry["count"],
+            "errors": entry["errors"],
+            "total_sec": round(entry["total_sec"], 6),
+            "p50_ms": round(_quantile(samples, 0.5) * 1000, 3),
+            "p95_ms": round(_quantile(samples, 0.95) * 1000, 3),
+            "max_ms": round(samples[-1] * 1000, 3),
+        })
+    return rows
+
+def reset() -> None:
+    """기록된 측정값을 모두 지운다."""
+    global _started_at
+    with _metrics_lock:
+        _metrics.clear()
+        _started_at = time.time()
+
+def to_json() -> str:
+    """현재 측정값을 JSON 문자열로 내보낸다."""
+    payload = {"since": _started_at, "exported_at": time.time(), "window": config.METRICS_WINDOW, "metrics": snapshot()}
+    return json.dumps(payload, ensure_ascii=False, indent=1)
+
+def to_prometheus() -> str:
+    """현재 측정값을 Prometheus 텍스트 형식(summary)으로 내보낸다."""
+    lines = [
+        f"# HELP {PROMETHEUS_NAME} Latency of views, data access and API calls (recent window quantiles).",
+        f"# TYPE {PROMETHEUS_NAME} summary",
+    ]
+    errors = []
+    for row in snapshot():
+        label = row["name"].replace("\\", "\\\\").replace('"', '\\"')
+        lines.append(f'{PROMETHEUS_NAME}{{name="{label}",quantile="0.5"}} {row["p50_ms"] / 1000:.6f}')
+        lines.append(f'{PROMETHEUS_NAME}{{name="{label}",quantile="0.95"}} {row["p95_ms"] / 1000:.6f}')
+        lines.append(f'{PROMETHEUS_NAME}_sum{{name="{label}"}} {row["total_sec"]:.6f}')
+        lines.append(f'{PROMETHEUS_NAME}_count{{name="{label}"}} {row["count"]}')
+        errors.append(f'travel_app_errors_total{{name="{label}"}} {row["errors"]}')
+    if errors:
+        lines += ["# HELP travel_app_errors_total Calls that raised an exception.", "# TYPE travel_app_errors_total counter", *errors]
+    return "\n".join(lines) + "\n"
@@ -3,20 +3,75 @@
 from openai import OpenAI
 import config
 import base64
+import hashlib
 import io
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Optional
+from utils import audio_prep, file_cache, image_prep, metrics, translation_cache
+
+# 번역 프롬프트를 바꾸면 올려서 이전 프롬프트로 만든 캐시 결과를 재사용하지 않게 한다
+TRANSLATE_PROMPT_VERSION = "1"
+OCR_PROMPT_VERSION = "1"
+
+# 최근 번역 요청의 지연 시간 기록(첫 토큰까지 시간 / 전체 시간)
+_latency_log: deque = deque(maxlen=200)
+_latency_lock = threading.Lock()
+
+# API 키별 공유 클라이언트 레지스트리.
+# 클라이언트마다 keep-alive 연결 풀을 갖고 있으므로 재사용하면 TLS 핸드셰이크를 반복하지 않는다.
+_clients: dict[str, OpenAI] = {}
+_clients_lock = threading.Lock()
 
 def get_client(api_key: str):
-    """API 키 유무에 따라 OpenAI 클라이언트를 생성한다."""
+    """API 키별로 프로세스 전체가 공유하는 OpenAI 클라이언트를 반환한다."""
     if not api_key:
         return None
-    return OpenAI(api_key=api_key)
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                timeout=config.OPENAI_TIMEOUT_SEC,
+                max_retries=config.OPENAI_MAX_RETRIES,
+            )
+            _clients[api_key] = client
+    return client
 
-def translate_text(text: str, source_lang: str, target_lang: str, api_key: str, model: str) -> str:
-    """텍스트를 지정한 언어 쌍으로 번역한다."""
-    client = get_client(api_key)
-    if not client:
-        raise RuntimeError("OpenAI API 키가 필요합니다.")
+def close_clients() -> None:
+    """공유 클라이언트의 연결 풀을 닫고 레지스트리를 비운다."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+def _record_latency(model: str, started: float, first_token_at: Optional[float], streamed: bool, cached: bool, chars: int) -> None:
+    """번역 요청 1건의 지연 시간을 기록한다."""
+    finished = time.perf_counter()
+    entry = {
+        "model": model,
+        "streamed": streamed,
+        "cached": cached,
+        "ttft_sec": (first_token_at - started) if first_token_at is not None else None,
+        "total_sec": finished - started,
+        "chars": chars,
+        "at": time.time(),
+    }
+    with _latency_lock:
+        _latency_log.append(entry)
+
+def get_latency_log() -> list[dict]:
+    """최근 번역 요청들의 지연 시간 기록을 오래된 순으로 반환한다."""
+    with _latency_lock:
+        return list(_latency_log)
 
+def _translation_messages(text: str, source_lang: str, target_lang: str) -> list[dict]:
+    """번역 요청용 채팅 메시지를 만든다."""
     # 시스템 프롬프트: 여행 통역 맥락에서 자연스러운 번역을 유도
     system_prompt = (
         "You are a professional travel interpreter. "
@@ -25,28 +80,92 @@ def translate_text(text: str, source_lang: str, target_lang: str, api_key: str,
     )
     # 사용자 프롬프트: 번역 방향과 원문 전달
     user_prompt = f"Translate from {source_lang} to {target_lang}.\n\nText:\n{text}"
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+@metrics.timed()
+def translate_text(text: str, source_lang: str, target_lang: str, api_key: str, model: str, use_cache: bool = True) -> str:
+    """텍스트를 지정한 언어 쌍으로 번역한다(같은 문장은 로컬 캐시에서 바로 반환)."""
+    started = time.perf_counter()
+    cache_key = translation_cache.make_key(text, source_lang, target_lang, model, TRANSLATE_PROMPT_VERSION)
+    if use_cache:
+        cached = translation_cache.get(cache_key)
+        if cached is not None:
+            _record_latency(model, started, None, streamed=False, cached=True, chars=len(cached))
+            return cached
+
+    client = get_client(api_key)
+    if not client:
+        raise RuntimeError("OpenAI API 키가 필요합니다.")
     
     # 채팅 완성 API 호출
     response = client.chat.completions.create(
         model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
+        messages=_translation_messages(text, source_lang, target_lang),
+        max_tokens=400,
+        temperature=0.2,
+    )
+    translation = response.choices[0].message.content.strip()
+    if use_cache and translation:
+        translation_cache.put(cache_key, text, source_lang, target_lang, model, translation)
+    _record_latency(model, started, None, streamed=False, cached=False, chars=len(translation))
+    return translation
+
+@metrics.timed()
+def stream_translate_text(text: str, source_lang: str, target_lang: str, api_key: str, model: str, use_cache: bool = True) -> Iterator[str]:
+    """번역 결과를 토큰이 도착하는 대로 조각(str) 단위로 내보낸다."""
+    started = time.perf_counter()
+    cache_key = translation_cache.make_key(text, source_lang, target_lang, model, TRANSLATE_PROMPT_VERSION)
+    if use_cache:
+        cached = translation_cache.get(cache_key)
+        if cached is not None:
+            # 캐시 적중 시 전체 결과를 한 번에 내보낸다
+            _record_latency(model, started, time.perf_counter(), streamed=True, cached=True, chars=len(cached))
+            yield cached
+            return
+
+    client = get_client(api_key)
+    if not client:
+        raise RuntimeError("OpenAI API 키가 필요합니다.")
+
+    # stream=True로 호출하면 토큰 조각(delta)이 순서대로 도착한다
+    stream = client.chat.completions.create(
+        model=model,
+        messages=_translation_messages(text, source_lang, target_lang),
         max_tokens=400,
         temperature=0.2,
+        stream=True,
     )
-    return response.choices[0].message.content.strip()
+    parts = []
+    first_token_at = None
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        if first_token_at is None:
+            first_token_at = time.perf_counter()
+        parts.append(delta)
+        yield delta
+
+    translation = "".join(parts).strip()
+    if use_cache and translation:
+        translation_cache.put(cache_key, text, source_lang, target_lang, model, translation)
+    _record_latency(model, started, first_token_at, streamed=True, cached=False, chars=len(translation))
 
-def transcribe_audio(audio_bytes: bytes, api_key: str, model: str, language: str = None) -> str:
-    """음성 파일 바이트를 받아 텍스트로 전사한다."""
+@metrics.timed()
+def transcribe_audio(audio_bytes: bytes, api_key: str, model: str, language: str = None, filename: str = "voice.wav") -> str:
+    """음성 파일 바이트를 받아 텍스트로 전사한다(filename의 확장자로 형식을 알린다)."""
     client = get_client(api_key)
     if not client:
         raise RuntimeError("OpenAI API 키가 필요합니다.")
         
     # OpenAI API는 파일 객체를 요구하므로 메모리 파일로 감싼다
     audio_file = io.BytesIO(audio_bytes)
-    audio_file.name = "voice.wav"
+    audio_file.name = filename
     
     kwargs = {"model": model, "file": audio_file}
     # 언어 힌트를 제공하면 전사 정확도를 높일 수 있음
@@ -57,8 +176,84 @@ def transcribe_audio(audio_bytes: bytes, api_key: str, model: str, language: str
     response = client.audio.transcriptions.create(**kwargs)
     return response.text.strip()
 
-def text_to_speech(text: str, api_key: str, model: str, voice: str) -> bytes:
-    """텍스트를 음성으로 변환해 MP3 바이트를 반환한다."""
+def stitch_transcripts(previous: str, following: str, max_overlap_chars: int = 20) -> str:
+    """겹치게 나눈 두 조각의 전사 결과를 이어 붙인다. 겹친 구간에서 반복된 글자는 한 번만 남긴다.
+
+    겹치는 구간은 1초 안팎이므로 max_overlap_chars보다 긴 일치는 반복해서 말한 문장으로 보고 그대로 둔다.
+    """
+    previous, following = previous.strip(), following.strip()
+    if not previous or not following:
+        return previous or following
+    # 앞 조각의 끝과 뒤 조각의 시작이 가장 길게 일치하는 부분을 찾는다(우연한 일치를 피하려고 3글자 이상)
+    for size in range(min(len(previous), len(following), max_overlap_chars), 2, -1):
+        if previous.endswith(following[:size]):
+            return previous + following[size:]
+    # 일본어/중국어는 띄어쓰기 없이, 그 밖에는 공백으로 잇는다
+    separator = "" if _is_cjk(previous[-1]) and _is_cjk(following[0]) else " "
+    return previous + separator + following
+
+def _is_cjk(char: str) -> bool:
+    """띄어쓰기 없이 쓰는 문자(일본어 문장부호/가나/한자)인지 여부."""
+    return "\u3000" <= char <= "\u30ff" or "\u4e00" <= char <= "\u9fff"
+
+def stream_transcribe_recording(audio_bytes: bytes, api_key: str, model: str, language: str = None, max_workers: int = None) -> Iterator[tuple[str, dict]]:
+    """녹음을 전처리하고 긴 녹음은 무음 지점에서 겹치게 나눠 제한된 스레드 풀에서 동시에 전사한다.
+
+    조각은 인코딩되는 대로 바로 제출하므로 앞 조각의 업로드가 뒤 조각의 전처리와 겹친다.
+    조각이 끝날 때마다 (앞에서부터 이어진 조각까지 이어 붙인 텍스트, 보고서)를 내보낸다.
+    보고서는 prepare_chunks의 항목에 done(끝난 조각 수), errors(실패한 조각 수), stt_ms를 더한 것이며,
+    실패한 조각은 빈 텍스트로 두고 첫 실패의 메시지를 error에 담은 채 나머지 조각은 계속 전사한다.
+    """
+    report: dict = {}
+    chunks = audio_prep.iter_chunks(audio_bytes, config.STT_CHUNK_SEC, report)
+    # 조각 수는 첫 조각을 만들기 전에 정해진다
+    first = next(chunks)
+    report.update(done=0, errors=0)
+    started = time.perf_counter()
+    texts: list[Optional[str]] = [None] * report["chunks"]
+    stitched, stitched_count = "", 0
+    workers = max(1, min(report["chunks"], max_workers or config.STT_MAX_CONCURRENCY))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stt") as pool:
+        futures = {
+            pool.submit(transcribe_audio, data, api_key, model, language, filename): idx
+            for idx, (data, filename) in enumerate(itertools.chain([first], chunks))
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                texts[idx] = future.result()
+            except Exception as e:
+                # 실패한 조각은 비워 두고 보고서로 알린다(이미지 여러 장 처리와 같은 방식)
+                texts[idx] = ""
+                report["errors"] += 1
+                report.setdefault("error", f"{idx + 1}번째 조각: {e}")
+            report["done"] += 1
+            # 앞 조각부터 순서대로 끝난 만큼만 이어 붙인다
+            while stitched_count < len(texts) and texts[stitched_count] is not None:
+                stitched = stitch_transcripts(stitched, texts[stitched_count])
+                stitched_count += 1
+            report["stt_ms"] = (time.perf_counter() - started) * 1000
+            yield stitched, dict(report)
+
+def transcribe_recording(audio_bytes: bytes, api_key: str, model: str, language: str = None) -> tuple[str, dict]:
+    """녹음을 전처리(모노/16kHz/무음 제거/압축)하고 필요하면 나눠 전사해 (텍스트, 보고서)를 반환한다.
+
+    보고서는 audio_prep.prepare_chunks의 크기/길이/조각 정보에 전사 시간(stt_ms) 등을 더한 것.
+    """
+    transcript, report = "", {}
+    for transcript, report in stream_transcribe_recording(audio_bytes, api_key, model, language):
+        pass
+    return transcript, report
+
+@metrics.timed()
+def text_to_speech(text: str, api_key: str, model: str, voice: str, use_cache: bool = True) -> bytes:
+    """텍스트를 음성으로 변환해 MP3 바이트를 반환한다(같은 문장/모델/목소리는 디스크 캐시 사용)."""
+    cache_key = file_cache.make_key(text, model, voice)
+    if use_cache:
+        cached = file_cache.get("tts", cache_key)
+        if cached is not None:
+            return cached
+
     client = get_client(api_key)
     if not client:
         raise RuntimeError("OpenAI API 키가 필요합니다.")
@@ -69,16 +264,29 @@ def text_to_speech(text: str, api_key: str, model: str, voice: str) -> bytes:
         voice=voice,
         input=text,
     )
-    return response.content
+    audio = response.content
+    if use_cache and audio:
+        file_cache.put("tts", cache_key, audio, config.TTS_CACHE_MAX_BYTES)
+    return audio
+
+@metrics.timed()
+def extract_text_from_image(image_bytes: bytes, mime_type: str, api_key: str, model: str, use_cache: bool = True) -> str:
+    """이미지에서 텍스트를 추출(OCR)하여 반환한다(같은 이미지는 캐시된 결과 사용)."""
+    # 원본 이미지 내용 해시로 캐시 키 생성(전처리 기준이 바뀌면 키도 바뀜)
+    cache_key = file_cache.make_key(
+        hashlib.sha256(image_bytes).hexdigest(), model, OCR_PROMPT_VERSION, config.OCR_MAX_PIXELS, config.OCR_JPEG_QUALITY
+    )
+    if use_cache:
+        cached = file_cache.get("ocr", cache_key)
+        if cached is not None:
+            return cached.decode("utf-8")
 
-def extract_text_from_image(image_bytes: bytes, mime_type: str, api_key: str, model: str) -> str:
-    """이미지에서 텍스트를 추출(OCR)하여 반환한다."""
     client = get_client(api_key)
     if not client:
         raise RuntimeError("OpenAI API 키가 필요합니다.")
         
-    # 멀티모달 입력을 위해 Data URL 포맷으로 변환
-    data_url = f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+    # 업로드 용량을 줄이기 위해 축소/EXIF 제거 후 Data URL 포맷으로 변환
+    data_url = _image_data_url(image_bytes, mime_type)
     # OCR 프롬프트: 줄바꿈 유지, 텍스트만 반환
     prompt = (
         "Extract all visible text from this image. "
@@ -101,4 +309,100 @@ def extract_text_from_image(image_bytes: bytes, mime_type: str, api_key: str, mo
         max_tokens=400,
         temperature=0,
     )
-    return response.choices[0].message.content.strip()
+    extracted = response.choices[0].message.content.strip()
+    if use_cache:
+        file_cache.put("ocr", cache_key, extracted.encode("utf-8"), config.OCR_CACHE_MAX_BYTES)
+    return extracted
+
+def _image_data_url(image_bytes: bytes, mime_type: str) -> str:
+    """업로드 용량을 줄이기 위해 축소/EXIF 제거 후 Data URL 포맷으로 변환한다."""
+    image_bytes, mime_type = image_prep.prepare_image(image_bytes, mime_type)
+    return f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+
+@metrics.timed()
+def extract_and_translate_combined(image_bytes: bytes, mime_type: str, api_key: str, model: str, target_lang: str = "Korean", use_cache: bool = True) -> dict:
+    """비전 모델 1회 호출로 원문 추출과 번역을 함께 받아 {"extracted", "translated"}로 반환한다.
+
+    모델 응답이 약속한 JSON 형식이 아니면 ValueError를 던진다.
+    """
+    cache_key = file_cache.make_key(
+        hashlib.sha256(image_bytes).hexdigest(), model, target_lang, OCR_PROMPT_VERSION,
+        config.OCR_MAX_PIXELS, config.OCR_JPEG_QUALITY,
+    )
+    if use_cache:
+        cached = file_cache.get("ocr_translate", cache_key)
+        if cached is not None:
+            return json.loads(cached)
+
+    client = get_client(api_key)
+    if not client:
+        raise RuntimeError("OpenAI API 키가 필요합니다.")
+
+    # 추출 + 번역 프롬프트: 두 결과를 하나의 JSON 객체로 요청
+    prompt = (
+        "Extract all visible text from this image, preserving line breaks, "
+        f"and translate it into {target_lang}. "
+        'Respond with a JSON object: {"original": "<extracted text>", "translation": "<translation>"}. '
+        "If no text is visible, use empty strings for both."
+    )
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {"type": "image_url", "image_url": {"url": _image_data_url(image_bytes, mime_type)}},
+                ],
+            }
+        ],
+        response_format={"type": "json_object"},
+        max_tokens=800,
+        temperature=0,
+    )
+    payload = json.loads(response.choices[0].message.content or "")
+    if not isinstance(payload, dict) or not isinstance(payload.get("original", ""), str) or not isinstance(payload.get("translation", ""), str):
+        raise ValueError("비전 모델 응답 형식이 올바르지 않습니다.")
+    result = {
+        "extracted": payload.get("original", "").strip(),
+        "translated": payload.get("translation", "").strip(),
+    }
+    if use_cache:
+        file_cache.put("ocr_translate", cache_key, json.dumps(result, ensure_ascii=False).encode("utf-8"), config.OCR_CACHE_MAX_BYTES)
+    return result
+
+@metrics.timed()
+def extract_and_translate_image(image_bytes: bytes, mime_type: str, api_key: str, ocr_model: str, translate_model: str, target_lang: str = "Korean", mode: str = None, use_cache: bool = True) -> dict:
+    """이미지 1장의 텍스트를 추출·번역해 {"extracted", "translated"}로 반환한다.
+
+    combined 모드는 1회 호출로 처리하고, 응답 형식이 깨지면 2단계(OCR 후 번역)로 대체한다.
+    """
+    mode = mode or config.OCR_TRANSLATE_MODE
+    if mode == "combined":
+        try:
+            return extract_and_translate_combined(image_bytes, mime_type, api_key, ocr_model, target_lang, use_cache)
+        except ValueError as e:
+            print(f"Combined OCR fallback: {e}")
+
+    extracted = extract_text_from_image(image_bytes, mime_type, api_key, ocr_model, use_cache)
+    translated = ""
+    if extracted:
+        translated = translate_text(extracted, "Any", target_lang, api_key, translate_model, use_cache)
+    return {"extracted": extracted, "translated": translated}
+
+def extract_and_translate_images(images: list[tuple[bytes, str]], api_key: str, ocr_model: str, translate_model: str, max_workers: int, target_lang: str = "Korean", mode: str = None) -> Iterator[tuple[int, dict]]:
+    """여러 이미지를 제한된 스레드 풀에서 동시에 처리하고, 끝나는 순서대로 (순번, 결과)를 내보낸다.
+
+    실패한 이미지는 결과에 "error" 메시지를 담아 돌려주므로 나머지 이미지 처리는 계속된다.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="ocr") as pool:
+        futures = {
+            pool.submit(extract_and_translate_image, image_bytes, mime_type, api_key, ocr_model, translate_model, target_lang, mode): idx
+            for idx, (image_bytes, mime_type) in enumerate(images)
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"extracted": "", "translated": "", "error": str(e)}
+            yield futures[future], result
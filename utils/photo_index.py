@@ -0,0 +1,104 @@
+"""앨범 사진 목록(이름/크기/수정 시각/해상도)을 디스크 인덱스로 관리하는 유틸리티."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from PIL import Image
+
+import config
+from utils import swr_cache
+
+# 앨범에 표시할 사진 확장자
+PHOTO_SUFFIXES = ("png", "jpg", "jpeg")
+
+# 프로세스 전역 인덱스: {"dir_mtime_ns": int, "photos": {파일명: 메타데이터}}
+_index: Optional[dict] = None
+_index_lock = threading.Lock()
+
+def _read_dimensions(path: Path) -> tuple[int, int]:
+    """이미지 헤더만 읽어 (가로, 세로)를 반환한다. 읽을 수 없으면 (0, 0)."""
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except Exception:
+        return (0, 0)
+
+def _make_entry(path: Path, stat: os.stat_result, previous: Optional[dict]) -> dict:
+    """파일 메타데이터를 만든다. 크기/수정 시각이 같으면 이전 해상도 값을 재사용."""
+    if previous and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+        return previous
+    width, height = _read_dimensions(path)
+    return {
+        "name": path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "width": width,
+        "height": height,
+    }
+
+def _dir_mtime_ns() -> int:
+    return config.PHOTOS_DIR.stat().st_mtime_ns
+
+def _load_persisted() -> dict:
+    try:
+        index = json.loads(config.PHOTO_INDEX_PATH.read_text(encoding="utf-8"))
+        if isinstance(index.get("photos"), dict):
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"dir_mtime_ns": None, "photos": {}}
+
+def _persist(index: dict) -> None:
+    """인덱스를 임시 파일에 쓴 뒤 교체해 저장한다."""
+    swr_cache.write_json_atomic(config.PHOTO_INDEX_PATH, index)
+
+def _rescan(index: dict) -> dict:
+    """사진 폴더를 다시 훑어 인덱스를 맞춘다. 바뀐 파일만 해상도를 다시 읽는다."""
+    dir_mtime_ns = _dir_mtime_ns()
+    previous = index["photos"]
+    photos = {}
+    with os.scandir(config.PHOTOS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.lower().endswith(PHOTO_SUFFIXES):
+                continue
+            photos[entry.name] = _make_entry(Path(entry.path), entry.stat(), previous.get(entry.name))
+    return {"dir_mtime_ns": dir_mtime_ns, "photos": photos}
+
+def list_photos() -> list[dict]:
+    """사진 메타데이터 목록을 최신 사진 순으로 반환한다.
+
+    사진 폴더의 수정 시각이 인덱스와 같으면 폴더를 다시 읽지 않는다.
+    같은 이름으로 덮어쓰면 폴더 수정 시각이 바뀌지 않으므로, 업로드 후에는 register_photos로 알려야 한다.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = _load_persisted()
+        if _index["dir_mtime_ns"] != _dir_mtime_ns():
+            _index = _rescan(_index)
+            _persist(_index)
+        photos = list(_index["photos"].values())
+    return sorted(photos, key=lambda p: (-p["mtime_ns"], p["name"]))
+
+def register_photos(names: Iterable[str]) -> None:
+    """저장한 사진의 메타데이터(해상도 포함)를 인덱스에 바로 반영한다.
+
+    같은 이름으로 덮어쓴 사진은 폴더 수정 시각이 그대로라 list_photos()가 알아채지 못하므로 여기서 갱신한다.
+    폴더 수정 시각은 건드리지 않으므로 새 파일이 있으면 다음 list_photos()가 폴더를 한 번 대조한다(해상도는 재사용).
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = _load_persisted()
+        for name in names:
+            path = config.PHOTOS_DIR / name
+            try:
+                stat = path.stat()
+            except OSError:
+                _index["photos"].pop(name, None)
+                continue
+            _index["photos"][name] = _make_entry(path, stat, _index["photos"].get(name))
+        _persist(_index)
@@ -0,0 +1,88 @@
+"""일정 키워드 검색용 문자 n-그램 역색인.
+
+띄어쓰기로 단어를 나누기 어려운 한국어/일본어에서도 동작하도록 단어 대신 글자 1-그램/2-그램을 색인한다.
+검색은 키워드의 2-그램 색인 목록을 교집합해 후보 행을 추린 뒤, 후보에 대해서만 부분 문자열 일치를 확인한다.
+텍스트와 키워드를 모두 NFKC + casefold로 정규화하므로 예전 str.contains(case=False)보다 넓게 일치한다
+(전각 ＪＲ ↔ JR, 반각 ﾊｶﾀ ↔ ハカタ 등). 정확히 일치하는 행이 없을 때는 n-그램 겹침 비율로 비슷한 행을 찾는다.
+"""
+
+import heapq
+import math
+import unicodedata
+
+import pandas as pd
+
+import config
+
+# 검색 대상 컬럼(화면의 키워드 검색과 동일)
+SEARCH_COLUMNS = ["내용", "장소", "구분", "지도검색어"]
+
+# 행 텍스트를 이을 때 쓰는 컬럼 구분 문자(정규화된 검색어에는 나타나지 않음)
+_FIELD_SEPARATOR = "\x00"
+
+def normalize(text: str) -> str:
+    """전각/반각·호환 문자를 통일(NFKC)하고 대소문자를 무시하도록 변환한다."""
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+def _grams(text: str) -> set[str]:
+    """텍스트의 글자 1-그램과 2-그램 집합."""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+def _bigrams(text: str) -> set[str]:
+    """검색어의 2-그램 집합(한 글자 검색어는 그 글자 자체)."""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+def build_index(df: pd.DataFrame, columns: list[str] = SEARCH_COLUMNS) -> dict:
+    """DataFrame 행(위치 기준)에 대한 n-그램 → 행 번호 집합 색인을 만든다."""
+    rows = []
+    postings: dict[str, set[int]] = {}
+    present = [col for col in columns if col in df.columns]
+    values = df[present].fillna("").astype(str).to_numpy() if present else [[] for _ in range(len(df))]
+    for row, cells in enumerate(values):
+        texts = [normalize(cell) for cell in cells]
+        # 컬럼 사이에 검색어에 나올 수 없는 구분 문자를 넣어 컬럼 경계를 넘는 일치를 막는다
+        rows.append(_FIELD_SEPARATOR.join(texts))
+        for text in texts:
+            for gram in _grams(text):
+                postings.setdefault(gram, set()).add(row)
+    return {"rows": rows, "postings": postings}
+
+def search(index: dict, keyword: str) -> list[int]:
+    """키워드를 문자 그대로(정규화 후) 포함하는 행 번호를 오름차순으로 반환한다."""
+    query = normalize(keyword).replace(_FIELD_SEPARATOR, "")
+    if not query:
+        return list(range(len(index["rows"])))
+    postings = index["postings"]
+    if len(query) <= 2:
+        # 1~2글자 검색어는 색인 항목 자체가 정확한 결과
+        return sorted(postings.get(query, ()))
+    grams = sorted(_bigrams(query), key=lambda gram: len(postings.get(gram, ())))
+    if grams[0] not in postings:
+        return []
+    candidates = set(postings[grams[0]])
+    for gram in grams[1:]:
+        candidates &= postings.get(gram, set())
+        if not candidates:
+            return []
+    # 2-그램이 모두 들어 있어도 연속 문자열이 아닐 수 있으므로 후보만 실제로 확인
+    rows = index["rows"]
+    return sorted(row for row in candidates if query in rows[row])
+
+def similar(index: dict, keyword: str, limit: int = 5) -> list[int]:
+    """오타가 있어도 찾을 수 있도록 1·2-그램 겹침 비율이 높은 순으로 행 번호를 반환한다(3글자 이상 검색어)."""
+    query = normalize(keyword)
+    if len(query) < 3:
+        return []
+    grams = _grams(query)
+    scores: dict[int, int] = {}
+    postings = index["postings"]
+    for gram in grams:
+        for row in postings.get(gram, ()):
+            scores[row] = scores.get(row, 0) + 1
+    min_hits = math.ceil(len(grams) * config.SEARCH_SIMILAR_MIN_OVERLAP)
+    ranked = [(-hits, row) for row, hits in scores.items() if hits >= min_hits]
+    return [row for _, row in heapq.nsmallest(limit, ranked)]
@@ -0,0 +1,223 @@
+"""일정/지출/후보 테이블을 SQLite에 저장하는 저장소 백엔드(config.STORAGE_BACKEND = "sqlite").
+
+DataFrame 컬럼(한글)과 SQL 컬럼(영문)을 매핑해 문자열 원본은 그대로 보존하고,
+정렬·필터·집계에 쓰는 날짜/시각/금액은 별도의 타입 컬럼으로 함께 저장한다.
+타입 컬럼 값은 호출자(data_manager)가 계산해 넘긴다.
+"""
+
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Optional
+
+import pandas as pd
+
+import config
+from utils import journal
+
+# 테이블별 (DataFrame 컬럼, SQL 컬럼) 매핑 — 모두 TEXT로 원문 보존
+TEXT_COLUMNS = {
+    "schedule": [
+        ("날짜", "date_label"), ("시간", "time_label"), ("구분", "category"), ("내용", "content"),
+        ("장소", "place"), ("지도검색어", "map_query"), ("이동수단", "transport"),
+    ],
+    "expenses": [
+        ("날짜", "date_label"), ("항목", "item"), ("금액", "amount_text"), ("결제자", "payer"), ("메모", "memo"),
+        ("통화", "currency"),
+    ],
+    "candidates": [
+        ("id", "candidate_id"), ("장소명", "name"), ("지도링크", "link"),
+    ],
+}
+
+# 테이블별 타입 컬럼(정렬/필터/집계용)
+TYPED_COLUMNS = {
+    "schedule": [("date_key", "TEXT"), ("time_minutes", "INTEGER")],
+    "expenses": [("date_key", "TEXT"), ("amount", "REAL")],
+    "candidates": [],
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedule (
+    id INTEGER PRIMARY KEY,
+    date_label TEXT NOT NULL DEFAULT '', time_label TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '', content TEXT NOT NULL DEFAULT '',
+    place TEXT NOT NULL DEFAULT '', map_query TEXT NOT NULL DEFAULT '',
+    transport TEXT NOT NULL DEFAULT '',
+    date_key TEXT, time_minutes INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_schedule_date_time ON schedule(date_key, time_minutes);
+CREATE INDEX IF NOT EXISTS idx_schedule_date_label ON schedule(date_label);
+
+CREATE TABLE IF NOT EXISTS expenses (
+    id INTEGER PRIMARY KEY,
+    date_label TEXT NOT NULL DEFAULT '', item TEXT NOT NULL DEFAULT '',
+    amount_text TEXT NOT NULL DEFAULT '', payer TEXT NOT NULL DEFAULT '',
+    memo TEXT NOT NULL DEFAULT '', currency TEXT NOT NULL DEFAULT '',
+    date_key TEXT, amount REAL
+);
+CREATE INDEX IF NOT EXISTS idx_expenses_payer ON expenses(payer);
+CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date_key);
+
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    candidate_id TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL DEFAULT '', link TEXT NOT NULL DEFAULT ''
+);
+
+-- CSV 가져오기(마이그레이션)를 마친 테이블 기록
+CREATE TABLE IF NOT EXISTS migrations (
+    table_name TEXT PRIMARY KEY,
+    migrated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_write_lock = threading.Lock()
+_schema_ready = False
+
+def connect() -> sqlite3.Connection:
+    """DB에 연결하고, 최초 1회 스키마를 만든다."""
+    global _schema_ready
+    conn = sqlite3.connect(config.SQLITE_DB_PATH, timeout=10)
+    if not _schema_ready:
+        conn.executescript(_SCHEMA)
+        _upgrade_schema(conn)
+        _schema_ready = True
+    return conn
+
+# 이전 버전 DB에 나중에 추가된 컬럼: (테이블, 컬럼, 정의)
+_ADDED_COLUMNS = [
+    ("candidates", "candidate_id", "TEXT NOT NULL DEFAULT ''"),
+    ("expenses", "currency", "TEXT NOT NULL DEFAULT ''"),
+]
+
+def _upgrade_schema(conn: sqlite3.Connection) -> None:
+    """이전 버전 DB에 없는 컬럼/인덱스를 추가한다."""
+    with conn:
+        for table, column, definition in _ADDED_COLUMNS:
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_candidates_candidate_id ON candidates(candidate_id)")
+
+def df_columns(table: str) -> list[str]:
+    """테이블의 DataFrame 컬럼(한글) 목록."""
+    return [df_col for df_col, _ in TEXT_COLUMNS[table]]
+
+def is_migrated(table: str) -> bool:
+    """CSV 가져오기를 이미 마친 테이블인지 확인한다."""
+    with closing(connect()) as conn:
+        return conn.execute("SELECT 1 FROM migrations WHERE table_name = ?", (table,)).fetchone() is not None
+
+def mark_migrated(table: str) -> None:
+    """테이블의 CSV 가져오기를 마쳤다고 기록한다(다음부터는 CSV를 다시 읽지 않는다)."""
+    with closing(connect()) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO migrations (table_name) VALUES (?)", (table,))
+
+def load(table: str) -> pd.DataFrame:
+    """테이블 전체를 저장 순서(id)대로 DataFrame(한글 컬럼, 문자열)으로 읽는다."""
+    sql_cols = ", ".join(sql_col for _, sql_col in TEXT_COLUMNS[table])
+    with closing(connect()) as conn:
+        rows = conn.execute(f"SELECT {sql_cols} FROM {table} ORDER BY id").fetchall()
+    return pd.DataFrame(rows, columns=df_columns(table), dtype=object)
+
+def save(table: str, current: pd.DataFrame, new: pd.DataFrame, typed: Optional[pd.DataFrame] = None) -> None:
+    """바뀐 행만 UPSERT하고 줄어든 행은 DELETE한다(한 트랜잭션).
+
+    current/new는 정규화된 문자열 프레임, typed는 new와 같은 행 순서의 타입 컬럼 프레임.
+    행 위치는 id 순서로 정해지며, 개별 삭제로 id 사이가 비어 있어도 된다.
+    """
+    cols = df_columns(table)
+    ops = journal.diff_ops(current, new, cols)
+    if not ops:
+        return
+    typed_cols = [name for name, _ in TYPED_COLUMNS[table]]
+    sql_cols = ["id"] + [sql_col for _, sql_col in TEXT_COLUMNS[table]] + typed_cols
+    placeholders = ", ".join("?" for _ in sql_cols)
+    with _write_lock, closing(connect()) as conn, conn:
+        # 행 위치 → 실제 id
+        row_ids = [row[0] for row in conn.execute(f"SELECT id FROM {table} ORDER BY id")]
+        next_id = row_ids[-1] + 1 if row_ids else 0
+        upserts = []
+        truncate_at = None
+        for op in ops:
+            if op["op"] == "truncate":
+                truncate_at = op["rows"]
+                continue
+            idx = op["row"]
+            row_id = row_ids[idx] if idx < len(row_ids) else next_id + idx - len(row_ids)
+            typed_values = [_sql_value(typed.iloc[idx][name]) for name in typed_cols] if typed_cols else []
+            upserts.append([row_id] + [op["values"][col] for col in cols] + typed_values)
+        if upserts:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(sql_cols)}) VALUES ({placeholders})", upserts
+            )
+        if truncate_at is not None and truncate_at < len(row_ids):
+            conn.execute(f"DELETE FROM {table} WHERE id >= ?", (row_ids[truncate_at],))
+
+def insert_candidate(values: dict) -> None:
+    """후보 하나를 목록 끝에 추가한다(DataFrame 컬럼 기준 값)."""
+    sql_cols = [sql_col for _, sql_col in TEXT_COLUMNS["candidates"]]
+    row = [values.get(df_col, "") for df_col, _ in TEXT_COLUMNS["candidates"]]
+    with _write_lock, closing(connect()) as conn, conn:
+        conn.execute(
+            f"INSERT INTO candidates (id, {', '.join(sql_cols)}) "
+            f"VALUES ((SELECT COALESCE(MAX(id), -1) + 1 FROM candidates), {', '.join('?' for _ in sql_cols)})",
+            row,
+        )
+
+def delete_candidate(candidate_id: str) -> None:
+    """ID로 후보 하나를 삭제한다."""
+    with _write_lock, closing(connect()) as conn, conn:
+        conn.execute("DELETE FROM candidates WHERE candidate_id = ?", (candidate_id,))
+
+def _sql_value(value):
+    """pandas 결측값을 NULL로, numpy 스칼라를 파이썬 값으로 바꾼다."""
+    if value is None or pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+def _escape_like(keyword: str) -> str:
+    """LIKE 패턴 특수문자(%, _)를 문자 그대로 검색하도록 이스케이프한다."""
+    return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def query_schedule(dates: Optional[list[str]] = None, keyword: str = "") -> pd.DataFrame:
+    """날짜/키워드 조건을 SQL로 걸러 일치하는 일정만 저장 순서(id)대로 읽는다(키워드는 문자 그대로 부분 일치, ASCII 대소문자만 무시).
+
+    CSV 백엔드와 같은 순서로 돌려주며, 날짜/시각 정렬은 화면(enrich_schedule 이후)에서 한다.
+    """
+    sql_cols = ", ".join(sql_col for _, sql_col in TEXT_COLUMNS["schedule"])
+    where, params = [], []
+    if dates:
+        where.append(f"date_label IN ({', '.join('?' for _ in dates)})")
+        params.extend(dates)
+    if keyword:
+        pattern = f"%{_escape_like(keyword)}%"
+        where.append(
+            "(content LIKE ? ESCAPE '\\' OR place LIKE ? ESCAPE '\\' "
+            "OR category LIKE ? ESCAPE '\\' OR map_query LIKE ? ESCAPE '\\')"
+        )
+        params.extend([pattern] * 4)
+    sql = f"SELECT {sql_cols} FROM schedule"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY id"
+    with closing(connect()) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return pd.DataFrame(rows, columns=df_columns("schedule"), dtype=object)
+
+def schedule_dates() -> list[str]:
+    """일정의 날짜 라벨을 날짜 순으로(파싱할 수 없는 라벨은 뒤로) 반환한다.
+
+    CSV 백엔드와 같게, 같은 날짜의 라벨끼리는 가장 이른 시각의 일정(시각이 없으면 뒤, 같으면 저장 순서) 순이다.
+    """
+    with closing(connect()) as conn:
+        rows = conn.execute(
+            "SELECT date_label FROM ("
+            " SELECT date_label, date_key, time_minutes, id, ROW_NUMBER() OVER ("
+            "  PARTITION BY date_label ORDER BY time_minutes IS NULL, time_minutes, id) AS label_rank"
+            " FROM schedule WHERE date_label != '') "
+            "WHERE label_rank = 1 "
+            "ORDER BY date_key IS NULL, date_key, time_minutes IS NULL, time_minutes, id"
+        ).fetchall()
+    return [row[0] for row in rows]
@@ -0,0 +1,158 @@
+"""디스크에 보관하는 프로세스 전역 캐시(만료되면 이전 값을 쓰면서 백그라운드에서 갱신)와 원자적 파일 저장 유틸리티.
+
+캐시 상태는 create()가 만드는 dict 하나에 담기며, 모든 세션이 공유한다.
+- TTL 안이면 메모리 값을 그대로 쓰고, 만료됐으면 이전 값을 즉시 반환하면서 백그라운드에서 갱신한다.
+- 값이 전혀 없을 때만 응답을 기다린다. 실패하면 retry_sec 동안 같은 작업을 다시 시도하지 않는다.
+- 기본 갱신 외의 추가 작업(예: 과거 기간 환율)도 이름을 붙여 같은 방식으로 백그라운드에서 실행할 수 있다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# 기본 갱신 작업 이름
+LATEST = "latest"
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """쓰는 쪽(프로세스/스레드)마다 다른 임시 파일에 쓴 뒤 교체해 저장한다(동시 저장/중단 시 손상 방지). 실패하면 OSError."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """JSON으로 직렬화해 원자적으로 저장한다."""
+    write_text_atomic(path, json.dumps(payload, ensure_ascii=False))
+
+def create(
+    name: str,
+    path: Callable[[], Path],
+    data_key: str,
+    fetch: Callable[[], Any],
+    ttl_sec: float,
+    retry_sec: float,
+    merge: Optional[Callable[[Any, Any], Any]] = None,
+) -> dict:
+    """캐시 상태를 만든다.
+
+    path: 디스크 저장 경로를 돌려주는 함수(config 경로를 바꿔도 따라가도록 호출할 때마다 읽음).
+    data_key: 저장 파일에서 값을 담는 키. fetch: 최신 값을 받아오는 함수(실패하면 예외).
+    merge: (기존 값 또는 None, 받아온 값) → 새 값. 없으면 받아온 값으로 교체한다.
+    """
+    return {
+        "name": name, "path": path, "data_key": data_key, "fetch": fetch, "merge": merge,
+        "ttl_sec": ttl_sec, "retry_sec": retry_sec, "lock": threading.Lock(),
+        "data": None, "fetched_at": 0.0, "loaded": False, "running": set(), "failed_at": {},
+    }
+
+def reset(cache: dict) -> None:
+    """메모리 값, 실패 기록과 디스크 파일을 지운다(벤치마크/테스트용)."""
+    with cache["lock"]:
+        cache.update(data=None, fetched_at=0.0, loaded=False, failed_at={})
+    cache["path"]().unlink(missing_ok=True)
+
+def _load_persisted(cache: dict) -> None:
+    """프로세스 시작 후 처음 한 번 디스크에 남은 값을 메모리에 올린다."""
+    with cache["lock"]:
+        if cache["loaded"]:
+            return
+        cache["loaded"] = True
+        try:
+            payload = json.loads(cache["path"]().read_text(encoding="utf-8"))
+            data, fetched_at = payload[cache["data_key"]], float(payload["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if cache["data"] is None:
+            cache["data"], cache["fetched_at"] = data, fetched_at
+
+def _apply(cache: dict, fetched: Any, touch: bool) -> None:
+    """받아온 값을 합쳐 메모리와 디스크에 반영한다(touch면 수집 시각도 갱신)."""
+    with cache["lock"]:
+        merge = cache["merge"]
+        cache["data"] = merge(cache["data"], fetched) if merge else fetched
+        if touch:
+            cache["fetched_at"] = time.time()
+        payload = {"fetched_at": cache["fetched_at"], cache["data_key"]: cache["data"]}
+        try:
+            # 잠금 안에서 써야 늦게 끝난 작업이 더 최신 값을 덮어쓰지 않는다
+            write_json_atomic(cache["path"](), payload)
+        except OSError as e:
+            print(f"{cache['name']} cache write error: {e}")
+
+def _backing_off(cache: dict, job: str) -> bool:
+    """호출자가 잠금 보유."""
+    return time.time() - cache["failed_at"].get(job, 0.0) < cache["retry_sec"]
+
+def _run(cache: dict, job: str, fetch: Callable[[], Any]) -> bool:
+    """작업 하나를 실행해 반영한다. 실패하면 실패 시각을 기록하고 False."""
+    try:
+        fetched = fetch()
+    except Exception as e:
+        print(f"{cache['name']} API error ({job}): {e}")
+        with cache["lock"]:
+            cache["failed_at"][job] = time.time()
+        return False
+    _apply(cache, fetched, touch=job == LATEST)
+    with cache["lock"]:
+        cache["failed_at"].pop(job, None)
+    return True
+
+def refresh_in_background(cache: dict, job: str = LATEST, fetch: Optional[Callable[[], Any]] = None) -> bool:
+    """작업을 백그라운드 스레드로 실행한다. 이미 실행 중이거나 실패 후 대기 중이면 건너뛴다.
+
+    job이 LATEST가 아니면 fetch를 함께 주며, 이때는 수집 시각(TTL)을 갱신하지 않는다.
+    작업이 실행 중이면 True를 반환한다.
+    """
+    with cache["lock"]:
+        if job in cache["running"]:
+            return True
+        if _backing_off(cache, job):
+            return False
+        cache["running"].add(job)
+
+    def _worker():
+        try:
+            _run(cache, job, fetch or cache["fetch"])
+        finally:
+            with cache["lock"]:
+                cache["running"].discard(job)
+
+    threading.Thread(target=_worker, name=f"{cache['name']}-refresh", daemon=True).start()
+    return True
+
+def get(cache: dict) -> Optional[Any]:
+    """캐시 값을 반환한다. 받아온 적이 없고 받아올 수도 없으면 None.
+
+    만료됐으면 이전 값을 바로 반환하면서 백그라운드에서 갱신하고, 값이 전혀 없을 때만 응답을 기다린다.
+    """
+    if not cache["loaded"]:
+        _load_persisted(cache)
+    with cache["lock"]:
+        data, fetched_at = cache["data"], cache["fetched_at"]
+        backing_off = _backing_off(cache, LATEST)
+
+    if data is not None:
+        if time.time() - fetched_at >= cache["ttl_sec"]:
+            refresh_in_background(cache)
+        return data
+    if backing_off or not _run(cache, LATEST, cache["fetch"]):
+        return None
+    with cache["lock"]:
+        return cache["data"]
+
+def age_sec(cache: dict) -> Optional[float]:
+    """현재 값이 수집된 지 몇 초 지났는지 반환한다(없으면 None)."""
+    with cache["lock"]:
+        if cache["data"] is None:
+            return None
+        return time.time() - cache["fetched_at"]
+
+def running_jobs(cache: dict) -> set[str]:
+    """백그라운드에서 실행 중인 작업 이름들."""
+    with cache["lock"]:
+        return set(cache["running"])
@@ -0,0 +1,51 @@
+"""앨범 사진의 축소 썸네일을 한 번만 만들어 디스크에 보관하는 유틸리티."""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image, ImageOps, features
+
+import config
+
+# WebP 인코더가 없는 Pillow 빌드에서는 JPEG로 대체
+THUMBNAIL_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+THUMBNAIL_SUFFIX = ".webp" if THUMBNAIL_FORMAT == "WEBP" else ".jpg"
+
+def thumbnail_path_for(photo_path: Path) -> Path:
+    """원본 파일명/수정 시각/크기로 썸네일 경로를 정한다(원본이 바뀌면 경로도 바뀜)."""
+    stat = photo_path.stat()
+    fingerprint = f"{photo_path.name}|{stat.st_mtime_ns}|{stat.st_size}|{config.THUMBNAIL_MAX_PX}"
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:24]
+    return config.THUMBNAIL_DIR / f"{digest}{THUMBNAIL_SUFFIX}"
+
+def create_thumbnail(photo_path: Path, thumb_path: Path) -> None:
+    """원본을 긴 변 THUMBNAIL_MAX_PX 이하로 줄여 썸네일 파일로 저장한다."""
+    size = (config.THUMBNAIL_MAX_PX, config.THUMBNAIL_MAX_PX)
+    with Image.open(photo_path) as image:
+        # JPEG는 디코딩 단계에서 미리 축소해 메모리/시간을 크게 줄인다
+        image.draft("RGB", size)
+        # 휴대폰 사진의 EXIF 회전 정보를 픽셀에 반영
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(size)
+        if image.mode not in ("RGB", "RGBA") or THUMBNAIL_FORMAT == "JPEG":
+            image = image.convert("RGB")
+        # 쓰는 쪽(프로세스/스레드)마다 다른 임시 파일에 저장 후 교체(동시 생성/중단 시 손상 방지)
+        tmp_path = thumb_path.with_name(f"{thumb_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            image.save(tmp_path, format=THUMBNAIL_FORMAT, quality=80)
+            tmp_path.replace(thumb_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+def get_thumbnail(photo_path: Path) -> Optional[Path]:
+    """썸네일 경로를 반환한다. 없으면 만들고, 원본이 손상되었으면 None."""
+    try:
+        thumb_path = thumbnail_path_for(photo_path)
+        if not thumb_path.exists():
+            create_thumbnail(photo_path, thumb_path)
+        return thumb_path
+    except Exception:
+        return None
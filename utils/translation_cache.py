@@ -0,0 +1,129 @@
+"""번역 결과를 SQLite에 저장해 같은 문장의 재번역 호출을 줄이는 캐시."""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import closing
+from typing import Any, Callable, Optional
+
+import config
+
+# 프로세스 전역 적중/미스 카운터(모든 세션이 공유)
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+_schema_ready = False
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFKC)와 공백 정리로 사소한 입력 차이를 흡수한다."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+def make_key(text: str, source_lang: str, target_lang: str, model: str, prompt_version: str) -> str:
+    """정규화된 원문 + 언어 쌍 + 모델 + 프롬프트 버전으로 캐시 키를 만든다."""
+    payload = json.dumps(
+        [normalize_text(text), source_lang, target_lang, model, prompt_version],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _connect() -> sqlite3.Connection:
+    """캐시 DB에 연결하고, 최초 1회(또는 DB가 지워진 뒤) 폴더와 테이블을 만든다."""
+    global _schema_ready
+    if not _schema_ready:
+        config.TRANSLATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(config.TRANSLATION_CACHE_PATH, timeout=5)
+    if not _schema_ready:
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " key TEXT PRIMARY KEY,"
+                " source_lang TEXT NOT NULL,"
+                " target_lang TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " source_text TEXT NOT NULL,"
+                " translation TEXT NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used)")
+        _schema_ready = True
+    return conn
+
+def _run(work: Callable[[sqlite3.Connection], Any]) -> Any:
+    """연결 하나로 work를 트랜잭션 안에서 실행한다.
+
+    실행 중 캐시 폴더나 DB 파일이 지워져 테이블이 없으면(OperationalError) 스키마를 다시 만들고 한 번 더 시도한다.
+    """
+    global _schema_ready
+    try:
+        with closing(_connect()) as conn, conn:
+            return work(conn)
+    except sqlite3.OperationalError:
+        _schema_ready = False
+        with closing(_connect()) as conn, conn:
+            return work(conn)
+
+def _bump(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+def get(key: str) -> Optional[str]:
+    """캐시된 번역을 반환하고 최근 사용 시각을 갱신한다. 없으면 None."""
+    def lookup(conn: sqlite3.Connection):
+        row = conn.execute("SELECT translation FROM translations WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            conn.execute("UPDATE translations SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row
+
+    try:
+        row = _run(lookup)
+    except sqlite3.Error:
+        # 캐시 장애는 번역 기능을 막지 않도록 미스로 처리
+        row = None
+    _bump("hits" if row is not None else "misses")
+    return row[0] if row is not None else None
+
+def put(key: str, text: str, source_lang: str, target_lang: str, model: str, translation: str) -> None:
+    """번역 결과를 저장하고, 최대 개수를 넘으면 가장 오래 안 쓴 항목부터 지운다."""
+    def store(conn: sqlite3.Connection) -> int:
+        conn.execute(
+            "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, source_lang, target_lang, model, normalize_text(text), translation, time.time()),
+        )
+        overflow = conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - config.TRANSLATION_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM translations WHERE key IN "
+                "(SELECT key FROM translations ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+        return max(overflow, 0)
+
+    try:
+        evicted = _run(store)
+    except sqlite3.Error:
+        return
+    if evicted:
+        _bump("evictions", evicted)
+
+def get_stats() -> dict:
+    """적중/미스/축출 횟수와 현재 저장된 항목 수를 반환한다."""
+    with _stats_lock:
+        stats = dict(_stats)
+    try:
+        stats["entries"] = _run(lambda conn: conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0])
+    except sqlite3.Error:
+        stats["entries"] = 0
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+def clear() -> None:
+    """저장된 번역을 모두 지운다(카운터는 유지)."""
+    try:
+        _run(lambda conn: conn.execute("DELETE FROM translations"))
+    except sqlite3.Error:
+        pass
@@ -2,34 +2,57 @@
 
 import requests
 from datetime import datetime, timedelta
+from typing import Optional
+import config
+from utils import metrics, swr_cache
 
 # 후쿠오카 좌표(고정)
 LAT = 33.5902
 LON = 130.4017
 
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+FORECAST_PARAMS = {
+    "latitude": LAT,
+    "longitude": LON,
+    # 필요한 일별 지표만 요청(코드/최저·최고기온/강수확률)
+    "daily": ["weather_code", "temperature_2m_max", "temperature_2m_min", "precipitation_probability_max"],
+    "timezone": "Asia/Tokyo",
+    "forecast_days": 7
+}
+
+# 연결을 재사용하는 공유 HTTP 세션
+_session = requests.Session()
+
+@metrics.timed("weather.open_meteo")
+def _fetch_forecast() -> dict:
+    """Open-Meteo API를 호출해 일별 예보를 반환한다. 실패하면 예외를 던진다."""
+    # 타임아웃을 두어 네트워크 지연으로 인한 멈춤 방지
+    response = _session.get(FORECAST_URL, params=FORECAST_PARAMS, timeout=config.WEATHER_TIMEOUT_SEC)
+    response.raise_for_status()
+    # daily 키에 날짜별 리스트가 담겨 있음
+    daily = response.json().get("daily", {})
+    if not daily:
+        raise ValueError("응답에 daily 데이터가 없습니다.")
+    return daily
+
+# 프로세스 전역 예보 캐시(모든 세션이 공유, 오프라인 대비용으로 디스크에도 보관)
+_cache = swr_cache.create(
+    "Weather", lambda: config.WEATHER_CACHE_PATH, "daily", _fetch_forecast,
+    ttl_sec=config.WEATHER_CACHE_TTL_SEC, retry_sec=config.WEATHER_RETRY_SEC,
+)
+
+@metrics.timed()
 def get_weather_forecast():
-    """Open-Meteo API에서 후쿠오카 7일 예보를 가져온다."""
-    url = "https://api.open-meteo.com/v1/forecast"
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        # 필요한 일별 지표만 요청(코드/최저·최고기온/강수확률)
-        "daily": ["weather_code", "temperature_2m_max", "temperature_2m_min", "precipitation_probability_max"],
-        "timezone": "Asia/Tokyo",
-        "forecast_days": 7
-    }
-    
-    try:
-        # 타임아웃을 두어 네트워크 지연으로 인한 멈춤 방지
-        response = requests.get(url, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        # daily 키에 날짜별 리스트가 담겨 있음
-        return data.get("daily", {})
-    except Exception as e:
-        # API 호출 실패 시 None 반환(상위에서 안내 메시지 표시)
-        print(f"Weather API Error: {e}")
-        return None
+    """후쿠오카 7일 예보를 반환한다(받아오지 못하면 None, 상위에서 안내 메시지 표시).
+
+    TTL 안이면 캐시를 그대로 쓰고, 만료됐으면 이전 예보를 즉시 반환하면서 백그라운드에서 갱신한다.
+    캐시가 전혀 없을 때만 API 응답을 기다리며, 실패하면 WEATHER_RETRY_SEC 동안 다시 호출하지 않는다.
+    """
+    return swr_cache.get(_cache)
+
+def get_forecast_age_sec() -> Optional[float]:
+    """현재 캐시된 예보가 수집된 지 몇 초 지났는지 반환한다(없으면 None)."""
+    return swr_cache.age_sec(_cache)
 
 def get_weather_icon(code: int) -> str:
     """WMO 날씨 코드를 이모지 아이콘으로 매핑한다."""
@@ -2,7 +2,7 @@
 
 import streamlit as st
 import pandas as pd
-from utils import data_manager
+from utils import data_manager, exchange_rates, expense_analytics
 import config
 
 def render():
@@ -14,10 +14,12 @@ def render():
     
     with tab_calc:
         st.subheader("엔화(JPY) ↔ 원화(KRW) 간편 계산")
-        st.caption("고정 환율: 100엔 = 900원 (대략적 계산용)")
-        
-        # 단순 계산용 고정 환율(1 JPY = 9 KRW)
-        EXCHANGE_RATE = 9.0  # 100 JPY = 900 KRW -> 1 JPY = 9 KRW
+        # 캐시된 최신 환율(1 JPY당 원화). 받아온 적이 없으면 고정 환율
+        EXCHANGE_RATE, rate_date = exchange_rates.latest_rate("JPY")
+        if rate_date:
+            st.caption(f"기준 환율: 100엔 = {EXCHANGE_RATE * 100:,.0f}원 ({rate_date} 기준)")
+        else:
+            st.caption(f"고정 환율: 100엔 = {EXCHANGE_RATE * 100:,.0f}원 (환율 정보를 받아오지 못해 대략적으로 계산)")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -43,7 +45,8 @@ def render():
             use_container_width=True,
             key="expenses_editor",
             column_config={
-                "금액": st.column_config.NumberColumn("금액", format="%d")
+                "금액": st.column_config.NumberColumn("금액", format="%d"),
+                "통화": st.column_config.SelectboxColumn("통화", options=config.CURRENCIES),
             }
         )
         
@@ -53,6 +56,47 @@ def render():
             st.toast("저장되었습니다.")
             
         if not edited_df.empty:
-            # 금액 합계를 계산해 요약 표시
-            total_spent = pd.to_numeric(edited_df["금액"], errors='coerce').sum()
-            st.metric(label="총 지출 합계", value=f"{total_spent:,.0f}")
+            # 통화가 섞여 있어도 날짜별 환율로 한 번에 원화/엔화 환산
+            converted = exchange_rates.convert_ledger(edited_df)
+            col_krw, col_jpy = st.columns(2)
+            col_krw.metric(label="원화 환산 합계", value=f"{converted['KRW'].sum():,.0f}원")
+            col_jpy.metric(label="엔화 환산 합계", value=f"{converted['JPY'].sum():,.0f}엔")
+            if exchange_rates.fetching_history():
+                st.caption("지출 날짜의 환율을 받는 중이에요. 지금은 최신 환율로 계산했고, 잠시 후 새로고침하면 날짜별 환율로 다시 계산돼요.")
+            # 집계에는 환산된 숫자 금액(원화)을 그대로 넘기고, 문자열 서식은 표시할 때만 적용
+            render_summary(converted.assign(금액=converted["KRW"]))
+
+def render_summary(df: pd.DataFrame):
+    """지출 합계, 일별/항목별/결제자별 집계와 정산 계획을 표시한다(금액은 원화 환산 기준)."""
+    # 바뀐 행만 반영해 집계를 갱신(편집할 때마다 전체를 다시 계산하지 않음)
+    summary = expense_analytics.summarize(df)
+    col_total, col_count = st.columns(2)
+    col_total.metric(label="총 지출 합계 (원화)", value=f"{summary['total']:,.0f}원")
+    col_count.metric(label="지출 건수", value=f"{summary['count']:,}")
+    if summary["invalid"]:
+        st.caption(f"금액이나 통화를 읽을 수 없는 {summary['invalid']}건은 합계에서 제외했어요.")
+
+    tab_daily, tab_category, tab_payer = st.tabs(["📅 일별", "🏷️ 항목별", "🙋 결제자별"])
+    for tab, key in ((tab_daily, "daily"), (tab_category, "category"), (tab_payer, "payer")):
+        with tab:
+            frame = summary[key]
+            if frame.empty:
+                st.info("집계할 지출이 없어요.")
+                continue
+            st.bar_chart(frame["합계"])
+            st.dataframe(frame.style.format({"합계": "{:,.0f}"}), use_container_width=True)
+
+    # 인원별 정산: 똑같이 나눠 낼 때 최소 횟수의 송금 목록
+    st.markdown("##### 🤝 정산하기")
+    payers = [name for name in summary["payer"].index if name]
+    members_text = st.text_input("정산 인원 (쉼표로 구분)", value=", ".join(payers), key="settlement_members")
+    members = [name.strip() for name in members_text.split(",") if name.strip()]
+    table, transfers = expense_analytics.settlement_plan(summary["payer"]["합계"], members)
+    if table.empty:
+        st.info("결제자가 입력된 지출이 없어요.")
+        return
+    st.dataframe(table.style.format("{:,.0f}"), use_container_width=True)
+    if not transfers:
+        st.success("모두 똑같이 냈어요. 정산할 금액이 없어요! 🎉")
+    for transfer in transfers:
+        st.markdown(f"- **{transfer['보내는 사람']}** → **{transfer['받는 사람']}**: {transfer['금액']:,}원")
@@ -1,9 +1,8 @@
 """추억 앨범 화면: 사진 업로드 및 갤러리 표시."""
 
 import streamlit as st
-import os
-from PIL import Image
 import config
+from utils import photo_index, thumbnails
 
 def render():
     """사진 업로드와 갤러리 표시를 담당한다."""
@@ -23,26 +22,53 @@ def render():
                 save_path = config.PHOTOS_DIR / up_file.name
                 with open(save_path, "wb") as f:
                     f.write(up_file.getbuffer())
+            # 저장한 사진만 인덱스에 반영(같은 이름으로 덮어쓰면 폴더 수정 시각이 바뀌지 않아 직접 알려야 함)
+            photo_index.register_photos(up_file.name for up_file in uploaded_files)
             st.success("사진이 저장되었습니다!")
             st.rerun()
             
-    # 저장된 사진 목록 로드
-    photos = [f for f in os.listdir(config.PHOTOS_DIR) if f.lower().endswith(('png', 'jpg', 'jpeg'))]
+    # 저장된 사진 목록은 디스크 인덱스에서 로드(폴더가 바뀐 경우에만 재검사)
+    photos = [p["name"] for p in photo_index.list_photos()]
     
     if not photos:
         st.info("아직 사진이 없어요. 첫 번째 사진을 올려보세요!")
         return
         
-    # 간단한 3열 갤러리 그리드
+    # 원본 보기를 요청한 사진만 전체 해상도로 표시
+    full_photo = st.session_state.get("gallery_full_photo")
+    if full_photo in photos:
+        st.image(str(config.PHOTOS_DIR / full_photo), use_column_width=True, caption=full_photo)
+        if st.button("닫기", key="gallery_full_close"):
+            st.session_state.pop("gallery_full_photo", None)
+            st.rerun()
+        st.divider()
+
+    # 한 페이지 분량만 렌더링해 앨범이 커져도 탭 로딩 비용을 일정하게 유지
+    page_size = config.GALLERY_PAGE_SIZE
+    page_count = (len(photos) + page_size - 1) // page_size
+    page = 1
+    if page_count > 1:
+        # 첫 페이지로 시작하고, 사진이 줄어 현재 페이지가 범위를 벗어나면 마지막 페이지로 보정
+        # (기본값은 세션 상태로만 정한다: 위젯 value와 함께 쓰면 Streamlit이 경고)
+        st.session_state["gallery_page"] = min(st.session_state.get("gallery_page", 1), page_count)
+        col_page, col_info = st.columns([1, 3])
+        with col_page:
+            page = st.number_input("페이지", min_value=1, max_value=page_count, step=1, key="gallery_page")
+        with col_info:
+            st.caption(f"총 {len(photos)}장 · {page_count}페이지")
+    page_photos = photos[(page - 1) * page_size : page * page_size]
+
+    # 간단한 3열 갤러리 그리드(축소 썸네일만 전송)
     cols = st.columns(3)
-    for idx, photo_name in enumerate(photos):
+    for idx, photo_name in enumerate(page_photos):
         col = cols[idx % 3]
-        img_path = config.PHOTOS_DIR / photo_name
-        try:
-            # 이미지 로드 후 해당 컬럼에 표시
-            image = Image.open(img_path)
-            with col:
-                st.image(image, use_column_width=True, caption=photo_name)
-        except Exception:
+        # 썸네일은 최초 1회만 생성되고 이후에는 캐시 파일을 사용
+        thumb_path = thumbnails.get_thumbnail(config.PHOTOS_DIR / photo_name)
+        if thumb_path is None:
             # 손상된 파일은 조용히 무시
-            pass
+            continue
+        with col:
+            st.image(str(thumb_path), use_column_width=True, caption=photo_name)
+            if st.button("원본 보기", key=f"gallery_full_{photo_name}"):
+                st.session_state["gallery_full_photo"] = photo_name
+                st.rerun()
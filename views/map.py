@@ -3,9 +3,183 @@
 import streamlit as st
 import pandas as pd
 from urllib.parse import quote_plus
-from utils import data_manager
+from utils import data_manager, geocode
 import config
 
+def render_place_search():
+    """검색어로 장소 하나를 찾아 Google 지도 링크와 Embed 지도를 보여준다."""
+    place = st.text_input("장소 검색", placeholder="예: 하카타역", key="map_input_schedule")
+    if not place:
+        return
+    # 입력한 장소를 Google Maps 검색 링크로 제공
+    st.markdown(f"📍 **{place}** ([Google 지도에서 열기]({data_manager.make_maps_search_link(place)}))")
+
+    # API 키가 있으면 Embed 지도까지 표시
+    if config.GOOGLE_MAPS_API_KEY:
+        embed_url = (
+            "https://www.google.com/maps/embed/v1/place"
+            f"?key={config.GOOGLE_MAPS_API_KEY}&q={quote_plus(place)}"
+        )
+        st.components.v1.iframe(embed_url, height=450)
+    else:
+        st.warning("Google Maps API 키가 설정되지 않아 지도를 표시할 수 없습니다.")
+
+def render_schedule_map():
+    """일정의 모든 장소를 날짜별 색상 마커로 한 지도에 표시한다."""
+    st.caption("일정에 포함된 장소를 지도에서 확인하세요. 마커 색은 날짜를 나타냅니다.")
+
+    # 일정 데이터에서 (날짜, 지도 검색어) 목록을 추출
+    df = data_manager.load_schedule()
+    places = pd.DataFrame({"날짜": df["날짜"], "장소": data_manager.map_queries(df).str.strip()})
+    places = places[places["장소"] != ""].drop_duplicates()
+    if places.empty:
+        st.info("일정에 지도에 표시할 장소가 없어요.")
+    else:
+        render_places(places)
+
+    # 일정에 없는 장소는 직접 검색
+    with st.expander("🔎 직접 검색", expanded=places.empty):
+        render_place_search()
+
+def render_places(places: pd.DataFrame):
+    """좌표표에 있는 장소를 바로 지도에 그리고, 새 장소는 백그라운드에서 조회한다."""
+    # 렌더링 중에는 네트워크를 기다리지 않는다(data/geocode.json에 있는 좌표만 사용)
+    queries = places["장소"].unique().tolist()
+    coords = geocode.lookup(queries, resolve_missing=False)
+    resolving = geocode.resolve_in_background([query for query, latlon in coords.items() if latlon is None])
+    located_coords = {query: latlon for query, latlon in coords.items() if latlon}
+    places = places.copy()
+    places["lat"] = places["장소"].map({query: latlon[0] for query, latlon in located_coords.items()})
+    places["lon"] = places["장소"].map({query: latlon[1] for query, latlon in located_coords.items()})
+
+    # 날짜 순서대로 색상을 배정(색이 모자라면 순환)
+    days = [day for day in data_manager.schedule_dates() if day in set(places["날짜"])]
+    day_colors = {day: config.MAP_DAY_COLORS[i % len(config.MAP_DAY_COLORS)] for i, day in enumerate(days)}
+    places["color"] = places["날짜"].map(day_colors).fillna("#888888")
+
+    located = places.dropna(subset=["lat", "lon"])
+    if located.empty:
+        st.info("아직 좌표를 찾은 장소가 없어요.")
+    else:
+        # 모든 장소를 한 번에 그리는 클라이언트 측 지도(장소를 바꿔도 다시 불러오지 않음)
+        st.map(located, latitude="lat", longitude="lon", color="color", size=60)
+        st.markdown(
+            " ".join(
+                f"<span style='color:{color}'>●</span> {day}" for day, color in day_colors.items()
+            ),
+            unsafe_allow_html=True,
+        )
+
+    missing = places[places["lat"].isna()]
+    if not missing.empty:
+        if resolving:
+            col_msg, col_btn = st.columns([4, 1])
+            with col_msg:
+                st.caption(f"새 장소 {missing['장소'].nunique()}곳의 좌표를 찾는 중이에요. 잠시 후 새로고침하면 지도에 추가됩니다.")
+            with col_btn:
+                if st.button("🔄 새로고침", key="map_refresh"):
+                    st.rerun()
+        else:
+            if not config.GOOGLE_MAPS_API_KEY:
+                st.warning(
+                    "Google Maps API 키가 없어 새 장소의 좌표를 찾을 수 없습니다. "
+                    "data/geocode.json에 \"장소\": [위도, 경도] 형식으로 직접 추가할 수 있어요."
+                )
+            st.caption(f"좌표를 찾지 못한 장소 {missing['장소'].nunique()}곳은 아래 목록의 링크로 확인하세요.")
+
+    # 장소 목록과 Google 지도 검색 링크
+    with st.expander("📋 장소 목록", expanded=located.empty):
+        table = places[["날짜", "장소"]].copy()
+        table["지도"] = table["장소"].map(data_manager.make_maps_search_link)
+        st.dataframe(
+            table,
+            use_container_width=True,
+            column_config={"지도": st.column_config.LinkColumn("지도", display_text="지도 열기")},
+            hide_index=True,
+        )
+
+def render_candidates():
+    """후보 장소 저장소(요기오때?)를 페이지 단위로 렌더링한다."""
+    st.subheader("가볼까 고민되는 장소 저장소")
+    st.caption("지도 링크를 넣어두면 나중에 보기 편해요!")
+
+    # 후보 리스트 로드(저장 후에는 st.rerun으로 다시 그려지므로 한 번만 읽음)
+    candidates_df = data_manager.load_candidates()
+
+    # 신규 후보 입력 폼
+    with st.form("add_candidate_form", clear_on_submit=True):
+        col_in1, col_in2, col_btn = st.columns([2, 3, 1])
+        with col_in1:
+            new_place = st.text_input("장소명", placeholder="예: 다이소 키체인")
+        with col_in2:
+            new_link = st.text_input("지도 링크 (URL)", placeholder="구글맵 링크 붙여넣기")
+        with col_btn:
+            submitted = st.form_submit_button("추가")
+
+        if submitted and new_place:
+            # 신규 후보 한 곳만 추가(기존 목록은 다시 쓰지 않음)
+            data_manager.add_candidate(new_place, new_link)
+            st.rerun()
+
+    st.divider()
+
+    # 후보 리스트 표시
+    if candidates_df.empty:
+        st.info("아직 저장된 장소가 없어요. 위에 추가해보세요!")
+        return
+
+    st.markdown("##### 📌 후보 리스트")
+
+    # 페이지 단위로 나눠 현재 페이지의 후보만 그린다
+    page_size = config.CANDIDATE_PAGE_SIZE
+    page_count = (len(candidates_df) + page_size - 1) // page_size
+    page = 1
+    if page_count > 1:
+        # 첫 페이지로 시작하고, 후보가 줄어 현재 페이지가 범위를 벗어나면 마지막 페이지로 보정
+        # (기본값은 세션 상태로만 정한다: 위젯 value와 함께 쓰면 Streamlit이 경고)
+        st.session_state["candidate_page"] = min(st.session_state.get("candidate_page", 1), page_count)
+        col_page, col_info = st.columns([1, 3])
+        with col_page:
+            page = st.number_input("페이지", min_value=1, max_value=page_count, step=1, key="candidate_page")
+        with col_info:
+            st.caption(f"총 {len(candidates_df)}곳 · {page_count}페이지")
+    page_df = candidates_df.iloc[(page - 1) * page_size : page * page_size]
+
+    # 지도 미리보기는 사용자가 연 후보 하나에만 만든다
+    open_id = st.session_state.get("candidate_open")
+    for _, row in page_df.iterrows():
+        c_id = row["id"]
+        c_place = row["장소명"]
+        c_link = row["지도링크"]
+
+        col_name, col_map, col_del = st.columns([4, 1, 1])
+        with col_name:
+            if c_link:
+                st.markdown(f"📍 **{c_place}** · [지도 바로가기]({c_link})")
+            else:
+                st.markdown(f"📍 **{c_place}** · <span class='muted'>링크 없음</span>", unsafe_allow_html=True)
+        with col_map:
+            is_open = open_id == c_id
+            if st.button("닫기" if is_open else "지도 보기", key=f"map_{c_id}"):
+                st.session_state["candidate_open"] = None if is_open else c_id
+                st.rerun()
+        with col_del:
+            # 삭제 버튼(고정 ID로 해당 장소만 제거)
+            if st.button("삭제", key=f"del_{c_id}"):
+                data_manager.delete_candidate(c_id)
+                st.rerun()
+
+        if open_id == c_id:
+            # 장소명으로 Embed 지도 미리보기 표시
+            if config.GOOGLE_MAPS_API_KEY:
+                embed_url = (
+                    "https://www.google.com/maps/embed/v1/place"
+                    f"?key={config.GOOGLE_MAPS_API_KEY}&q={quote_plus(c_place)}"
+                )
+                st.components.v1.iframe(embed_url, height=300)
+            else:
+                st.warning("Google Maps API 키가 설정되지 않아 지도를 표시할 수 없습니다.")
+
 def render():
     """지도 화면을 렌더링한다(일정 장소/후보 장소 탭)."""
     st.markdown("<div class='section-title'>🗺️ 지도 탐색</div>", unsafe_allow_html=True)
@@ -15,106 +189,8 @@ def render():
     
     # --- 일정에 포함된 장소 보기 ---
     with tab_schedule:
-        st.caption("일정에 포함된 장소를 지도에서 확인하세요.")
-        
-        # 일정 데이터에서 지도 검색어 후보를 추출
-        df = data_manager.load_schedule()
-        unique_places = sorted({
-            q for q in df.apply(
-                lambda row: data_manager.choose_map_query(
-                    row.get("내용", ""), 
-                    row.get("장소", ""), 
-                    row.get("지도검색어", "")
-                ),
-                axis=1
-            ) if q.strip()
-        })
-        
-        # 좌측: 장소 선택, 우측: 지도 표시
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            choice = st.radio("장소 선택", ["직접 입력"] + unique_places, key="map_choice_schedule")
-            
-            if choice == "직접 입력":
-                place = st.text_input("장소 검색", placeholder="예: 하카타역", key="map_input_schedule")
-            else:
-                place = choice
-                
-        with col2:
-            if not place:
-                st.info("장소를 선택하면 지도가 표시됩니다.")
-            else:
-                # 선택한 장소를 Google Maps 검색 링크로 제공
-                map_link = f"https://www.google.com/maps/search/?api=1&query={quote_plus(place)}"
-                st.markdown(f"📍 **{place}** ([Google 지도에서 열기]({map_link}))")
-
-                # API 키가 있으면 Embed 지도까지 표시
-                if config.GOOGLE_MAPS_API_KEY:
-                    embed_url = (
-                        "https://www.google.com/maps/embed/v1/place"
-                        f"?key={config.GOOGLE_MAPS_API_KEY}&q={quote_plus(place)}"
-                    )
-                    st.components.v1.iframe(embed_url, height=450)
-                else:
-                    st.warning("Google Maps API 키가 설정되지 않아 지도를 표시할 수 없습니다.")
+        render_schedule_map()
 
     # --- 후보 장소 저장소(요기오때?) ---
     with tab_candidate:
-        st.subheader("가볼까 고민되는 장소 저장소")
-        st.caption("지도 링크를 넣어두면 나중에 보기 편해요!")
-        
-        # 후보 리스트 로드
-        candidates_df = data_manager.load_candidates()
-        
-        # 신규 후보 입력 폼
-        with st.form("add_candidate_form", clear_on_submit=True):
-            col_in1, col_in2, col_btn = st.columns([2, 3, 1])
-            with col_in1:
-                new_place = st.text_input("장소명", placeholder="예: 다이소 키체인")
-            with col_in2:
-                new_link = st.text_input("지도 링크 (URL)", placeholder="구글맵 링크 붙여넣기")
-            with col_btn:
-                submitted = st.form_submit_button("추가")
-                
-            if submitted and new_place:
-                # 신규 후보를 추가하고 저장
-                new_row = pd.DataFrame([{"장소명": new_place, "지도링크": new_link}])
-                updated_df = pd.concat([candidates_df, new_row], ignore_index=True)
-                data_manager.save_candidates(updated_df)
-                st.rerun()
-
-        st.divider()
-        
-        # 후보 리스트 표시
-        if candidates_df.empty:
-            st.info("아직 저장된 장소가 없어요. 위에 추가해보세요!")
-        else:
-            # 저장 직후 최신 데이터 반영을 위해 재로드
-            candidates_df = data_manager.load_candidates()
-            
-            st.markdown("##### 📌 후보 리스트")
-            for idx, row in candidates_df.iterrows():
-                c_place = row["장소명"]
-                c_link = row["지도링크"]
-                
-                with st.expander(f"📍 {c_place}", expanded=False):
-                    if c_link:
-                         st.markdown(f"🔗 [지도 바로가기]({c_link})")
-                    else:
-                        st.caption("링크 없음")
-                        
-                    # 삭제 버튼(행 단위로 제거)
-                    if st.button("삭제", key=f"del_{idx}"):
-                        candidates_df = candidates_df.drop(idx)
-                        data_manager.save_candidates(candidates_df)
-                        st.rerun()
-                    
-                    # 장소명이 있으면 Embed 지도로 미리보기 표시
-                    query_for_map = c_place
-                    if config.GOOGLE_MAPS_API_KEY:
-                         embed_url = (
-                            "https://www.google.com/maps/embed/v1/place"
-                            f"?key={config.GOOGLE_MAPS_API_KEY}&q={quote_plus(query_for_map)}"
-                        )
-                         st.components.v1.iframe(embed_url, height=300)
+        render_candidates()
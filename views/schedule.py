@@ -3,42 +3,14 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date
-from urllib.parse import quote_plus
 
 from utils import data_manager
 import config
 
-def make_maps_search_link(place: str) -> str:
-    """장소명을 Google Maps 검색 링크로 변환한다."""
-    if not place:
-        return ""
-    return f"https://www.google.com/maps/search/?api=1&query={quote_plus(place)}"
-
-def render_schedule(view: pd.DataFrame):
+def render_schedule():
     """일정을 카드/표 형태로 보여준다."""
-    # 정렬과 표시를 위해 날짜/시간 파생 컬럼을 추가
-    view["_date"] = view["날짜"].apply(data_manager.parse_date)
-    view["_time"] = view["시간"].apply(data_manager.parse_time)
-    view["시간대"] = view["_time"].apply(data_manager.time_bucket)
-    
-    # 지도 링크 생성 로직
-    def make_link(row):
-        query = data_manager.choose_map_query(
-            row.get("내용", ""), 
-            row.get("장소", ""), 
-            row.get("지도검색어", "")
-        )
-        if query:
-            return make_maps_search_link(query)
-        return ""
-        
-    # 각 일정 행에 지도 링크 컬럼 추가
-    view["지도"] = view.apply(make_link, axis=1)
-    view = view.sort_values(by=["_date", "_time"], na_position="last")
-    
-    # 날짜 필터 옵션 생성
-    date_options = [d for d in view["날짜"].dropna().unique().tolist() if d]
-    date_options = sorted(date_options, key=lambda v: data_manager.parse_date(v) or date.max)
+    # 날짜 필터 옵션(날짜 순 정렬된 라벨)
+    date_options = data_manager.schedule_dates()
 
     # 필터/보기 옵션 UI
     col1, col2, col3 = st.columns([2, 2, 2])
@@ -55,22 +27,22 @@ def render_schedule(view: pd.DataFrame):
     with col3:
         view_mode = st.selectbox("보기 방식", ["카드", "표"], index=0)
 
-    # 선택한 필터 조건으로 데이터 추리기
-    filtered = view.copy()
-    if selected_dates:
-        filtered = filtered[filtered["날짜"].isin(selected_dates)]
-        
-    if keyword:
-        mask = (
-            filtered["내용"].str.contains(keyword, case=False, na=False)
-            | filtered["장소"].str.contains(keyword, case=False, na=False)
-            | filtered["구분"].str.contains(keyword, case=False, na=False)
-            | filtered["지도검색어"].str.contains(keyword, case=False, na=False)
-        )
-        filtered = filtered[mask]
+    # 선택한 필터 조건으로 데이터 추리기(SQLite 백엔드는 SQL에서 필터링)
+    filtered = data_manager.query_schedule(selected_dates, keyword)
+    if not filtered.empty:
+        # 표시/정렬용 날짜·시간·시간대·지도 링크 파생 컬럼은 걸러진 행에만 계산
+        filtered = data_manager.enrich_schedule(filtered)
+        filtered = filtered.sort_values(by=["_date", "_time"], na_position="last")
 
     if filtered.empty:
         st.info("조건에 맞는 일정이 없어요. 날짜/키워드를 조정해보세요.")
+        if keyword:
+            # 오타 등으로 일치하는 일정이 없으면 비슷한 일정을 제안
+            similar = data_manager.similar_schedule(keyword, selected_dates)
+            if not similar.empty:
+                st.caption("혹시 이 일정을 찾으셨나요?")
+                for _, row in similar.iterrows():
+                    st.markdown(f"- {row['날짜']} {row['시간']} · {row['내용']}")
         return
 
     if view_mode == "표":
@@ -145,7 +117,7 @@ def render():
     tab1, tab2 = st.tabs(["보기", "편집"])
     
     with tab1:
-        render_schedule(df)
+        render_schedule()
         
     with tab2:
         render_editor(df)
@@ -1,6 +1,7 @@
 """AI 통역사 화면: 텍스트/음성 번역과 사진 OCR 번역을 제공한다."""
 
 import streamlit as st
+import hashlib
 import time
 from utils import openai_helper
 try:
@@ -43,6 +44,8 @@ def render():
                     start_prompt="● 녹음",
                     stop_prompt="■ 정지",
                     just_once=True,
+                    # 무음 지점에서 나눠 전사할 수 있도록 PCM WAV로 받는다(업로드 전에 16kHz 모노로 줄임)
+                    format="wav",
                     key="mic_recorder",
                 )
             
@@ -50,46 +53,92 @@ def render():
                 # 동일한 오디오가 중복 처리되지 않도록 체크
                 if audio["bytes"] != st.session_state.get("last_mic_audio"):
                     st.session_state["last_mic_audio"] = audio["bytes"]
-                    st.audio(audio["bytes"], format="audio/wav")
-                    
-                    # 자동 텍스트 변환(전사)
-                    lang_code = "ko" if source_lang == "Korean" else "ja"
-                    with st.spinner("음성을 텍스트로 변환 중..."):
-                        transcript = openai_helper.transcribe_audio(
-                            audio["bytes"], 
-                            config.OPENAI_API_KEY, 
-                            config.OPENAI_STT_MODEL, 
-                            lang_code
-                        )
-                        st.session_state["source_text_input"] = transcript
-                        st.rerun()
+                    st.audio(audio["bytes"], format=f"audio/{audio.get('format') or 'wav'}")
+                    # 아래 입력 칸 자리에서 전사하면서 결과를 채운다
+                    st.session_state["pending_audio"] = (audio["bytes"], "ko" if source_lang == "Korean" else "ja")
+
+            # 직전 녹음의 업로드 크기 절감/소요 시간(전사 중에는 진행 상황)
+            with col_status:
+                status_box = st.empty()
+                report = st.session_state.get("audio_prep_report")
+                if report:
+                    status_box.caption(format_audio_report(report))
+                    if report.get("error"):
+                        st.warning(f"일부 조각은 전사하지 못했어요: {report['error']}")
 
         st.divider()
 
         # 텍스트 입력 및 번역 결과 영역
         col1, col2 = st.columns(2)
         with col1:
+            source_box = st.empty()
+            pending = st.session_state.pop("pending_audio", None)
+            if pending:
+                # 자동 텍스트 변환(전사): 긴 녹음은 조각으로 나눠 동시에 전사하고, 앞 조각부터 끝나는 대로 입력 칸을 채운다
+                audio_bytes, lang_code = pending
+                transcript, report = "", None
+                try:
+                    for transcript, report in openai_helper.stream_transcribe_recording(
+                        audio_bytes,
+                        config.OPENAI_API_KEY,
+                        config.OPENAI_STT_MODEL,
+                        lang_code,
+                    ):
+                        status_box.caption(f"🎧 음성을 텍스트로 변환 중... ({report['done']}/{report['chunks']})")
+                        source_box.text_area(
+                            "입력", transcript + " ▌", height=150, disabled=True, key=f"source_text_partial_{report['done']}"
+                        )
+                except Exception as e:
+                    # 녹음을 읽지 못하는 등 예기치 못한 오류: 녹음은 보관해 두고 다시 시도할 수 있게 한다
+                    status_box.empty()
+                    st.session_state["failed_audio"] = (pending, str(e))
+                else:
+                    st.session_state.pop("failed_audio", None)
+                    st.session_state["source_text_input"] = transcript
+                    st.session_state["audio_prep_report"] = report
+                    st.rerun()
+            failed = st.session_state.get("failed_audio")
+            if failed:
+                st.error(f"음성을 텍스트로 바꾸지 못했어요: {failed[1]}")
+                if st.button("다시 변환", key="retry_audio"):
+                    st.session_state["pending_audio"] = st.session_state.pop("failed_audio")[0]
+                    st.rerun()
             # 세션 상태 값을 기본값으로 사용해 음성 전사 결과를 반영
-            source_text = st.text_area("입력", height=150, key="source_text_input", placeholder="번역할 내용을 입력하세요.")
+            source_text = source_box.text_area("입력", height=150, key="source_text_input", placeholder="번역할 내용을 입력하세요.")
         with col2:
-            st.text_area(
+            # 스트리밍 중 부분 결과로 교체할 수 있도록 자리표시자에 렌더링
+            result_box = st.empty()
+            result_box.text_area(
                 "결과", 
                 height=150, 
                 value=st.session_state.get("trans_result", ""),
                 disabled=True
             )
+            # 번역 중 오류 안내 자리
+            result_error = st.empty()
 
         col_act1, col_act2 = st.columns([1, 3])
         with col_act1:
             if st.button("번역하기", type="primary", use_container_width=True):
                 if source_text:
-                    with st.spinner("번역 중..."):
-                        # 텍스트 번역 호출
-                        res = openai_helper.translate_text(
+                    # 텍스트 번역을 스트리밍으로 호출해 도착하는 대로 결과 칸을 채운다
+                    partial = ""
+                    try:
+                        for piece in openai_helper.stream_translate_text(
                             source_text, source_lang, target_lang, 
                             config.OPENAI_API_KEY, config.OPENAI_TRANSLATE_MODEL
+                        ):
+                            partial += piece
+                            result_box.text(partial + " ▌")
+                    except Exception as e:
+                        # 중간에 끊기면 부분 결과 대신 이전 결과를 다시 보여주고 오류를 알린다
+                        result_box.text_area(
+                            "결과", height=150, value=st.session_state.get("trans_result", ""), disabled=True,
+                            key="trans_result_restored",
                         )
-                        st.session_state["trans_result"] = res
+                        result_error.error(f"번역 실패: {e}")
+                    else:
+                        st.session_state["trans_result"] = partial.strip()
                         st.rerun()
 
         with col_act2:
@@ -103,34 +152,64 @@ def render():
                     )
                     # 오디오 데이터(또는 텍스트)의 해시값을 사용하여 오디오 플레이어 강제 리렌더링
                     # 모바일 호환성 및 재생 오류 방지를 위해 사용
-                    import hashlib
                     audio_hash = hashlib.md5(target_text.encode()).hexdigest()
                     st.audio(audio_data, format="audio/mp3", autoplay=True, key=f"tts_{audio_hash}")
 
     # --- 사진 OCR 번역 ---
     with tab_photo:
-        img_file = st.file_uploader("이미지 업로드", type=["png", "jpg", "jpeg"])
-        if img_file:
-            st.image(img_file, width=300)
+        img_files = st.file_uploader("이미지 업로드", type=["png", "jpg", "jpeg"], accept_multiple_files=True)
+        if img_files:
+            st.image([f.getvalue() for f in img_files], width=150, caption=[f.name for f in img_files])
             if st.button("이미지에서 텍스트 추출 및 번역"):
-                with st.spinner("분석 중..."):
-                    # 이미지에서 텍스트 추출(OCR)
-                    extracted = openai_helper.extract_text_from_image(
-                        img_file.getvalue(), img_file.type, 
-                        config.OPENAI_API_KEY, config.OPENAI_OCR_MODEL
-                    )
-                    if extracted:
-                        # 추출된 텍스트를 한국어로 번역
-                        translated = openai_helper.translate_text(
-                            extracted, "Any", "Korean", # 이해를 돕기 위해 항상 한국어로 번역
-                            config.OPENAI_API_KEY, config.OPENAI_TRANSLATE_MODEL
-                        )
-                        st.session_state["ocr_extracted"] = extracted
-                        st.session_state["ocr_translated"] = translated
-                        st.rerun()
+                # 이미지별 결과 자리를 먼저 만들고, 끝나는 순서대로 채운다
+                slots = [st.empty() for _ in img_files]
+                for slot, f in zip(slots, img_files):
+                    slot.info(f"⏳ {f.name} 분석 중...")
+                results = [None] * len(img_files)
+                # OCR + 한국어 번역을 제한된 스레드 풀에서 동시에 실행(이해를 돕기 위해 항상 한국어로 번역)
+                for idx, result in openai_helper.extract_and_translate_images(
+                    [(f.getvalue(), f.type) for f in img_files],
+                    config.OPENAI_API_KEY, config.OPENAI_OCR_MODEL, config.OPENAI_TRANSLATE_MODEL,
+                    max_workers=config.OCR_MAX_CONCURRENCY,
+                ):
+                    results[idx] = {"name": img_files[idx].name, **result}
+                    with slots[idx].container():
+                        render_ocr_result(idx, results[idx])
+                st.session_state["ocr_results"] = results
+                st.rerun()
         
         # 이전 추출 결과가 있으면 하단에 표시
-        if st.session_state.get("ocr_extracted"):
-            c1, c2 = st.columns(2)
-            c1.text_area("추출된 텍스트", st.session_state["ocr_extracted"], height=200)
-            c2.text_area("번역 결과 (한국어)", st.session_state["ocr_translated"], height=200)
+        for idx, result in enumerate(st.session_state.get("ocr_results", [])):
+            render_ocr_result(idx, result)
+
+def format_audio_report(report: dict) -> str:
+    """음성 전처리 보고서를 한 줄 요약으로 만든다."""
+    original, upload = report["original_bytes"], report["upload_bytes"]
+    text = f"업로드 {original / 1024:,.0f}KB → {upload / 1024:,.0f}KB"
+    if original:
+        text += f" (-{(1 - upload / original) * 100:.0f}%)"
+    if report.get("original_sec") is not None and report.get("upload_sec") is not None:
+        text += f" · 길이 {report['original_sec']:.1f}초 → {report['upload_sec']:.1f}초"
+    if report.get("chunks", 1) > 1:
+        text += f" · {report['chunks']}개 조각 동시 전사"
+    text += f" · 전처리 {report['prep_ms']:,.0f}ms"
+    if "stt_ms" in report:
+        text += f" · 전사 {report['stt_ms'] / 1000:.1f}초"
+    if report.get("errors"):
+        text += f" · ⚠️ {report['errors']}개 조각 전사 실패"
+    return text
+
+def render_ocr_result(idx: int, result: dict):
+    """이미지 1장의 추출/번역 결과를 표시한다."""
+    st.markdown(f"##### 📄 {result['name']}")
+    if result.get("error"):
+        st.error(f"분석 실패: {result['error']}")
+        return
+    if not result["extracted"]:
+        st.caption("이미지에서 텍스트를 찾지 못했어요.")
+        return
+    # 결과 내용이 바뀌면 위젯도 새로 그려지도록 내용 해시를 키에 포함
+    digest = hashlib.md5((result["extracted"] + result["translated"]).encode()).hexdigest()
+    c1, c2 = st.columns(2)
+    c1.text_area("추출된 텍스트", result["extracted"], height=200, key=f"ocr_extracted_{idx}_{digest}")
+    c2.text_area("번역 결과 (한국어)", result["translated"], height=200, key=f"ocr_translated_{idx}_{digest}")
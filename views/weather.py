@@ -58,5 +58,7 @@ def render():
                 unsafe_allow_html=True
             )
             
-    # 데이터 출처 안내
-    st.caption("제공: Open-Meteo API (후쿠오카 기준)")
+    # 데이터 출처 및 갱신 시점 안내
+    age_sec = weather.get_forecast_age_sec()
+    updated = f" · {int(age_sec // 60)}분 전 업데이트" if age_sec is not None else ""
+    st.caption(f"제공: Open-Meteo API (후쿠오카 기준){updated}")